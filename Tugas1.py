@@ -1,266 +1,186 @@
-from selenium import webdriver #Digunkaan untuk mengendalikan browser 
-from selenium.webdriver.chrome.service import Service #Untuk mengatur service chromedriver
 from selenium.webdriver.common.by import By #Untuk memilih elemen berdasarkan tipe tertentu
 from selenium.webdriver.support.ui import Select #Untuk mengelola elemen <select> di HTML
-import pandas as pd #Untuk mengelola data dalam format tabel (DataFrame)
 from pathlib import Path    #Untuk mengelola path file dan direktori
-import re #Untuk operasi berbasis pola pada string
-import time  #Untuk menambahkan jeda waktu dalam eksekusi kode
 from selenium.webdriver.support.ui import WebDriverWait #Untuk menunggu kondisi tertentu sebelum melanjutkan eksekusi
 from selenium.webdriver.support import expected_conditions as EC #Untuk mendefinisikan kondisi yang diharapkan saat menunggu
 from selenium.webdriver.common.keys import Keys #Untuk mengirimkan input keyboard ke elemen web
-
-def normalisasi_jurusan(text):
-    """
-    Normalisasi teks jurusan/pendidikan agar lebih seragam.
-
-    Fungsi ini mengubah input jurusan mentah (misalnya dari data pegawai) 
-    ke format baku dengan beberapa aturan standarisasi dan mapping tertentu.
-
-    Aturan normalisasi:
-    - Mengubah huruf menjadi kapital, lalu menghapus spasi berlebih di awal/akhir.
-    - Mengganti pola tertentu, misalnya:
-        * "S-1 " → "SARJANA-"
-        * "D-3 " → "DIPLOMA III-"
-        * "SMA PAKET C " → "SMA-Paket C"
-    - Jika ditemukan kata kunci dalam `mapping`, maka diganti sesuai nilai normalisasi.
-      Contoh mapping:
-        * "SLTA SEDERAJAT" → "Sekolah Menengah Atas"
-
-    Args:
-        text (str): Teks jurusan mentah.
-
-    Returns:
-        str: Hasil normalisasi jurusan dengan format baku.
-             Jika tidak ada yang cocok, mengembalikan teks dengan kapitalisasi awal kata.
-
-    Examples:
-        >>> normalisasi_jurusan("S-1 TEKNIK INFORMATIKA")
-        'Sarjana-Teknik Informatika'
-        >>> normalisasi_jurusan("D-3 Akuntansi")
-        'DIPLOMA III-Akuntansi'
-        >>> normalisasi_jurusan("SLTA SEDERAJAT")
-        'Sekolah Menengah Atas'
-        >>> normalisasi_jurusan("SMA PAKET C IPS")
-        'Sma-Paket C Ips'
-
-
-        
-    """
-    text = text.upper().strip()
-
-    # Standarisasi awal
-    text = text.replace("S-1 ", "SARJANA-")
-    text = text.replace("D-3 ", "DIPLOMA III-")
-    text = text.replace("SMA PAKET C ", "SMA-Paket C")
-
-    # Mapping kata kunci ke hasil normalisasi
-    mapping = {
-        #"SMA PAKET C": "SMA-Paket C",
-        "SLTA SEDERAJAT": "SEKOLAH MENENGAH ATAS",
-        #"STM": "SEKOLAH TEKNIK MENENGAH"
-    }
-
-    for keyword, hasil in mapping.items():
-        if keyword in text:
-            return hasil.title()
-
-    return text.title()  # fallback kalau tidak cocok apa-apa
-
-def normalisasi_jabatan(jabatan_raw):
-    """
-    Normalisasi teks jabatan mentah menjadi kategori baku.
-
-    Fungsi ini mengubah input jabatan mentah menjadi salah satu dari empat kategori:
-    - "Pelaksana" jika mengandung kata "pelaksana"
-    - "Fungsional" jika mengandung kata "fungsional"
-    - "Struktural" jika mengandung kata "struktural"
-    - "lainnya" jika tidak cocok dengan tiga kategori di atas
-
-    Args:
-        jabatan_raw (str): Teks jabatan mentah (misalnya dari input spreadsheet atau database).
-
-    Returns:
-        str: Kategori jabatan yang sudah dinormalisasi.
-             Nilai yang mungkin: "Pelaksana", "Fungsional", "Struktural", atau "lainnya".
-
-    Examples:
-        >>> normalisasi_jabatan("Jabatan Pelaksana")
-        'Pelaksana'
-        >>> normalisasi_jabatan("Tenaga Fungsional Umum")
-        'Fungsional'
-        >>> normalisasi_jabatan("Pejabat Struktural X")
-        'Struktural'
-        >>> normalisasi_jabatan("Magang")
-        'lainnya'
-    """
-    jabat = str(jabatan_raw).lower()
-    if "pelaksana" in jabat:
-        return "Pelaksana"
-    if "fungsional" in jabat:
-        return "Fungsional"
-    if "struktural" in jabat:
-        return "Struktural"
-    return "lainnya"
-
-def ekstrak_sub_unit_unit_skpd(unor):
-    """
-    Ekstrak sub-unit, unit, dan SKPD dari field 'Unor' yang berupa teks lurus.
-
-    Format input umumnya: "<Sub Unit> <Unit Keyword> <SKPD Keyword> <Nama SKPD>". 
-    Fungsi mencari kata kunci SKPD ("Dinas", "Satuan", "Kecamatan") dari akhir teks,
-    lalu mencari kata kunci unit ("Bidang", "Seksi", "UPT") di bagian sebelum SKPD.
-
-    Args:
-        unor: String yang berisi nama Unor (contoh: "Bidang Pelayanan Perizinan dan Nonperizinan Ekonomi, 
-        Pariwisata dan Sosial Budaya Dinas Tenaga Kerja, Penanaman Modal dan Pelayanan Terpadu Satu Pintu").
-
-    Returns:
-        tuple yang berisi (sub_unit, unit_kerja, skpd).
-        - sub_unit: teks sebelum kata kunci unit (atau seluruh sisa bila tidak ditemukan)
-        - unit_kerja: bagian yang dimulai dari kata kunci unit (atau "" jika tidak ada)
-        - skpd: bagian yang dimulai dari kata kunci SKPD (atau "" jika tidak ada)
-
-    Examples:
-        >>> ekstrak_sub_unit_unit_skpd("Seksi Pengendalian Bidang Ketertiban Dinas X")
-        ("Seksi Pengendalian", "Bidang Ketertiban", "Dinas X")
-    """
-    unor = str(unor)
-
-    skpd_keywords = ["Dinas", "Satuan", "Kecamatan"]
-    unit_keywords = ["Bidang", "SMPN", "Kelurahan", "Seksi", "Sekretariat", "UPT", "Puskesmas"]
-
-    skpd1 = ""
-    unit_kerja1 = ""
-    sub_unit1 = ""
-
-    skpd_idx = -1
-    unit_idx = -1
-
-    # Cari SKPD paling akhir (karena biasanya di akhir kalimat)
-    for kata in skpd_keywords:
-        idx = unor.rfind(kata)
-        if idx != -1:
-            skpd_idx = idx
-            skpd1 = unor[idx:].strip()
-            break
-
-    # Sisa sebelum SKPD → cari unit kerja
-    sisa = unor[:skpd_idx].strip() if skpd_idx != -1 else unor
-
-    for kata in unit_keywords:
-        idx = sisa.find(kata)
-        if idx != -1:
-            unit_idx = idx
-            unit_kerja1 = sisa[idx:].strip()
-            break
-
-    # Sisanya jadi sub unit
-    if unit_idx != -1:
-        sub_unit1 = sisa[:unit_idx].strip()
-    else:
-        sub_unit1 = sisa
-
-    return sub_unit1, unit_kerja1, skpd1
-   
-# === 1. Setup Driver & Login SIMPEG ===
+import tunggu #Untuk menunggu kondisi DOM/AJAX nyata sebagai pengganti jeda tetap
+from rencana_kerja import alirkan_rencana #Untuk membaca & menormalisasi Excel/CSV/Parquet bertahap
+from indeks_spmt import bangun_indeks_spmt, cari_file_spmt, periksa_kode_spmt #Untuk indeks file SPMT sekali scan
+from browser import buat_driver_simpeg, login_simpeg, URL_SIMPEG #Untuk membuat driver & login SIMPEG
+from cache_pegawai import CachePegawai, PegawaiTidakDitemukan, cari_pegawai_id, periksa_halaman_pegawai #Untuk cache persisten NIP → pegawai_id
+from pool_browser import jalankan_pool #Untuk membagi baris ke beberapa sesi Chrome paralel
+from kirim_http import PengirimForm, BERHASIL, BELUM_TERKIRIM, TIDAK_PASTI #Untuk mengirim form lewat HTTP langsung memakai cookie Selenium
+from katalog_opsi import KatalogOpsi #Untuk mencocokkan opsi Select2/<select> secara lokal dari cache
+from jurnal import Jurnal #Untuk mencatat langkah yang selesai agar run bisa dilanjutkan setelah crash
+from laporan import LaporanBerkala, susun_laporan, tulis_excel #Untuk laporan kegagalan per NIP yang ditulis berkala
+from validasi_rencana import periksa_rencana #Untuk menolak baris bermasalah sebelum browser dibuka
+from pencatat import pasang_pencatat, konteks, per_item, LEVEL #Untuk log terminal asinkron (teks + JSONL per NIP/langkah)
+from profil_waktu import fase, simpan_laporan #Untuk mengukur durasi tiap fase & laporan p50/p95 akhir run
+import hitung_perintah #Untuk menghitung perintah WebDriver per jenis, fase, dan NIP (opsional)
+import penjaga_sesi #Untuk deteksi sesi login habis, login ulang, dan ulangi langkah
+import pengendali_host #Untuk konkurensi adaptif & circuit breaker bersama per host
+from datetime import datetime #Untuk timestamp nama file laporan performa
+import argparse #Untuk membaca opsi baris perintah (misalnya jumlah worker)
+import sys #Untuk keluar setelah mode --validasi
+
+parser = argparse.ArgumentParser(description="Input pendidikan & jabatan pegawai ke SIMPEG")
+parser.add_argument("--workers", type=int, default=1, help="jumlah sesi Chrome paralel (default 1)")
+parser.add_argument("--cepat", action="store_true", help="profil cepat: headless, eager, blokir gambar/font/analitik")
+parser.add_argument("--http", action="store_true", help="kirim form pendidikan & jabatan lewat HTTP, browser sebagai cadangan")
+parser.add_argument("--blokir-css", action="store_true", help="ikut blokir CSS pada profil cepat")
+parser.add_argument("--resume", action="store_true", help="lanjutkan dari jurnal run sebelumnya, lewati langkah yang sudah selesai")
+parser.add_argument("--validasi", action="store_true", help="hanya validasi offline semua baris (dry-run): tulis laporan validasi lalu keluar tanpa membuka browser")
+parser.add_argument("--excel", default="data_jabatan.xlsx", help="file data jabatan .xlsx/.csv/.parquet (default data_jabatan.xlsx)")
+parser.add_argument("--folder-spmt", default=r"D:\PKL\code\cek_dan_perbaiki\TTE SPMT PPPK T1 2024", help="folder file PDF SPMT (TTE)")
+parser.add_argument("--hitung-perintah", type=int, nargs="?", const=hitung_perintah.AMBANG_PERINTAH, metavar="AMBANG",
+                    help=f"hitung perintah WebDriver per jenis/fase/NIP, tandai NIP di atas AMBANG perintah (default {hitung_perintah.AMBANG_PERINTAH})")
+parser.add_argument("--log-level", choices=list(LEVEL), default="INFO", help="level minimum output konsol; file log selalu lengkap (default INFO)")
+args = parser.parse_args()
+
+# Output print ditulis thread latar belakang ke konsol dan log_terminal/ (teks + JSONL)
+log_path = pasang_pencatat("terminal_tugas1", level_konsol=args.log_level)
+print(f"📋 Logging terminal aktif. Semua output disimpan di: {log_path}")
+if args.hitung_perintah:
+    hitung_perintah.aktifkan(args.hitung_perintah)
+
+# === 1. Susun Rencana Kerja dari Excel ===
 # Bagian ini bertugas untuk:
-# - Menginisialisasi ChromeDriver dengan path lokal
-# - Membuka halaman login SIMPEG Kota Malang
-# - Mengisi username & password lalu menekan tombol login
-# - Menunggu halaman beralih setelah login
-# Catatan: ganti "the-username" dan "the-password" dengan kredensial asli.
-
-service = Service("C:/Users/HP/Downloads/chromedriver-win64/chromedriver-win64/chromedriver.exe")
-driver = webdriver.Chrome(service=service)
-
-driver.get("https://simpeg.malangkota.go.id/login")
-driver.find_element(By.ID, "username").send_keys("the-username")
-driver.find_element(By.ID, "password").send_keys("the-password")
-driver.find_element(By.CLASS_NAME, "btn-primary").click()
-time.sleep(2)
-wait = WebDriverWait(driver, 10)
-
-# === 2. Baca File Excel ===
+# - Membaca data pegawai dari file "data_jabatan.xlsx" (atau --excel, boleh .csv/.parquet)
+#   secara bertahap per potongan baris, tanpa memuat seluruh workbook ke memori
+# - Mem-parsing kolom tanggal dan menormalisasi jurusan, jabatan, serta Unor per potongan
+# - Menyimpan rencana ke "<nama excel>.rencana.json" agar run berikutnya tidak parsing ulang
+# - Menentukan path folder tempat file SK (dokumen TTE) disimpan lalu mengindeksnya
+#   sekali (kode SPMT → file) agar bisa dicocokkan dengan data pegawai
+# - Memvalidasi setiap baris secara offline (validasi_rencana: format data, No.SPMT &
+#   file SPMT, urai Unor, opsi dropdown dari katalog_opsi.json) selagi baris dibaca;
+#   baris yang ditolak tidak dikirim ke browser dan dicatat di laporan validasi
+# - Worker sudah mulai memproses baris pertama sebelum file selesai dibaca
+# Dengan --validasi hanya tahap ini yang dijalankan (dry-run), browser tidak dibuka.
+folder_path = Path(args.folder_spmt)
+indeks_spmt = bangun_indeks_spmt(folder_path, "indeks_spmt.json")
+katalog = KatalogOpsi()
+urutan_nip, spmt_ganda, ditolak = [], [], []
+
+# Field Select2 nama jabatan per jenis jabatan
+FIELD_JABATAN = {
+    "Fungsional": "jab_fungsional",
+    "Pelaksana": "jab_pelaksana",
+    "Struktural": "jab_struktural",
+}
+
+def rencana_bertahap(jurnal_run=None):
+    # Hasilkan hanya baris yang lolos validasi. Dengan `jurnal_run`, baris yang ditolak
+    # ikut dicatat ke jurnal (muncul di log kegagalan) dan baris yang sudah selesai di
+    # run sebelumnya tidak divalidasi ulang. Langkah per baris dicatat dengan kunci nomor
+    # baris, sehingga NIP yang muncul di beberapa baris tetap diproses per baris.
+    jumlah = jumlah_ditolak = 0
+    for rec in alirkan_rencana(args.excel, str(Path(args.excel).with_suffix(".rencana.json"))):
+        jumlah += 1
+        urutan_nip.append(rec.nip)
+        if jurnal_run is not None and jurnal_run.sudah_selesai(rec.nip, "pendidikan", str(rec.baris)) \
+                and jurnal_run.sudah_selesai(rec.nip, "jabatan", str(rec.baris)):
+            yield rec
+            continue
+        _, ganda = periksa_kode_spmt(indeks_spmt, [(rec.nip, rec.kode_spmt)])
+        for nip_cek, kode_cek, files_cek in ganda:
+            print(f"⚠️ NIP {nip_cek}: kode {kode_cek} cocok dengan {len(files_cek)} file, dipakai {Path(files_cek[0]).name}")
+        spmt_ganda.extend(ganda)
+
+        masalah = periksa_rencana(rec, indeks_spmt, katalog, FIELD_JABATAN)
+        if masalah:
+            jumlah_ditolak += 1
+            print(f"🚫 Baris ke-{rec.baris} NIP {rec.nip} ditolak validasi: {'; '.join(masalah)}")
+            ditolak.extend({"NIP": rec.nip, "Baris": rec.baris, "Masalah": m} for m in masalah)
+            if jurnal_run is not None:
+                jurnal_run.catat(rec.nip, "validasi", "gagal", kunci=str(rec.baris), log=[
+                    {"NIP": rec.nip, "Keterangan": f"Validasi: {m}"} for m in masalah
+                ])
+            continue
+        if jurnal_run is not None and jurnal_run.terakhir(rec.nip, "validasi", str(rec.baris)) is not None:
+            jurnal_run.catat(rec.nip, "validasi", "ok", kunci=str(rec.baris), log=[])
+        yield rec
+    print(f"📋 Validasi: {jumlah} baris, {jumlah_ditolak} ditolak, {len(spmt_ganda)} kode SPMT ganda")
+
+def simpan_validasi():
+    if not ditolak:
+        return None
+    path = f"validasi_tugas1_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.xlsx"
+    tulis_excel(susun_laporan(ditolak, ["Baris", "Masalah"], "Jumlah Masalah"), path)
+    print(f"📝 Laporan validasi disimpan di '{path}'")
+    return path
+
+if args.validasi:
+    lolos = sum(1 for _ in rencana_bertahap())
+    print(f"✅ {lolos} baris siap dikirim ke browser")
+    simpan_validasi()
+    sys.exit(0)
+
+# === 2. Setup Driver & Login SIMPEG ===
 # Bagian ini bertugas untuk:
-# - Membaca data pegawai dari file Excel "data_jabatan.xlsx"
-# - Menyediakan list kosong `log_gagal` untuk mencatat data yang gagal diproses
-# - Menentukan path folder tempat file SK (dokumen TTE) disimpan
-#   agar bisa dicocokkan dengan data pegawai
-data = pd.read_excel("data_jabatan.xlsx")
-log_gagal = []
-folder_path = Path(r"D:\PKL\code\cek_dan_perbaiki\TTE SPMT PPPK T1 2024")
-
-
-for index, row in data.iterrows():
-    # === Proses Data Pegawai ===
-    # Bagian ini melakukan loop per baris data di file Excel.
-    # Setiap baris berisi informasi satu pegawai, NIP, data pendidikan, dan jabatan.
-    # Tahapan utamanya:
-    # 1. Ambil NIP pegawai (dibersihkan agar konsisten dalam bentuk string).
-    # 2. Ambil data pendidikan: tahun lulus, nomor ijazah, kepala sekolah, tanggal ijazah, jurusan, lembaga.
-    # 3. Ambil data jabatan: nomor SPMT, tanggal SPMT, TMT SPMT, jenis jabatan, nama jabatan.
-    # 4. Lakukan normalisasi data (jurusan & jabatan) agar sesuai format input SIMPEG.
-    # 5. Ekstrak unit kerja, sub unit, dan SKPD dari kolom 'Unor'.
-
-    print(f"\n🚀 Proses baris ke-{index + 1} NIP: {row['NIP Baru']}")
-    nip_raw = row['NIP Baru']
-    nip = str(int(nip_raw)) if isinstance(nip_raw, float) else str(nip_raw)
-    data = pd.read_excel("data_jabatan.xlsx", dtype={"Tanggal SPMT": str, "TMT SPMT": str, "Tanggal Ijazah": str})
-
-    tahun_lulus = str(row['Tahun Lulus'])
-    no_ijazah = row['No. Ijazah']
-    kepala = row['Kepala Sekolah']
-    tanggal = pd.to_datetime(row['Tanggal Ijazah'], dayfirst=True).strftime("%d-%m-%Y")
-    jurusan_excel = normalisasi_jurusan(row['Jurusan'])
-    lembaga_excel = row['Lembaga']
-
-    keterangan = str(row['No.SPMT']) 
-    parts = keterangan.split('/')
-    no_spmt = str(row['No.SPMT'])
-    tanggal_spmt = pd.to_datetime(row['Tanggal SPMT'], dayfirst=True).strftime("%d-%m-%Y")
-    tanggal_tmt = pd.to_datetime(row['TMT SPMT'], dayfirst=True).strftime("%d-%m-%Y")
-    
-    jabatan_excel = normalisasi_jabatan(row['JENIS JABATAN NAMA'])
-    jabatan_nama = row['JABATAN NAMA']
-    sub_unit, unit_kerja, skpd = ekstrak_sub_unit_unit_skpd(row['Unor'])
-
-    # === Navigasi ke Halaman Detail Pegawai ===
-    # Bagian ini melakukan pencarian data pegawai berdasarkan NIP, 
-    # lalu membuka halaman detail pegawai untuk mendapatkan ID Pegawai.
-    # Tahapannya:
-    # 1. Buka halaman daftar pegawai SIMPEG.
-    # 2. Masukkan NIP ke input pencarian.
-    # 3. Klik tombol 'Cari Data' (menggunakan scroll + JavaScript click agar lebih stabil).
-    # 4. Tunggu hasil pencarian muncul, lalu klik tombol 'Detil'.
-    # 5. Berpindah ke tab baru yang menampilkan detail pegawai.
-    # 6. Ambil ID Pegawai dari URL halaman.
-
-    driver.get("https://simpeg.malangkota.go.id/kepegawaian/informasi/daftar_pegawai")
-    time.sleep(3)
-    tab_awal = driver.current_window_handle
-    nip_input = driver.find_element(By.ID, "nip_baru")
-    nip_input.clear()
-    nip_input.send_keys(nip)
-    cari_btn = driver.find_element(By.CLASS_NAME, "btn-primary") # Tombol 'Cari Data'
-
-    driver.execute_script("arguments[0].scrollIntoView(true);", cari_btn) # Scroll dulu 
-    time.sleep(0.5) 
-    driver.execute_script("arguments[0].click();", cari_btn) # baru klik cari data
-    time.sleep(4)
-    
-    detail_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(@title, 'Detil')]")))
-    driver.execute_script("arguments[0].click();", detail_btn) # klik tombol detil
-    time.sleep(2)
-    
-    driver.switch_to.window(driver.window_handles[-1]) # Ganti fokus ke tab baru
-    print("🧭 Berpindah ke tab baru.")
-
-    current_url = driver.current_url
-    pegawai_id = current_url.rstrip('/').split("/")[-1]
-    print("🆔 ID Pegawai:", pegawai_id)
-
-    # === Mengisi Data Pendidikan Pegawai ===
+# - Membuka cache NIP → pegawai_id yang dipakai bersama dengan Tugas2.py
+# - Menyiapkan fungsi pembuat sesi per worker:
+#   * Menginisialisasi ChromeDriver dengan path lokal
+#   * Membuka halaman login SIMPEG Kota Malang, mengisi username & password, klik login
+#   * Menunggu URL beralih dari halaman login (bukan jeda tetap)
+# Catatan: ganti "the-username" dan "the-password" di browser.py dengan kredensial asli.
+
+cache_pegawai = CachePegawai()
+jurnal = Jurnal("jurnal_tugas1.jsonl", lanjut=args.resume)
+# Log kegagalan per NIP ditulis ulang berkala selama run, jadi tetap ada bila run berhenti
+laporan_gagal = LaporanBerkala(
+    "log-semua-kegagalan.xlsx", jurnal,
+    lambda entri: susun_laporan(entri, ["Keterangan"], "Jumlah Kegagalan"),
+    urutan_nip=urutan_nip,
+)
+
+
+def buat_sesi(id_worker):
+    driver = buat_driver_simpeg(cepat=args.cepat, blokir_css=args.blokir_css)
+    login_simpeg(driver)
+    # Sesi login yang habis di tengah run dipulihkan di Chrome yang sama (lihat penjaga_sesi)
+    penjaga = penjaga_sesi.pasang_simpeg(driver)
+    sesi = {"driver": driver, "wait": WebDriverWait(driver, 10)}
+    if args.http:
+        sesi["http"] = PengirimForm(driver)
+        penjaga.setelah_pulih(sesi["http"].segarkan_cookie)
+    return sesi
+
+
+def tutup_sesi(sesi):
+    sesi["driver"].quit()
+
+
+def ketik_select2(driver, wait, field, teks, tunggu_klik=True):
+    # Cara lama memilih opsi Select2: klik kotak, ketik teks, tunggu hasil AJAX, tekan ENTER.
+    # Hanya dipakai bila katalog opsi tidak bisa menyelesaikan teks menjadi id opsi.
+    syarat = EC.element_to_be_clickable if tunggu_klik else EC.presence_of_element_located
+    box = wait.until(syarat((By.ID, f"select2-{field}-container")))
+    box.click()
+
+    input_box = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input.select2-search__field")))
+    input_box.clear()
+    input_box.send_keys(teks)
+    tunggu.tunggu_hasil_select2(driver)
+    input_box.send_keys(Keys.ENTER)
+    tunggu.tunggu_select2_tertutup(driver)
+    tunggu.tunggu_ajax_selesai(driver)
+    return driver.execute_script("var el = document.getElementById(arguments[0]); return el ? el.value : null;", field)
+
+
+def pilih_opsi(driver, wait, field, teks, induk=None, tunggu_klik=True):
+    # Pilih opsi lewat katalog (id pasti, tanpa mengetik); bila tidak ketemu, ketik manual.
+    # Mengembalikan id opsi yang terpilih, dipakai sebagai induk field berjenjang.
+    with fase(f"select_{field}"):
+        hasil = katalog.pilih(driver, field, teks, induk)
+        if hasil is not None:
+            print(f"📚 {field}: '{hasil['text']}' dipilih dari katalog.")
+            return hasil["id"]
+        return ketik_select2(driver, wait, field, teks, tunggu_klik)
+
+
+def isi_pendidikan_browser(driver, wait, rec, pegawai_id, log_gagal):
+    # === Mengisi Data Pendidikan Pegawai (jalur browser) ===
     # Bagian ini langsung mengakses form tambah pendidikan berdasarkan ID Pegawai.
     # Tahapannya:
     # 1. Susun URL form tambah pendidikan menggunakan ID Pegawai.
@@ -272,12 +192,24 @@ for index, row in data.iterrows():
     #    - Nomor Ijazah
     # 4. Pastikan field 'keterangan' dikosongkan dulu sebelum diisi ulang.
     # 5. Masukkan nomor ijazah ke field keterangan.
+    # 6. Kembalikan True bila form tersimpan tanpa .error-block (dicatat ke jurnal).
+
+    nip = rec.nip
+    tahun_lulus = rec.tahun_lulus
+    no_ijazah = rec.no_ijazah
+    kepala = rec.kepala
+    tanggal = rec.tanggal_ijazah
+    jurusan_excel = rec.jurusan
+    lembaga_excel = rec.lembaga
 
     print ("Mengisi Pendidikan")
-    form_url = f"https://simpeg.malangkota.go.id/kepegawaian/informasi/pegawai_pendidikan/add_pendidikan/{pegawai_id}"
-    driver.get(form_url)
-    print("🔗 Akses langsung ke form tambah pendidikan:", form_url)
-    time.sleep(3)
+    form_url = f"{URL_SIMPEG}/kepegawaian/informasi/pegawai_pendidikan/add_pendidikan/{pegawai_id}"
+    with fase("open_form_pendidikan"):
+        driver.get(form_url)
+        print("🔗 Akses langsung ke form tambah pendidikan:", form_url)
+        tunggu.tunggu_halaman_siap(driver)
+        penjaga_sesi.periksa(driver)
+        periksa_halaman_pegawai(driver, pegawai_id)
 
     driver.find_element(By.ID, "tanggal_ijazah").send_keys(tanggal)
     driver.find_element(By.NAME, "nama_kepala").send_keys(kepala)
@@ -286,9 +218,10 @@ for index, row in data.iterrows():
     driver.find_element(By.NAME, "keterangan").send_keys(no_ijazah)
 
     try: # === Jurusan ===
-        select_jurusan = Select(driver.find_element(By.ID, "jurusan"))
-        select_jurusan.select_by_visible_text(jurusan_excel.upper())
-        time.sleep(1)
+        if katalog.pilih(driver, "jurusan", jurusan_excel.upper(), persis=True) is None:
+            select_jurusan = Select(driver.find_element(By.ID, "jurusan"))
+            select_jurusan.select_by_visible_text(jurusan_excel.upper())
+            tunggu.tunggu_ajax_selesai(driver)
         print(f"✅ Jurusan '{jurusan_excel.upper()}' berhasil dipilih.")
     except Exception as e:
         log_gagal.append({
@@ -298,16 +231,7 @@ for index, row in data.iterrows():
         print (f"❌ Gagal memilih jurusan: {e}")
 
     try: # === Lembaga ===
-        select_box = wait.until(EC.element_to_be_clickable((By.ID, "select2-categories-container")))
-        select_box.click()
-        time.sleep(0.5)
-
-        input_box = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input.select2-search__field")))
-        input_box.send_keys(lembaga_excel.upper())
-        time.sleep(1) 
-
-        input_box.send_keys(Keys.ENTER)
-        time.sleep(1)
+        pilih_opsi(driver, wait, "categories", lembaga_excel.upper())
 
         selected_lembaga = driver.find_element(By.ID, "select2-categories-container").text.strip().upper()
         if lembaga_excel.upper() in selected_lembaga:
@@ -322,14 +246,7 @@ for index, row in data.iterrows():
         print (f"❌ Gagal memilih lembaga: {e}")
 
     try: # Pendidikan CPNS 
-        pendidikan_cpns_box = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[@id='select2-pendidikan_cpns-container']")))
-        pendidikan_cpns_box.click()
-        time.sleep(0.5)
-
-        pendidikan_cpns_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input.select2-search__field")))
-        pendidikan_cpns_input.send_keys("Ya")
-        time.sleep(0.5)
-        pendidikan_cpns_input.send_keys(Keys.ENTER)
+        pilih_opsi(driver, wait, "pendidikan_cpns", "Ya")
     except Exception as e:
         log_gagal.append({
             "NIP": nip,
@@ -337,10 +254,11 @@ for index, row in data.iterrows():
         })
         print (f"❌ Gagal memilih pendik_cpns: {e}")
             
-    time.sleep(1)
-    submit_btn = wait.until(EC.element_to_be_clickable((By.ID, "submit_button")))
-    submit_btn.click()
-    time.sleep(3)
+    with fase("submit_pendidikan"):
+        submit_btn = wait.until(EC.element_to_be_clickable((By.ID, "submit_button")))
+        submit_btn.click()
+        tunggu.tunggu_hasil_submit(driver, submit_btn)
+        penjaga_sesi.periksa(driver)
     errors = driver.find_elements(By.CSS_SELECTOR, ".error-block")
     if errors:
         error_messages = [e.text.strip() for e in errors if e.text.strip()]
@@ -351,26 +269,35 @@ for index, row in data.iterrows():
             "Keterangan": f"Form pendidikan tidak berhasil disimpan. Error: {combined_error}"
         })
         print(f"❌ Form pendidikan gagal disimpan: {combined_error}")
-    else:
-        print(f"✅ Data pendidikan {nip} berhasil disimpan.")      
+        return False
+    print(f"✅ Data pendidikan {nip} berhasil disimpan.")
+    return True
+
+
+def isi_jabatan_browser(driver, wait, rec, pegawai_id, log_gagal):
+    # === Mengisi Data Jabatan Pegawai (jalur browser) ===
+    # Mengembalikan True bila form tersimpan tanpa .error-block (dicatat ke jurnal).
+    nip = rec.nip
+    keterangan = rec.no_spmt
+    no_spmt = rec.no_spmt
+    tanggal_spmt = rec.tanggal_spmt
+    tanggal_tmt = rec.tanggal_tmt
+    jabatan_excel = rec.jenis_jabatan
+    jabatan_nama = rec.jabatan_nama
+    sub_unit, unit_kerja, skpd = rec.sub_unit, rec.unit_kerja, rec.skpd
 
     print ("\n ======= Mengisi Main Jabatan ========")
-    form_url = f"https://simpeg.malangkota.go.id/kepegawaian/informasi/pegawai_jabatan/tambah_jabatan/{pegawai_id}"
-    driver.get(form_url)
-    print("🔗 Akses langsung ke form tambah jabatan:", form_url)
-    time.sleep(3)
+    form_url = f"{URL_SIMPEG}/kepegawaian/informasi/pegawai_jabatan/tambah_jabatan/{pegawai_id}"
+    with fase("open_form_jabatan"):
+        driver.get(form_url)
+        print("🔗 Akses langsung ke form tambah jabatan:", form_url)
+        tunggu.tunggu_halaman_siap(driver)
+        penjaga_sesi.periksa(driver)
+        periksa_halaman_pegawai(driver, pegawai_id)
 
     try:
         print(f"🎯 Mencoba pilih jabatan: {jabatan_excel}")
-        jabatan_box = wait.until(EC.element_to_be_clickable((By.ID, "select2-jenis_jabatan-container")))
-        jabatan_box.click()
-        time.sleep(1)
-
-        jabatan_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input.select2-search__field")))
-        jabatan_input.send_keys(jabatan_excel.upper()) 
-        time.sleep(1)
-        jabatan_input.send_keys(Keys.ENTER)
-        time.sleep(1)
+        pilih_opsi(driver, wait, "jenis_jabatan", jabatan_excel.upper())
         print(f"✅ Jabatan '{jabatan_excel}' berhasil dipilih.")
     except Exception as e:
         log_gagal.append({
@@ -379,18 +306,11 @@ for index, row in data.iterrows():
         })
         print(f"❌ Gagal memilih jabatan: {e}")
 
+    # id opsi yang terpilih, dipakai sebagai kunci katalog untuk daftar berjenjang
+    id_skpd = id_unit_kerja = None
     try:
         print(f"🎯 Mencoba pilih SKPD: {skpd}")
-
-        skpd_box = wait.until(EC.element_to_be_clickable((By.ID, "select2-skpd-container")))
-        skpd_box.click()
-        time.sleep(1)
-
-        skpd_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input.select2-search__field")))
-        skpd_input.send_keys(skpd.upper())
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".select2-results__option--highlighted")))
-        skpd_input.send_keys(Keys.ENTER)
-        time.sleep(1)
+        id_skpd = pilih_opsi(driver, wait, "skpd", skpd.upper())
         print(f"✅ SKPD '{skpd}' berhasil dipilih.")
     except Exception as e:
         log_gagal.append({
@@ -401,17 +321,7 @@ for index, row in data.iterrows():
 
     try:
         print(f"🎯 Mencoba pilih unit kerja: {unit_kerja}")
-
-        unit_box = wait.until(EC.element_to_be_clickable((By.ID, "select2-unit_kerja-container")))
-        unit_box.click()
-        time.sleep(1)
-
-        unit_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input.select2-search__field")))
-        unit_input.send_keys(unit_kerja.upper())
-        time.sleep(2.5)
-        unit_input.send_keys(Keys.ENTER)
-        time.sleep(1)
-
+        id_unit_kerja = pilih_opsi(driver, wait, "unit_kerja", unit_kerja.upper(), induk=id_skpd)
         print(f"✅ unit kerja '{unit_kerja}' berhasil dipilih.")
     except Exception as e:
         log_gagal.append({
@@ -423,17 +333,7 @@ for index, row in data.iterrows():
     if sub_unit:
         try:
             print(f"🎯 Mencoba pilih sub unit kerja: {sub_unit}")
-
-            subunit_box = wait.until(EC.element_to_be_clickable((By.ID, "select2-sub_unit_kerja-container")))
-            subunit_box.click()
-            time.sleep(1)
-
-            subunit_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input.select2-search__field")))
-            subunit_input.send_keys(sub_unit.upper())
-            time.sleep(2.5)
-            subunit_input.send_keys(Keys.ENTER)
-            time.sleep(1)
-
+            pilih_opsi(driver, wait, "sub_unit_kerja", sub_unit.upper(), induk=id_unit_kerja)
             print(f"✅ Sub unit kerja '{sub_unit}' berhasil dipilih.")
         except Exception as e:
             log_gagal.append({
@@ -446,22 +346,10 @@ for index, row in data.iterrows():
 
     try:
         print(f"🎯 Mencoba pilih nama jabatan {jabatan_excel}: {jabatan_nama}")
-        jabfung_box = None
-        if jabatan_excel == "Fungsional":
-            jabfung_box = wait.until(EC.presence_of_element_located((By.ID, "select2-jab_fungsional-container")))
-        elif jabatan_excel == "Pelaksana":
-            jabfung_box = wait.until(EC.presence_of_element_located((By.ID, "select2-jab_pelaksana-container")))
-        elif jabatan_excel == "Struktural":
-            jabfung_box = wait.until(EC.presence_of_element_located((By.ID, "select2-jab_struktural-container")))
-        jabfung_box.click()
-        time.sleep(0.5)
-            
-        jabfung_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input.select2-search__field")))
-        jabfung_input.clear()
-        jabfung_input.send_keys(jabatan_nama.upper())
-        time.sleep(2)
-        jabfung_input.send_keys(Keys.ENTER)
-        time.sleep(1)
+        field_jabatan = FIELD_JABATAN.get(jabatan_excel)
+        if field_jabatan is None:
+            raise ValueError(f"jenis jabatan '{jabatan_excel}' tidak dikenal")
+        pilih_opsi(driver, wait, field_jabatan, jabatan_nama.upper(), tunggu_klik=False)
 
         print(f"✅ Jabatan '{jabatan_excel}' '{jabatan_nama}' berhasil dipilih.")
     except Exception as e:
@@ -472,8 +360,9 @@ for index, row in data.iterrows():
         print(f"❌ Gagal memilih nama jabatan '{jabatan_excel}': {e}")
 
     try:
-        select_pejabat = Select(driver.find_element(By.ID, "pejabat"))
-        select_pejabat.select_by_visible_text("Sekretaris Daerah")
+        if katalog.pilih(driver, "pejabat", "Sekretaris Daerah", persis=True) is None:
+            select_pejabat = Select(driver.find_element(By.ID, "pejabat"))
+            select_pejabat.select_by_visible_text("Sekretaris Daerah")
         print("✅ 'Sekretaris Daerah' berhasil dipilih.")
     except Exception as e:
         log_gagal.append({
@@ -510,23 +399,18 @@ for index, row in data.iterrows():
     
     driver.find_element(By.NAME, "ket_pejabat").send_keys("Sekretaris Daerah Kota Malang")
 
-    if len(parts) >= 2:
-        kode = parts[1]
-        pattern = re.compile(rf"^SPMT_PPPK_T1_\d+_{kode}_")
+    if rec.kode_spmt:
+        kode = rec.kode_spmt
+        file_sk_path = cari_file_spmt(indeks_spmt, kode)
 
-        matching_files = [
-            f for f in folder_path.iterdir()
-            if f.is_file() and pattern.match(f.name)
-        ]
-
-        if matching_files:
-            file_sk_path = str(matching_files[0])
+        if file_sk_path:
             print(f"✅ File ditemukan: {file_sk_path}")
 
-            file_input = wait.until(EC.presence_of_element_located((By.ID, "file_spmt")))
-            driver.execute_script("arguments[0].scrollIntoView(true);", file_input)
-            file_input.send_keys(file_sk_path)
-            time.sleep(3)
+            with fase("upload_spmt"):
+                file_input = wait.until(EC.presence_of_element_located((By.ID, "file_spmt")))
+                driver.execute_script("arguments[0].scrollIntoView(true);", file_input)
+                file_input.send_keys(file_sk_path)
+                tunggu.tunggu_ajax_selesai(driver)
 
         else:
             log_gagal.append({
@@ -538,24 +422,22 @@ for index, row in data.iterrows():
         print(f"❌ Format SPMT tidak valid: {keterangan}")
 
     try:
-        time.sleep(1)
-
-        # Scroll dan klik tombol Submit
-        submit_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Submit')]")))
-        driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].click();", submit_btn)  
-        time.sleep(2)
-
-        try:
-            WebDriverWait(driver, 3).until(EC.alert_is_present())
-            alert = driver.switch_to.alert
-            print(f"⚠ Alert muncul: {alert.text}")
-            alert.accept()
-            print("✅ Alert dikonfirmasi.")
-            time.sleep(2)
-        except:
-            print("ℹ️ Tidak ada alert konfirmasi setelah submit.")
+        with fase("submit_jabatan"):
+            # Scroll dan klik tombol Submit
+            submit_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Submit')]")))
+            driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
+            driver.execute_script("arguments[0].click();", submit_btn)
+
+            # Tunggu reaksi nyata: alert konfirmasi, perpindahan halaman, atau .error-block
+            if tunggu.tunggu_hasil_submit(driver, submit_btn) == "alert":
+                alert = driver.switch_to.alert
+                print(f"⚠ Alert muncul: {alert.text}")
+                alert.accept()
+                print("✅ Alert dikonfirmasi.")
+                tunggu.tunggu_hasil_submit(driver, submit_btn)
+            else:
+                print("ℹ️ Tidak ada alert konfirmasi setelah submit.")
+            penjaga_sesi.periksa(driver)
 
         errors = driver.find_elements(By.CSS_SELECTOR, ".error-block")
         if errors:
@@ -567,8 +449,9 @@ for index, row in data.iterrows():
                 "Keterangan": f"Form tidak berhasil disimpan. Error: {combined_error}"
             })
             print(f"❌ Form Jabatan gagal disimpan: {combined_error}")
-        else:
-            print(f"✅ Data Jabatan {nip} berhasil disimpan.")
+            return False
+        print(f"✅ Data Jabatan {nip} berhasil disimpan.")
+        return True
 
     except Exception as e:
         log_gagal.append({
@@ -576,15 +459,219 @@ for index, row in data.iterrows():
             "Keterangan": f"Gagal saat submit: {e}"
         })
         print(f"❌ Error saat proses submit: {e}")
+        return False
+
+
+def kirim_pendidikan_http(pengirim, rec, pegawai_id):
+    """Kirim form pendidikan lewat HTTP dengan nilai yang sama seperti jalur browser."""
+    return pengirim.kirim(
+        "pendidikan", pegawai_id,
+        nilai={
+            "tanggal_ijazah": rec.tanggal_ijazah,
+            "nama_kepala": rec.kepala,
+            "tahun_lulus": rec.tahun_lulus,
+            "keterangan": rec.no_ijazah,
+        },
+        pilihan={
+            "jurusan": rec.jurusan.upper(),
+            "categories": rec.lembaga.upper(),
+            "pendidikan_cpns": "Ya",
+        },
+        resolver=katalog.resolver_http(),
+        persis={"jurusan"},
+    )
+
+
+def kirim_jabatan_http(pengirim, rec, pegawai_id):
+    """
+    Kirim form jabatan (multipart, dengan file SPMT) lewat HTTP.
 
-    driver.close()
-    driver.switch_to.window(tab_awal)
+    Baris dengan jenis jabatan tidak dikenal atau file SPMT yang tidak ditemukan
+    dikembalikan ke jalur browser agar pencatatan kegagalannya tetap sama.
+    """
+    field_jabatan = FIELD_JABATAN.get(rec.jenis_jabatan)
+    if field_jabatan is None:
+        return BELUM_TERKIRIM, f"jenis jabatan '{rec.jenis_jabatan}' tidak dikenal"
+    file_sk_path = cari_file_spmt(indeks_spmt, rec.kode_spmt) if rec.kode_spmt else None
+    if file_sk_path is None:
+        return BELUM_TERKIRIM, "file SPMT tidak ditemukan"
+
+    pilihan = {
+        "jenis_jabatan": rec.jenis_jabatan.upper(),
+        "skpd": rec.skpd.upper(),
+        "unit_kerja": rec.unit_kerja.upper(),
+    }
+    if rec.sub_unit:
+        pilihan["sub_unit_kerja"] = rec.sub_unit.upper()
+    pilihan[field_jabatan] = rec.jabatan_nama.upper()
+    pilihan["pejabat"] = "Sekretaris Daerah"
+
+    return pengirim.kirim(
+        "jabatan", pegawai_id,
+        nilai={
+            "nomor_sk": rec.no_spmt,
+            "inp_tanggal_sk": rec.tanggal_spmt,
+            "inp_tmt_sk": rec.tanggal_tmt,
+            "inp_tmt_pelantikan": rec.tanggal_tmt,
+            "inp_tmt_mutasi": rec.tanggal_tmt,
+            "ket_pejabat": "Sekretaris Daerah Kota Malang",
+        },
+        pilihan=pilihan,
+        files={"file_spmt": file_sk_path},
+        resolver=katalog.resolver_http(),
+        persis={"pejabat"},
+    )
+
+
+def jalankan_langkah(driver, nip, langkah, fungsi, log_gagal, kunci="", **data):
+    # Jalankan satu langkah lalu catat hasilnya ke jurnal beserta entri log_gagal-nya.
+    # `kunci` = nomor baris rencana kerja (NIP yang sama bisa muncul di beberapa baris).
+    # Dengan --resume, langkah yang sudah "ok" di jurnal dilewati.
+    # Bila langkah gagal karena sesi login habis, login ulang lalu langkah diulang;
+    # entri log_gagal dari percobaan yang gagal dibuang.
+    if jurnal.sudah_selesai(nip, langkah, kunci):
+        print(f"⏭️ Langkah {langkah} NIP {nip} sudah selesai di run sebelumnya, dilewati.")
+        return
+    awal = len(log_gagal)
+
+    def coba():
+        del log_gagal[awal:]
+        return fungsi()
+
+    with konteks(langkah=langkah), fase(f"fill_{langkah}"):
+        berhasil = penjaga_sesi.jalankan(driver, coba, gagal_bila=lambda hasil: not hasil)
+    jurnal.catat(nip, langkah, "ok" if berhasil else "gagal", kunci=kunci, log=log_gagal[awal:], **data)
+
+
+def ambil_pegawai_id(driver, nip, segarkan=False):
+    # pegawai_id dari jurnal (run sebelumnya) atau cache/pencarian, lalu dicatat ke jurnal.
+    # segarkan=True mengabaikan jurnal dan cache, lalu mencari ulang lewat browser.
+    catatan_id = jurnal.terakhir(nip, "pegawai_id")
+    if not segarkan and catatan_id is not None and catatan_id["status"] == "ok":
+        return catatan_id["pegawai_id"]
+    pegawai_id = cari_pegawai_id(driver, nip, cache_pegawai, halaman="daftar_pegawai", segarkan=segarkan)
+    jurnal.catat(nip, "pegawai_id", "ok", pegawai_id=pegawai_id)
+    return pegawai_id
+
+
+def proses_pegawai(sesi, rec, log_gagal):
+    # === Proses Data Pegawai ===
+    # Fungsi ini memproses satu rencana kerja (satu pegawai per baris Excel)
+    # memakai driver milik worker yang menjalankannya.
+    # Semua nilai sudah dibersihkan & dinormalisasi di tahap rencana kerja:
+    # 1. NIP pegawai dalam bentuk string.
+    # 2. Data pendidikan: tahun lulus, nomor ijazah, kepala sekolah, tanggal ijazah, jurusan, lembaga.
+    # 3. Data jabatan: nomor SPMT, tanggal SPMT, TMT SPMT, jenis jabatan, nama jabatan.
+    # 4. Unit kerja, sub unit, dan SKPD hasil ekstraksi kolom 'Unor'.
+    # Setiap langkah (pegawai_id, pendidikan, jabatan) dicatat ke jurnal begitu selesai.
+
+    driver, wait = sesi["driver"], sesi["wait"]
+    nip, baris = rec.nip, str(rec.baris)
+    if jurnal.sudah_selesai(nip, "pendidikan", baris) and jurnal.sudah_selesai(nip, "jabatan", baris):
+        print(f"\n⏭️ Baris ke-{rec.baris} NIP: {nip} sudah selesai di run sebelumnya.")
+        return
+    print(f"\n🚀 Proses baris ke-{rec.baris} NIP: {nip}")
+
+    # === Mendapatkan ID Pegawai ===
+    # ID Pegawai diambil dari jurnal atau cache bila NIP sudah pernah dicari.
+    # Bila belum, dilakukan pencarian berdasarkan NIP di halaman daftar pegawai:
+    # 1. Buka halaman daftar pegawai SIMPEG, masukkan NIP, klik 'Cari Data'.
+    # 2. Tunggu baris hasil pencarian yang memuat NIP muncul, lalu klik tombol 'Detil'.
+    # 3. Ambil ID Pegawai dari URL tab detail, tutup tab tersebut, lalu simpan ke cache.
+    # Bila form pegawai dengan ID dari jurnal/cache ternyata tidak ada, ID lama dibuang
+    # dan dicari ulang sekali lewat browser, lalu langkah yang belum selesai diulang.
+
+    pegawai_id = ambil_pegawai_id(driver, nip)
+    print("🆔 ID Pegawai:", pegawai_id)
 
-driver.quit()
+    # === Mengisi Data Pendidikan & Jabatan ===
+    # Dengan opsi --http, form dikirim langsung lewat HTTP memakai cookie sesi browser.
+    # Bila belum terkirim (opsi tidak bisa diselesaikan, .error-block, sesi habis), form
+    # diisi ulang lewat jalur browser seperti biasa. Bila hasil POST tidak pasti (timeout,
+    # koneksi putus, HTTP 5xx), data mungkin sudah tersimpan: langkah dicatat gagal dan
+    # tidak dikirim ulang, agar tidak ada riwayat pendidikan/jabatan ganda.
+    pengirim = sesi.get("http")
+    tidak_pasti = {}  # langkah → entri log_gagal kiriman HTTP yang hasilnya tidak pasti
+
+    def lewat_http(langkah, kirim_http):
+        # True/False = hasil langkah; None = belum terkirim, isi lewat browser
+        if langkah in tidak_pasti:
+            # Langkah diulang setelah login ulang: jangan kirim lagi
+            log_gagal.append(tidak_pasti[langkah])
+            return False
+        hasil, pesan = kirim_http(pengirim, rec, pegawai_id)
+        if hasil == BERHASIL:
+            print(f"✅ Data {langkah} {nip} berhasil disimpan lewat HTTP.")
+            return True
+        if hasil == TIDAK_PASTI:
+            tidak_pasti[langkah] = {
+                "NIP": nip,
+                "Keterangan": f"Kirim {langkah} lewat HTTP tidak pasti ({pesan}), periksa di SIMPEG sebelum dikirim ulang"
+            }
+            log_gagal.append(tidak_pasti[langkah])
+            print(f"❌ Hasil kirim {langkah} lewat HTTP tidak pasti ({pesan}), tidak dikirim ulang.")
+            return False
+        print(f"⚠️ Kirim {langkah} lewat HTTP gagal ({pesan}), pakai browser.")
+        return None
+
+    def pendidikan():
+        if pengirim is not None:
+            hasil = lewat_http("pendidikan", kirim_pendidikan_http)
+            if hasil is not None:
+                return hasil
+        return isi_pendidikan_browser(driver, wait, rec, pegawai_id, log_gagal)
+
+    def jabatan():
+        if pengirim is not None:
+            hasil = lewat_http("jabatan", kirim_jabatan_http)
+            if hasil is not None:
+                return hasil
+        return isi_jabatan_browser(driver, wait, rec, pegawai_id, log_gagal)
+
+    for percobaan in range(2):
+        try:
+            jalankan_langkah(driver, nip, "pendidikan", pendidikan, log_gagal, kunci=baris)
+            jalankan_langkah(driver, nip, "jabatan", jabatan, log_gagal, kunci=baris)
+            break
+        except PegawaiTidakDitemukan as e:
+            if percobaan:
+                raise
+            print(f"⚠️ {e}, cari ulang ID Pegawai {nip}")
+            pegawai_id = ambil_pegawai_id(driver, nip, segarkan=True)
+            print("🆔 ID Pegawai:", pegawai_id)
+    jurnal.catat(nip, "proses", "ok", kunci=baris)
+
+
+def catat_error(rec, e):
+    # Error tidak tertangani: dicatat ke jurnal agar baris ini diulang saat --resume
+    entri = {"NIP": rec.nip, "Keterangan": f"Error tidak tertangani: {e}"}
+    jurnal.catat(rec.nip, "proses", "gagal", kunci=str(rec.baris), log=[entri])
+    return entri
+
+
+# === 3. Jalankan Worker ===
+# Baris rencana kerja dibagi ke `--workers` sesi Chrome yang masing-masing login sendiri.
+# Baris yang terhenti karena sesi login habis diulang setelah login ulang otomatis.
+# Jumlah baris yang aktif bersamaan mengikuti batas konkurensi adaptif host SIMPEG.
+# Laporan kegagalan disusun dari jurnal (termasuk run sebelumnya bila --resume),
+# urut sesuai baris rencana kerja; file dihapus bila akhirnya tidak ada kegagalan.
+jalankan_pool(
+    rencana_bertahap(jurnal), args.workers, buat_sesi,
+    per_item(penjaga_sesi.dengan_pemulihan(proses_pegawai), "proses", lambda rec: rec.nip), tutup_sesi,
+    saat_error=catat_error, pengendali=pengendali_host.pengendali("SIMPEG"),
+)
+log_gagal = laporan_gagal.tulis(hapus_bila_kosong=True)
+simpan_validasi()
+timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+simpan_laporan(f"performa_tugas1_{timestamp}")
+pengendali_host.cetak_ringkasan()
+if hitung_perintah.aktif():
+    hitung_perintah.simpan_laporan(f"perintah_tugas1_{timestamp}")
+jurnal.tutup()
+cache_pegawai.tutup()
+katalog.simpan()
 print("✨ Semua data selesai diproses.")
-if log_gagal:
-    df_log = pd.DataFrame(log_gagal)
-    df_log.to_excel("log-semua-kegagalan.xlsx", index=False)
+if not log_gagal.empty:
     print("📝 Log kegagalan disimpan di 'log-semua-kegagalan.xlsx'")
 else:
     print("🎉 Tidak ada data yang gagal diproses.")
\ No newline at end of file
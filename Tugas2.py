@@ -1,173 +1,146 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select
-import pandas as pd
-import requests
 import time
 import os
-import undetected_chromedriver as uc
-import json
 from datetime import datetime
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import sys
+import tunggu
+from browser import buat_driver_simpeg, login_simpeg, buka_dengan_cookie, URL_SIMPEG
+from cache_pegawai import CachePegawai, PegawaiTidakDitemukan, cari_pegawai_id, periksa_halaman_pegawai
+from pool_browser import jalankan_pool
+from baca_masukan import baca_nip
+from jurnal import Jurnal
+from laporan import LaporanBerkala, susun_laporan
+from suradi import cek_status_massal, PARALEL, STATUS_TIDAK_DITEMUKAN, STATUS_TIDAK_DIKENALI
+from unduh_pdf import PengunduhPDF
+from cache_unduhan import CacheUnduhan
+from pipeline import Tahap, jalankan_pipeline
+from tabel_cuti import baca_cuti, rentang_tahun
+from pencatat import pasang_pencatat, per_item, LEVEL
+from profil_waktu import fase, simpan_laporan
+import hitung_perintah
+import penjaga_sesi
+import pengendali_host
+import threading
+import argparse
+
+parser = argparse.ArgumentParser(description="Cek & upload surat cuti dari SURADI ke SIMPEG")
+parser.add_argument("--workers", type=int, default=1, help="jumlah pasangan sesi SIMPEG + SURADI paralel (default 1)")
+parser.add_argument("--cepat", action="store_true", help="profil cepat: headless, eager, blokir gambar/font/analitik")
+parser.add_argument("--blokir-css", action="store_true", help="ikut blokir CSS pada profil cepat")
+parser.add_argument("--pipeline", action="store_true", help="mode pipeline: pindai SIMPEG, cek/unduh SURADI, dan upload berjalan bersamaan")
+parser.add_argument("--tahun", type=int, default=2025, help="tahun cuti yang diproses (default 2025)")
+parser.add_argument("--dari", type=lambda t: datetime.strptime(t, "%d-%m-%Y").date(), help="awal rentang tanggal cuti (dd-mm-YYYY), menggantikan --tahun")
+parser.add_argument("--sampai", type=lambda t: datetime.strptime(t, "%d-%m-%Y").date(), help="akhir rentang tanggal cuti (dd-mm-YYYY), menggantikan --tahun")
+parser.add_argument("--resume", action="store_true", help="lanjutkan dari jurnal run sebelumnya, lewati NIP & surat yang sudah selesai")
+parser.add_argument("--excel", default=r"D:/PKL/2. TUGAS 2/Data_Januari.xlsx", help="file Excel/CSV/Parquet berisi kolom 'NIP Baru'")
+parser.add_argument("--hitung-perintah", type=int, nargs="?", const=hitung_perintah.AMBANG_PERINTAH, metavar="AMBANG",
+                    help=f"hitung perintah WebDriver per jenis/fase/NIP, tandai NIP di atas AMBANG perintah (default {hitung_perintah.AMBANG_PERINTAH})")
+parser.add_argument("--log-level", choices=list(LEVEL), default="INFO", help="level minimum output konsol; file log selalu lengkap (default INFO)")
+args = parser.parse_args()
+
+# Rentang tanggal cuti yang diproses; dikirim ke request DataTables dan disaring ulang lokal
+if args.dari or args.sampai:
+    DARI, SAMPAI = args.dari, args.sampai
+    PERIODE = f"{DARI.strftime('%d-%m-%Y') if DARI else '...'} s.d. {SAMPAI.strftime('%d-%m-%Y') if SAMPAI else '...'}"
+else:
+    DARI, SAMPAI = rentang_tahun(args.tahun)
+    PERIODE = str(args.tahun)
 
 # === Setup log terminal ===
-os.makedirs("log_terminal", exist_ok=True)
-timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-log_path = os.path.join("log_terminal", f"terminal_{timestamp}.log")
-
-class Tee:
-    def __init__(self, *streams):
-        self.streams = streams
-    def write(self, data):
-        for s in self.streams:
-            s.write(data)
-            s.flush()
-    def flush(self):
-        for s in self.streams:
-            s.flush()
-
-log_file = open(log_path, "w", encoding="utf-8")
-sys.stdout = Tee(sys.stdout, log_file)
-sys.stderr = Tee(sys.stderr, log_file)
+# print diantrekan lalu ditulis thread latar belakang ke konsol, log teks, dan log JSONL
+# (dengan NIP & langkah), jadi tidak pernah menahan thread otomasi
+log_path = pasang_pencatat("terminal", level_konsol=args.log_level)
 
 print(f"📋 Logging terminal aktif. Semua output disimpan di: {log_path}")
+if args.hitung_perintah:
+    hitung_perintah.aktifkan(args.hitung_perintah)
 
-def buka_dengan_cookie():
-    options = uc.ChromeOptions()
-    driver = uc.Chrome(options=options)
-    driver.get("https://suradi.malangkota.go.id/")
-    time.sleep(2)
-
-    with open(r"D:/PKL/code/2. TUGAS 2/cookie.json", "r") as f:
-        cookies = json.load(f)
-        for cookie in cookies:
-            for key in ['sameSite', 'storeId', 'session', 'id', 'hostOnly', 'expirationDate']:
-                cookie.pop(key, None)
-            if cookie.get("domain", "").startswith("."):
-                cookie["domain"] = cookie["domain"][1:]
-            driver.add_cookie(cookie)
-
-    driver.get("https://suradi.malangkota.go.id/admin/dashboard")
-    print("✅ Cookie berhasil digunakan, masuk dashboard")
-    return driver
-
-def verifikasi_dan_upload_ulang(driver, driver_suradi, pegawai_id, nip):
-    print(f"\n🔁 Verifikasi ulang cuti 2025 ID Pegawai: {pegawai_id}")
-    driver.get(f"https://simpeg.malangkota.go.id/kepegawaian/informasi/daftar_pegawai/detail_pegawai/{pegawai_id}/tab_disiplin")
-    time.sleep(3)
-
-    rows = driver.find_elements(By.XPATH, "//table[@id='datatable_cuti']//tbody/tr")
-    ulang_upload = []
-
-    for row in rows:
-        tds = row.find_elements(By.TAG_NAME, "td")
-        if len(tds) < 8:
-            continue
-        tanggal = tds[2].text.strip()
-        tahun = tanggal.split("-")[-1]
-        if tahun != "2025":
-            continue
+def cek_status_suradi(driver, daftar_nomor, max_retry=3):
+    """
+    Cek status banyak nomor surat di SURADI sekaligus (lihat suradi.cek_status_massal),
+    dengan retry jika error.
 
-        td_file = tds[7]
-        if td_file.find_elements(By.TAG_NAME, "a"):
-            continue
+    Semua pencarian berjalan di bawah pengendali host SURADI: jumlah pencarian bersamaan
+    dan jumlah request AJAX per pencarian mengikuti batas konkurensi adaptifnya, dan
+    error server (timeout, HTTP 5xx) diulang dengan backoff eksponensial ber-jitter.
 
-        nomor_surat = tds[3].text.strip()
-        td_opsi = tds[8]
-        link_edit = td_opsi.find_element(By.XPATH, ".//a[contains(@href, 'edit_cuti')]").get_attribute("href")
+    Cookie SURADI yang kedaluwarsa dimuat ulang dari cookie.json lalu pencarian langsung
+    diulang tanpa jeda (penjaga_sesi); bila cookie.json juga sudah tidak berlaku, tidak
+    ada retry lagi.
 
-        ulang_upload.append({
-            'tanggal': tanggal,
-            'nomor_surat': nomor_surat,
-            'link_edit': link_edit
-        })
+    Returns:
+        dict: nomor_surat → {"status", "url_pdf"}. Bila semua percobaan gagal, status
+        setiap nomor berisi pesan error SURADI.
+    """
+    host = pengendali_host.pengendali("SURADI", batas_awal=PARALEL)
+    try:
+        with fase("suradi_lookup"):
+            return host.coba(penjaga_sesi.jalankan, driver, cek_status_massal, driver, daftar_nomor,
+                             paralel=host.konkurensi(), operasi="suradi", maks_coba=max_retry)
+    except penjaga_sesi.SesiKedaluwarsa as e:
+        print(f"❌ Sesi SURADI tidak bisa dipulihkan, perbarui cookie.json: {e}")
+        return {nomor: {"status": f"Error SURADI: {e}", "url_pdf": None} for nomor in daftar_nomor}
+    except Exception as e:
+        print(f"⚠️ Error akses SURADI: {e}")
+        status = f"Error SURADI setelah {max_retry} kali percobaan"
+        return {nomor: {"status": status, "url_pdf": None} for nomor in daftar_nomor}
+
+def antrekan_unduhan(pengunduh, status_suradi):
+    """Mulai unduh paralel semua surat berstatus "Sudah TTE" yang punya URL PDF."""
+    return {
+        nomor: pengunduh.antrekan(info["url_pdf"], kunci=nomor)
+        for nomor, info in status_suradi.items()
+        if info["status"] == "Sudah TTE" and info["url_pdf"]
+    }
+
+def cek_dan_download_suradi(driver, pengunduh, nomor_surat, max_retry=3, info=None, unduhan=None):
+    """
+    Mengecek dan mendownload surat TTD dari SURADI.
 
-    print(f"🔍 Masih ada {len(ulang_upload)} cuti 2025 tanpa file")
+    `info` adalah hasil `cek_status_suradi` untuk nomor ini; bila None, status dicari
+    sendiri (satu nomor) dengan retry jika error. `unduhan` adalah Future dari
+    `antrekan_unduhan` bila PDF sudah mulai diunduh di latar belakang; bila None,
+    PDF diunduh langsung lewat `pengunduh`.
+    """
+    if info is None:
+        info = cek_status_suradi(driver, [nomor_surat], max_retry)[nomor_surat]
+    status, url_pdf = info["status"], info["url_pdf"]
+
+    if status == "Sudah TTE":
+        if not url_pdf:
+            print("⚠️ Tidak ditemukan tombol download Surat TTD")
+            return None, "Link download tidak ditemukan"
+        try:
+            print(f"✅ Surat TTD ditemukan: {url_pdf}")
+            with fase("download_pdf"):
+                path = unduhan.result() if unduhan is not None else pengunduh.unduh(url_pdf, kunci=nomor_surat)
+            print(f"📄 File disimpan: {path}")
+            return path, "Berhasil didownload"
+        except Exception as e:
+            print(f"⚠️ Gagal download Surat TTD: {e}")
+            return None, f"Gagal download: {e}"
 
-    for surat in ulang_upload:
-        path_file, status = cek_dan_download_suradi(driver_suradi, surat['nomor_surat'])
+    elif status == "Ditolak":
+        print(f"🚫 Nomor surat {nomor_surat} status: Ditolak")
+        return None, "Ditolak"
 
-        if status == "Ditolak":
-            print(f"🚫 Surat {surat['nomor_surat']} tetap ditolak, dilewati")
-            continue
+    elif status == "Diproses":
+        print(f"🟡 Nomor surat {nomor_surat} masih diproses")
+        return None, "Masih Diproses"
 
-        if path_file:
-            try:
-                upload_ke_simpeg(driver, surat['link_edit'], path_file)
-                print("✅ Upload ulang berhasil")
-            except Exception as e:
-                print(f"❌ Gagal upload ulang: {e}")
-        else:
-            print(f"⚠️ Gagal download ulang surat: {status}")
+    elif status == STATUS_TIDAK_DITEMUKAN:
+        print(f"❌ Nomor surat {nomor_surat} tidak ditemukan")
+        return None, status
 
-def cek_dan_download_suradi(driver, nomor_surat, max_retry=3, delay=5):
-    """
-    Mengecek dan mendownload surat TTD dari SURADI dengan retry jika error.
-    """
-    for attempt in range(1, max_retry + 1):
-        try:
-            driver.get("https://suradi.malangkota.go.id/surat_bkpsdm/surat_pengajuan/TJS202206060000083")
-            time.sleep(3)
-
-            # Cari input search
-            search_input = driver.find_element(By.CSS_SELECTOR, "input[type='search']")
-            search_input.clear()
-            search_input.send_keys(nomor_surat)
-            time.sleep(2)
-            search_input.send_keys(Keys.RETURN)
-            time.sleep(2)
-
-            rows = driver.find_elements(By.XPATH, "//table[@id='table_server']//tbody/tr")
-            if not rows:
-                print(f"❌ Nomor surat {nomor_surat} tidak ditemukan")
-                return None, "Nomor surat tidak ditemukan"
-
-            row = rows[0]
-            status_cells = row.find_elements(By.TAG_NAME, "td")
-
-            if any("Sudah TTE" in cell.text for cell in status_cells):
-                try:
-                    link_ttd = row.find_element(By.XPATH, ".//a[contains(text(), 'Surat TTD')]")
-                    url_pdf = link_ttd.get_attribute("href")
-                    print(f"✅ Surat TTD ditemukan: {url_pdf}")
-                    file_name = url_pdf.split("/")[-1]
-                    os.makedirs("hasil_download", exist_ok=True)
-                    path = os.path.join("hasil_download", file_name)
-                    r = requests.get(url_pdf, timeout=10)
-                    with open(path, "wb") as f:
-                        f.write(r.content)
-                    print(f"📄 File disimpan: {path}")
-                    return path, "Berhasil didownload"
-                except Exception as e:
-                    print(f"⚠️ Tidak ditemukan tombol download: {e}")
-                    return None, "Link download tidak ditemukan"
-
-            elif any("Ditolak" in cell.text for cell in status_cells):
-                print(f"🚫 Nomor surat {nomor_surat} status: Ditolak")
-                return None, "Ditolak"
-
-            elif any("Diproses" in cell.text for cell in status_cells):
-                print(f"🟡 Nomor surat {nomor_surat} masih diproses")
-                return None, "Masih Diproses"
+    elif status == STATUS_TIDAK_DIKENALI:
+        print("⚠️ Status tidak dikenali")
+        return None, status
 
-            else:
-                print("⚠️ Status tidak dikenali")
-                return None, "Status tidak dikenali"
-
-        except Exception as e:
-            print(f"⚠️ Error akses SURADI (attempt {attempt}/{max_retry}): {e}")
-            if attempt < max_retry:
-                print(f"🔄 Retry dalam {delay} detik...")
-                time.sleep(delay)
-                delay *= 2  # delay adaptif (5s -> 10s -> 20s)
-            else:
-                return None, f"Error SURADI setelah {max_retry} kali percobaan"
+    else:
+        return None, status
 
 def upload_ke_simpeg(driver, link_edit, file_path):
     """
@@ -185,187 +158,420 @@ def upload_ke_simpeg(driver, link_edit, file_path):
         NoSuchElementException: bila elemen input file atau tombol tidak ditemukan.
     """
 
-    driver.get(link_edit)
-    time.sleep(2)
+    with fase("open_edit_cuti"):
+        driver.get(link_edit)
+        tunggu.tunggu_halaman_siap(driver)
+        penjaga_sesi.periksa(driver)
     upload_input = driver.find_element(By.NAME, "file_surat_cuti")
     upload_input.send_keys(os.path.abspath(file_path))
     print(f"📤 Mengunggah file: {file_path}")
     dash_kota = driver.find_element(By.NAME, "lampiran_kota")
     driver.execute_script("arguments[0].value = arguments[1];",dash_kota, "-")
 
-    wait = WebDriverWait(driver, 10)
-    simpan_btn = wait.until(EC.element_to_be_clickable((By.ID, "submit_button")))
-    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", simpan_btn)
-    time.sleep(0.5)
+    with fase("submit_upload"):
+        wait = WebDriverWait(driver, 10)
+        simpan_btn = wait.until(EC.element_to_be_clickable((By.ID, "submit_button")))
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", simpan_btn)
 
-    try:
-        simpan_btn.click()
-    except Exception as e:
-        print("⚠️ Tombol tidak bisa diklik biasa, pakai JS klik")
-        driver.execute_script("arguments[0].click();", simpan_btn)
-    time.sleep(2)
+        try:
+            simpan_btn.click()
+        except Exception as e:
+            print("⚠️ Tombol tidak bisa diklik biasa, pakai JS klik")
+            driver.execute_script("arguments[0].click();", simpan_btn)
+        tunggu.tunggu_hasil_submit(driver, simpan_btn)
+        penjaga_sesi.periksa(driver)
     print("✅ Upload ke SIMPEG berhasil")
 
-service = Service("C:/Users/HP/Downloads/chromedriver-win64/chromedriver-win64/chromedriver.exe")
-driver = webdriver.Chrome(service=service)
-wait = WebDriverWait(driver, 10)
-
-driver.get("https://simpeg.malangkota.go.id/login")
-driver.find_element(By.ID, "username").send_keys("the-username")
-driver.find_element(By.ID, "password").send_keys("the-password")
-driver.find_element(By.CLASS_NAME, "btn-primary").click()
-time.sleep(2)
-tab_awal = driver.current_window_handle
-
-df = pd.read_excel(r"D:/PKL/2. TUGAS 2/Data_Januari.xlsx")
-driver_suradi = buka_dengan_cookie()
-
-log_list = []
-
-for index, row in df.iterrows():
-    start_time = time.time()
-    nip_raw = row['NIP Baru']
-    nip = str(int(nip_raw)) if isinstance(nip_raw, float) else str(nip_raw)
-    print(f"\n🔍 Proses NIP: {nip}")
-
-    driver.get("https://simpeg.malangkota.go.id/kepegawaian/informasi/pencarian_pegawai")
-    time.sleep(2)
-    nip_input = wait.until(EC.presence_of_element_located((By.NAME, "nip_baru"))) 
-    nip_input.clear() 
-    nip_input.send_keys(nip)
-
-    # Pilih opsi dari dropdown
-    select_dropdown = Select(driver.find_element(By.NAME, "status_aktif"))
-    select_dropdown.select_by_visible_text("Pegawai Aktif dan Non Aktif")
-    time.sleep(2)
-    # Klik tombol 'Cari'
-    cari_button = wait.until(EC.element_to_be_clickable((By.ID, "search_button")))
-    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", cari_button)
-    time.sleep(0.5)
-
+def buat_sesi(id_worker):
+    """Buat satu sesi worker: driver SIMPEG yang sudah login dan driver SURADI dengan cookie."""
+    driver = buat_driver_simpeg(cepat=args.cepat, blokir_css=args.blokir_css)
+    login_simpeg(driver)
+    penjaga_sesi.pasang_simpeg(driver)
     try:
-        cari_button.click()
+        driver_suradi = buka_dengan_cookie(cepat=args.cepat, blokir_css=args.blokir_css)
+        pengunduh = PengunduhPDF(driver_suradi, cache=cache_unduhan)
+        penjaga_sesi.pasang_suradi(driver_suradi, pengunduh)
     except Exception:
-        print("⚠️ Gagal klik biasa, pakai JS click...")
-        driver.execute_script("arguments[0].click();", cari_button)
-
-    time.sleep(4)
-    # Klik tombol Detil (pakai JavaScript supaya pasti)
-    detail_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(@title, 'Detil Data')]")))
-    driver.execute_script("arguments[0].click();", detail_btn)
-    time.sleep(3)
+        driver.quit()
+        raise
+    return {
+        "driver": driver,
+        "wait": WebDriverWait(driver, 10),
+        "driver_suradi": driver_suradi,
+        "unduh": pengunduh,
+    }
+
+def tutup_sesi(sesi):
+    sesi["unduh"].tutup()
+    for d in [sesi["driver"], sesi["driver_suradi"]]:
+        try:
+            d.quit()
+        except Exception:
+            pass
 
-    driver.switch_to.window(driver.window_handles[-1])
-    pegawai_id = driver.current_url.rstrip('/').split("/")[-1]
+def ambil_pegawai_id(driver, nip, segarkan=False):
+    """
+    pegawai_id dari jurnal (run sebelumnya) atau cache/pencarian, lalu dicatat ke jurnal.
+    `segarkan=True` mengabaikan jurnal dan cache, lalu mencari ulang lewat browser.
+    """
+    catatan_id = jurnal.terakhir(nip, "pegawai_id")
+    if not segarkan and catatan_id is not None and catatan_id["status"] == "ok":
+        return catatan_id["pegawai_id"]
+    pegawai_id = cari_pegawai_id(driver, nip, cache_pegawai, halaman="pencarian_pegawai", segarkan=segarkan)
+    jurnal.catat(nip, "pegawai_id", "ok", pegawai_id=pegawai_id)
+    return pegawai_id
+
+def pindai_cuti(driver, pegawai_id):
+    """Kumpulkan baris cuti dalam periode dari tab disiplin: tanggal, nomor surat, link edit, ada file."""
+    with fase("scan_cuti"):
+        driver.get(f"{URL_SIMPEG}/kepegawaian/informasi/daftar_pegawai/detail_pegawai/{pegawai_id}/tab_disiplin")
+        tunggu.tunggu_halaman_siap(driver)
+        penjaga_sesi.periksa(driver)
+        periksa_halaman_pegawai(driver, pegawai_id)
+        tunggu.tunggu_tabel_selesai(driver, "datatable_cuti")
+
+        # Semua baris periode dibaca sekaligus; filter tahun ikut dikirim ke request DataTables
+        baris_cuti = baca_cuti(driver, dari=DARI, sampai=SAMPAI)
+    print(f"📋 Total cuti {PERIODE}: {len(baris_cuti)}")
+    return baris_cuti
+
+def pindai_pegawai(driver, nip):
+    """
+    pegawai_id dan baris cuti periode satu NIP. Bila halaman pegawai dengan id dari
+    jurnal/cache tidak ada lagi, id lama dibuang dan dicari ulang sekali lewat browser.
+    """
+    pegawai_id = ambil_pegawai_id(driver, nip)
     print(f"✅ ID Pegawai: {pegawai_id}")
+    try:
+        return pegawai_id, pindai_cuti(driver, pegawai_id)
+    except PegawaiTidakDitemukan as e:
+        print(f"⚠️ {e}, cari ulang ID Pegawai {nip}")
+    pegawai_id = ambil_pegawai_id(driver, nip, segarkan=True)
+    print(f"✅ ID Pegawai: {pegawai_id}")
+    return pegawai_id, pindai_cuti(driver, pegawai_id)
+
+# Status upload yang berarti surat sudah beres di SIMPEG
+STATUS_BERHASIL = ("Sudah Ada File", "Sukses Upload")
+
+def catat_surat(nip, surat, status_upload):
+    """Buat entri log satu surat dan catat hasilnya ke jurnal."""
+    entri = {
+        'NIP': nip,
+        'Tanggal Surat': surat['tanggal'],
+        'Nomor Surat': surat['nomor_surat'],
+        'Status': status_upload
+    }
+    berhasil = status_upload in STATUS_BERHASIL
+    jurnal.catat(nip, "upload", "ok" if berhasil else "gagal", kunci=surat['nomor_surat'], log=[entri])
+    return entri
+
+def unggah_surat(driver, surat, path_file, status):
+    """Upload PDF hasil unduhan ke halaman edit cuti; kembalikan status upload untuk log."""
+    try:
+        if path_file:
+            # Sesi SIMPEG yang habis saat membuka form atau submit: login ulang, upload diulang
+            penjaga_sesi.jalankan(driver, upload_ke_simpeg, driver, surat['link_edit'], path_file)
+            return "Sukses Upload"
+        print(f"⚠️ Gagal download: {status}")
+        return f"Gagal: {status}"
+    except Exception as e:
+        print(f"❌ Error upload: {str(e)}")
+        return f"Error: {str(e)}"
 
-    driver.get(f"https://simpeg.malangkota.go.id/kepegawaian/informasi/daftar_pegawai/detail_pegawai/{pegawai_id}/tab_disiplin")
-    time.sleep(4)
-
-    baris_cuti_2025 = []
-
-    while True:
-        rows = driver.find_elements(By.XPATH, "//table[@id='datatable_cuti']//tbody/tr")
-        ada_2025_di_halaman_ini = False
-
-        for row in rows:
-            tds = row.find_elements(By.TAG_NAME, "td")
-            if len(tds) < 8:
-                continue
-            tanggal = tds[2].text.strip()
-            tahun = tanggal.split("-")[-1]
-            if tahun != "2025":
-                continue
-
-            ada_2025_di_halaman_ini = True  
-
-            nomor_surat = tds[3].text.strip()
-            td_file = tds[7]
-            ada_file = bool(td_file.find_elements(By.TAG_NAME, "a"))
+# Upload yang dicoba di run ini (nip → pegawai_id + surat beserta path PDF-nya),
+# diverifikasi sekaligus setelah semua NIP selesai
+upload_dicoba = {}
+kunci_upload_dicoba = threading.Lock()
 
-            td_opsi = tds[8]
-            link_edit = td_opsi.find_element(By.XPATH, ".//a[contains(@href, 'edit_cuti')]").get_attribute("href")
+def catat_upload_dicoba(nip, pegawai_id, surat, path_file):
+    with kunci_upload_dicoba:
+        data = upload_dicoba.setdefault(nip, {"pegawai_id": pegawai_id, "surat": []})
+        data["surat"].append({**surat, "path_file": path_file})
 
-            baris_cuti_2025.append({
-                'tanggal': tanggal,
-                'nomor_surat': nomor_surat,
-                'link_edit': link_edit,
-                'ada_file': ada_file
-            })
+def verifikasi_upload(sesi, item, log_list):
+    """
+    Verifikasi upload yang dicoba di run ini untuk satu NIP, lalu upload ulang yang belum
+    tercatat di SIMPEG.
 
-        if not ada_2025_di_halaman_ini:
-            break  # halaman ini gak ada 2025, langsung stop, hemat waktu
+    Hanya surat yang benar-benar dicoba diunggah yang diperiksa (surat "Ditolak" atau
+    "Masih Diproses" tidak pernah masuk daftar, jadi tidak ditanyakan lagi ke SURADI).
+    PDF hasil unduhan run ini dipakai ulang; SURADI hanya ditanya bila file lokal hilang.
+    Surat yang tetap gagal membuat NIP dicatat "gagal" agar diulang saat --resume.
+    """
+    nip, dicoba = item
+    driver, driver_suradi, pengunduh = sesi["driver"], sesi["driver_suradi"], sesi["unduh"]
+    pegawai_id = dicoba["pegawai_id"]
+    print(f"\n🔁 Verifikasi {len(dicoba['surat'])} upload NIP {nip} (ID Pegawai: {pegawai_id})")
+    simpeg = pengendali_host.pengendali("SIMPEG")
+    with simpeg.izin("verifikasi"), fase("verify_scan"):
+        driver.get(f"{URL_SIMPEG}/kepegawaian/informasi/daftar_pegawai/detail_pegawai/{pegawai_id}/tab_disiplin")
+        tunggu.tunggu_halaman_siap(driver)
+        penjaga_sesi.periksa(driver)
+        tunggu.tunggu_tabel_selesai(driver, "datatable_cuti")
+
+        di_tabel = {b['nomor_surat']: b for b in baca_cuti(driver, dari=DARI, sampai=SAMPAI)}
+    ulang_upload = [s for s in dicoba["surat"] if not di_tabel.get(s['nomor_surat'], {}).get('ada_file')]
+    if not ulang_upload:
+        print("✅ Semua upload sudah tercatat di SIMPEG")
+        return
+    print(f"🔍 Masih ada {len(ulang_upload)} upload yang belum tercatat")
+
+    perlu_suradi = [s['nomor_surat'] for s in ulang_upload if not os.path.exists(s['path_file'])]
+    status_suradi = cek_status_suradi(driver_suradi, perlu_suradi) if perlu_suradi else {}
+
+    gagal = False
+    for surat in ulang_upload:
+        nomor = surat['nomor_surat']
+        if nomor in status_suradi:
+            path_file, status = cek_dan_download_suradi(driver_suradi, pengunduh, nomor, info=status_suradi[nomor])
+        else:
+            path_file, status = surat['path_file'], "Berhasil didownload"
+        link_edit = di_tabel.get(nomor, {}).get('link_edit') or surat['link_edit']
+        with simpeg.izin("unggah"):
+            status_upload = unggah_surat(driver, {**surat, 'link_edit': link_edit}, path_file, status)
+        if status_upload == "Sukses Upload":
+            print("✅ Upload ulang berhasil")
+        else:
+            gagal = True
+        log_list.append(catat_surat(nip, surat, status_upload))
+    if gagal:
+        jurnal.catat(nip, "nip", "gagal")
 
-        try:
-            next_button = driver.find_element(By.CSS_SELECTOR, "#datatable_cuti_paginate a.paginate_button.next:not(.disabled)")
-            driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-            time.sleep(0.5)
-            next_button.click()
-            time.sleep(1.5)
-        except:
-            break  # tidak ada tombol next, selesai
+def proses_nip(sesi, nip, log_list):
+    """
+    Cek semua cuti dalam periode satu NIP, download surat yang belum ada file-nya dari SURADI lalu upload.
 
-    print(f"📋 Total cuti 2025: {len(baris_cuti_2025)}")
+    Setiap langkah dicatat ke jurnal: pegawai_id, tiap nomor surat ("upload"), dan NIP
+    selesai ("nip"). NIP hanya dicatat "ok" bila semua suratnya beres; surat yang gagal,
+    ditolak, atau masih diproses di SURADI membuat NIP dicatat "gagal" agar diulang saat
+    --resume. Dengan --resume, NIP yang sudah selesai dan surat yang sudah terunggah
+    dilewati. Surat yang diunggah dicatat untuk `verifikasi_upload` di akhir run.
+    """
+    driver, driver_suradi, pengunduh = sesi["driver"], sesi["driver_suradi"], sesi["unduh"]
+    if jurnal.sudah_selesai(nip, "nip"):
+        print(f"\n⏭️ NIP {nip} sudah selesai di run sebelumnya, dilewati")
+        return
+    start_time = time.time()
+    print(f"\n🔍 Proses NIP: {nip}")
 
-    for surat in baris_cuti_2025:
+    # Izin SIMPEG hanya dipegang selama langkah SIMPEG; cek & unduh SURADI di antaranya
+    # memakai pengendali SURADI sendiri
+    simpeg = pengendali_host.pengendali("SIMPEG")
+    with simpeg.izin("pindai"):
+        pegawai_id, baris_cuti = pindai_pegawai(driver, nip)
+
+    # Status semua surat tanpa file dicek sekaligus di SURADI (bukan satu per satu)
+    belum_ada_file = [
+        s['nomor_surat'] for s in baris_cuti
+        if not s['ada_file'] and not jurnal.sudah_selesai(nip, "upload", s['nomor_surat'])
+    ]
+    status_suradi = cek_status_suradi(driver_suradi, belum_ada_file)
+    # PDF yang sudah TTE langsung diunduh paralel di latar belakang selama browser mengunggah
+    unduhan = antrekan_unduhan(pengunduh, status_suradi)
+
+    semua_berhasil = True
+    for surat in baris_cuti:
         print(f"📄 Nomor surat: {surat['nomor_surat']} | Ada file: {'✅ Ya' if surat['ada_file'] else '❌ Tidak'}")
 
+        if jurnal.sudah_selesai(nip, "upload", surat['nomor_surat']):
+            print("⏭️ Surat ini sudah diunggah di run sebelumnya")
+            continue
+
         if surat['ada_file']:
             status_upload = "Sudah Ada File"
         else:
             try:
-                path_file, status = cek_dan_download_suradi(driver_suradi, surat['nomor_surat'])
+                path_file, status = cek_dan_download_suradi(
+                    driver_suradi, pengunduh, surat['nomor_surat'],
+                    info=status_suradi[surat['nomor_surat']], unduhan=unduhan.get(surat['nomor_surat'])
+                )
+                with simpeg.izin("unggah"):
+                    status_upload = unggah_surat(driver, surat, path_file, status)
                 if path_file:
-                    upload_ke_simpeg(driver, surat['link_edit'], path_file)
-                    status_upload = "Sukses Upload"
-                else:
-                    print(f"⚠️ Gagal download: {status}")
-                    status_upload = f"Gagal: {status}"
+                    catat_upload_dicoba(nip, pegawai_id, surat, path_file)
             except Exception as e:
                 print(f"❌ Error upload: {str(e)}")
                 status_upload = f"Error: {str(e)}"
 
-        log_list.append({
-            'NIP': nip,
-            'Tanggal Surat': surat['tanggal'],
-            'Nomor Surat': surat['nomor_surat'],
-            'Status': status_upload
-        })
+        semua_berhasil = semua_berhasil and status_upload in STATUS_BERHASIL
+        log_list.append(catat_surat(nip, surat, status_upload))
     end_time = time.time()  # waktu selesai
     durasi = end_time - start_time
     print(f"⏱️ Durasi NIP {nip}: {durasi:.2f} detik")
-    driver.close()
-    driver.switch_to.window(tab_awal)
-    verifikasi_dan_upload_ulang(driver, driver_suradi, pegawai_id, nip)
+    jurnal.catat(nip, "nip", "ok" if semua_berhasil else "gagal")
+
+def catat_error(nip, e):
+    """Error tidak tertangani: dicatat ke jurnal agar NIP ini diulang saat --resume."""
+    entri = {'NIP': nip, 'Tanggal Surat': '', 'Nomor Surat': '', 'Status': f"Error: {e}"}
+    jurnal.catat(nip, "nip", "gagal", log=[entri])
+    return entri
 
+def jalankan_mode_pipeline(daftar_nip):
+    """
+    Mode --pipeline: tiga tahap berjalan bersamaan, dihubungkan antrean terbatas.
+
+    1. pindai  (driver SIMPEG): pegawai_id + tabel cuti periode → paket surat tanpa file per NIP
+    2. suradi  (driver SURADI): cek status massal + unduh paralel → satu tugas upload per surat
+    3. unggah  (driver SIMPEG terpisah): upload ke halaman edit cuti
+
+    Setiap tahap memakai `--workers` thread, masing-masing dengan browser sendiri.
+    NIP dicatat di jurnal setelah surat terakhirnya diproses tahap unggah: "ok" hanya
+    bila semua suratnya beres, selain itu "gagal" agar diulang saat --resume.
+    Upload yang dicoba diverifikasi bersama mode biasa di akhir run.
+
+    Returns:
+        list[dict]: statistik per tahap.
+    """
+    sisa_surat = {}  # nip → jumlah surat yang belum selesai di tahap unggah
+    ada_gagal = set()  # NIP yang punya surat gagal / belum bisa diunggah
+    kunci_sisa = threading.Lock()
+
+    def surat_selesai(nip, berhasil):
+        with kunci_sisa:
+            sisa_surat[nip] -= 1
+            if not berhasil:
+                ada_gagal.add(nip)
+            habis = sisa_surat[nip] == 0
+            gagal = nip in ada_gagal
+        if habis:
+            jurnal.catat(nip, "nip", "gagal" if gagal else "ok")
+            print(f"🏁 NIP {nip} selesai" + (" (ada surat yang belum beres)" if gagal else ""))
+
+    def buat_simpeg(id_thread):
+        driver = buat_driver_simpeg(cepat=args.cepat, blokir_css=args.blokir_css)
+        try:
+            login_simpeg(driver)
+        except Exception:
+            driver.quit()
+            raise
+        penjaga_sesi.pasang_simpeg(driver)
+        return driver
+
+    def buat_suradi(id_thread):
+        driver_suradi = buka_dengan_cookie(cepat=args.cepat, blokir_css=args.blokir_css)
+        pengunduh = PengunduhPDF(driver_suradi, cache=cache_unduhan)
+        penjaga_sesi.pasang_suradi(driver_suradi, pengunduh)
+        return {"driver": driver_suradi, "unduh": pengunduh}
+
+    def tutup_suradi(sesi):
+        sesi["unduh"].tutup()
+        sesi["driver"].quit()
+
+    def pindai(driver, nip, kirim):
+        if jurnal.sudah_selesai(nip, "nip"):
+            print(f"⏭️ NIP {nip} sudah selesai di run sebelumnya, dilewati")
+            return
+        print(f"🔍 [pindai] NIP: {nip}")
+        pegawai_id, baris_cuti = pindai_pegawai(driver, nip)
+        perlu = []
+        for surat in baris_cuti:
+            if jurnal.sudah_selesai(nip, "upload", surat['nomor_surat']):
+                continue
+            if surat['ada_file']:
+                catat_surat(nip, surat, "Sudah Ada File")
+            else:
+                perlu.append(surat)
+        if not perlu:
+            jurnal.catat(nip, "nip", "ok")
+            return
+        with kunci_sisa:
+            sisa_surat[nip] = len(perlu)
+        kirim({"nip": nip, "pegawai_id": pegawai_id, "surat": perlu})
+
+    def cari_suradi(sesi, paket, kirim):
+        status_suradi = cek_status_suradi(sesi["driver"], [s['nomor_surat'] for s in paket["surat"]])
+        unduhan = antrekan_unduhan(sesi["unduh"], status_suradi)
+        for surat in paket["surat"]:
+            try:
+                path_file, status = cek_dan_download_suradi(
+                    sesi["driver"], sesi["unduh"], surat['nomor_surat'],
+                    info=status_suradi[surat['nomor_surat']], unduhan=unduhan.get(surat['nomor_surat'])
+                )
+            except Exception as e:
+                path_file, status = None, f"Error: {str(e)}"
+            kirim({
+                "nip": paket["nip"], "pegawai_id": paket["pegawai_id"],
+                "surat": surat, "path_file": path_file, "status": status,
+            })
+
+    def unggah(driver, tugas, kirim):
+        print(f"📤 [unggah] NIP {tugas['nip']} surat {tugas['surat']['nomor_surat']}")
+        status_upload = unggah_surat(driver, tugas["surat"], tugas["path_file"], tugas["status"])
+        if tugas["path_file"]:
+            catat_upload_dicoba(tugas["nip"], tugas["pegawai_id"], tugas["surat"], tugas["path_file"])
+        catat_surat(tugas["nip"], tugas["surat"], status_upload)
+        surat_selesai(tugas["nip"], status_upload in STATUS_BERHASIL)
+
+    def gagal_suradi(paket, e):
+        for surat in paket["surat"]:
+            catat_surat(paket["nip"], surat, f"Error: {e}")
+            surat_selesai(paket["nip"], False)
+
+    def gagal_unggah(tugas, e):
+        catat_surat(tugas["nip"], tugas["surat"], f"Error: {e}")
+        surat_selesai(tugas["nip"], False)
+
+    # Tahap pindai dan unggah berbagi satu batas konkurensi adaptif SIMPEG
+    simpeg = pengendali_host.pengendali("SIMPEG")
+    return jalankan_pipeline(daftar_nip, [
+        Tahap("pindai", per_item(penjaga_sesi.dengan_pemulihan(pindai, lambda d: d), "pindai"), args.workers,
+              buat_simpeg, lambda d: d.quit(), catat_error, pengendali=simpeg),
+        # Tahap suradi tidak diberi izin di sini: cek_status_suradi sudah memakai pengendali SURADI
+        Tahap("suradi", per_item(cari_suradi, "suradi", lambda paket: paket["nip"]), args.workers,
+              buat_suradi, tutup_suradi, gagal_suradi),
+        Tahap("unggah", per_item(unggah, "unggah", lambda tugas: tugas["nip"]), args.workers,
+              buat_simpeg, lambda d: d.quit(), gagal_unggah, pengendali=simpeg),
+    ])
+
+cache_pegawai = CachePegawai()
+cache_unduhan = CacheUnduhan()
+cache_unduhan.bersihkan()
+jurnal = Jurnal("jurnal_tugas2.jsonl", lanjut=args.resume)
+# NIP dibaca bertahap (xlsx/csv/parquet) selagi worker sudah berjalan; urutannya dicatat
+# untuk menyusun laporan
+daftar_nip = []
+
+def nip_bertahap():
+    for nip in baca_nip(args.excel):
+        daftar_nip.append(nip)
+        yield nip
+
+# Laporan per NIP ditulis ulang berkala selama run (tetap ada bila run berhenti di tengah)
 os.makedirs("log", exist_ok=True)
 timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 log_filename = f"log/log_upload_cutian_{timestamp}.xlsx"
-log_df = pd.DataFrame(log_list)
-log_df_cleaned = log_df.copy()
-
-log_df_cleaned['No'] = ''
-log_df_cleaned['Total Surat 2025'] = ''
-no = 1
-last_nip = None
-jumlah_surat_per_nip = log_df_cleaned.groupby('NIP').size().to_dict()
-
-for i, row in log_df_cleaned.iterrows():
-    nip = row['NIP']
-    if nip and nip != last_nip:
-        log_df_cleaned.at[i, 'No'] = no
-        log_df_cleaned.at[i, 'Total Surat 2025'] = jumlah_surat_per_nip[nip]
-        last_nip = nip
-        no += 1
-    else:
-        log_df_cleaned.at[i, 'NIP'] = ''
-
-log_df_cleaned = log_df_cleaned[['No', 'NIP', 'Total Surat 2025', 'Tanggal Surat', 'Nomor Surat', 'Status']]
-log_df_cleaned.to_excel(log_filename, index=False)
+kolom_total = f"Total Surat {PERIODE}"
+laporan_cuti = LaporanBerkala(
+    log_filename, jurnal,
+    lambda entri: susun_laporan(entri, ['Tanggal Surat', 'Nomor Surat', 'Status'], kolom_total),
+    urutan_nip=daftar_nip,
+)
+
+if args.pipeline:
+    jalankan_mode_pipeline(nip_bertahap())
+else:
+    # NIP yang terhenti karena sesi SIMPEG habis diulang setelah login ulang otomatis;
+    # surat yang sudah terunggah dilewati lewat jurnal. Izin SIMPEG diambil per langkah
+    # SIMPEG di dalam proses_nip, bukan per NIP, agar latensi SURADI tidak ikut terhitung
+    jalankan_pool(nip_bertahap(), args.workers, buat_sesi, per_item(penjaga_sesi.dengan_pemulihan(proses_nip), "proses"),
+                  tutup_sesi, saat_error=catat_error)
+
+# Verifikasi hanya upload yang dicoba di run ini, sekaligus setelah semua NIP selesai
+if upload_dicoba:
+    print(f"\n🔁 Verifikasi {sum(len(d['surat']) for d in upload_dicoba.values())} upload di {len(upload_dicoba)} NIP")
+    jalankan_pool(
+        list(upload_dicoba.items()), args.workers, buat_sesi,
+        per_item(penjaga_sesi.dengan_pemulihan(verifikasi_upload), "verifikasi", lambda item: item[0]), tutup_sesi,
+        saat_error=lambda item, e: catat_error(item[0], e),
+    )
+# Laporan akhir disusun dari jurnal (termasuk run sebelumnya bila --resume), urut sesuai sheet
+laporan_cuti.tulis()
+jurnal.tutup()
 
 print(f"✅ Semua NIP selesai diproses dan hasil dicatat di {log_filename}")
-for d in [driver, driver_suradi]:
-    try:
-        d.quit()
-    except Exception:
-        pass
+simpan_laporan(f"log/performa_{timestamp}")
+pengendali_host.cetak_ringkasan()
+if hitung_perintah.aktif():
+    hitung_perintah.simpan_laporan(f"log/perintah_{timestamp}")
+cache_pegawai.tutup()
+cache_unduhan.tutup()
@@ -0,0 +1,140 @@
+"""
+Pembaca file masukan (Excel/CSV/Parquet) secara bertahap, tanpa memuat seluruh isi ke memori.
+
+`pd.read_excel` memuat seluruh workbook sebelum baris pertama bisa diproses; untuk
+batch tahunan (semua pegawai, semua cuti) itu berarti menunggu beberapa menit.
+Modul ini membaca baris secara malas:
+- .xlsx / .xlsm: openpyxl mode read-only (`values_only`), baris dibaca langsung dari XML,
+- .csv: `pd.read_csv` per potongan (`chunksize`), semua kolom sebagai teks,
+- .parquet: `pyarrow.parquet.ParquetFile.iter_batches` (pyarrow opsional),
+- format lain (misalnya .xls): `pd.read_excel` biasa sebagai satu potongan.
+
+`baca_potongan` menghasilkan DataFrame kecil (untuk normalisasi per kolom seperti
+`rencana_kerja`), `baca_baris` menghasilkan tuple ringan per baris, dan `baca_nip`
+menghasilkan NIP bersih per baris.
+"""
+
+from datetime import date, datetime
+from pathlib import Path
+
+import pandas as pd
+
+UKURAN_POTONGAN = 500
+
+
+def teks(nilai):
+    """
+    Ubah nilai sel menjadi teks bersih: None/NaN → "", angka bulat tanpa ".0",
+    tanggal → "YYYY-MM-DD".
+    """
+    if nilai is None or (isinstance(nilai, float) and nilai != nilai):
+        return ""
+    if isinstance(nilai, bool):
+        return str(nilai)
+    if isinstance(nilai, float) and nilai.is_integer():
+        return str(int(nilai))
+    if isinstance(nilai, (datetime, date)):
+        return nilai.strftime("%Y-%m-%d")
+    nilai = str(nilai).strip()
+    return nilai[:-2] if nilai.endswith(".0") and nilai[:-2].isdigit() else nilai
+
+
+def _potongan_xlsx(path, kolom, ukuran):
+    from openpyxl import load_workbook
+
+    buku = load_workbook(path, read_only=True, data_only=True)
+    try:
+        baris_iter = buku.worksheets[0].iter_rows(values_only=True)
+        header = next(baris_iter, None)
+        if header is None:
+            return
+        header = [str(h).strip() if h is not None else f"Unnamed: {i}" for i, h in enumerate(header)]
+        posisi = [header.index(k) for k in kolom if k in header] if kolom else list(range(len(header)))
+        nama = [header[i] for i in posisi]
+        kumpulan = []
+        for baris in baris_iter:
+            # Mode read-only sering menghasilkan baris kosong berformat di akhir sheet
+            if not any(v is not None and v != "" for v in baris):
+                continue
+            kumpulan.append([baris[i] if i < len(baris) else None for i in posisi])
+            if len(kumpulan) >= ukuran:
+                yield pd.DataFrame(kumpulan, columns=nama, dtype=object)
+                kumpulan = []
+        if kumpulan:
+            yield pd.DataFrame(kumpulan, columns=nama, dtype=object)
+    finally:
+        buku.close()
+
+
+def _potongan_csv(path, kolom, ukuran):
+    pakai = (lambda k: k.strip() in kolom) if kolom else None
+    for df in pd.read_csv(path, dtype=str, keep_default_na=False, usecols=pakai, chunksize=ukuran):
+        yield df.rename(columns=str.strip)
+
+
+def _potongan_parquet(path, kolom, ukuran):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("membaca .parquet secara bertahap membutuhkan pyarrow (pip install pyarrow)") from e
+    berkas = pq.ParquetFile(path)
+    ada = [k for k in kolom if k in berkas.schema_arrow.names] if kolom else None
+    for batch in berkas.iter_batches(batch_size=ukuran, columns=ada):
+        yield batch.to_pandas()
+
+
+def baca_potongan(path, kolom=None, ukuran=UKURAN_POTONGAN):
+    """
+    Baca file masukan per potongan.
+
+    Args:
+        path: file .xlsx/.xlsm/.csv/.parquet (format lain dibaca utuh lewat `pd.read_excel`).
+        kolom (list[str], optional): kolom yang diambil; kolom yang tidak ada di file
+            diabaikan. None = semua kolom.
+        ukuran (int): jumlah baris per potongan.
+
+    Yields:
+        pd.DataFrame: paling banyak `ukuran` baris, nilai sel apa adanya (teks, angka,
+        datetime; CSV selalu teks).
+    """
+    path = Path(path)
+    akhiran = path.suffix.lower()
+    if akhiran in (".xlsx", ".xlsm"):
+        yield from _potongan_xlsx(path, kolom, ukuran)
+    elif akhiran == ".csv":
+        yield from _potongan_csv(path, kolom, ukuran)
+    elif akhiran == ".parquet":
+        yield from _potongan_parquet(path, kolom, ukuran)
+    else:
+        df = pd.read_excel(path)
+        yield df[[k for k in kolom if k in df.columns]] if kolom else df
+
+
+def baca_baris(path, kolom, ukuran=UKURAN_POTONGAN):
+    """
+    Baca file masukan baris per baris.
+
+    Yields:
+        tuple: nilai `kolom` (urutan sama) untuk satu baris; kolom yang tidak ada → None.
+    """
+    for df in baca_potongan(path, kolom, ukuran):
+        # reindex mengisi kolom yang hilang dengan NaN; dijadikan None sesuai kontrak
+        df = df.reindex(columns=kolom).astype(object)
+        yield from df.where(df.notna(), None).itertuples(index=False, name=None)
+
+
+def baca_nip(path, kolom="NIP Baru", ukuran=UKURAN_POTONGAN):
+    """
+    Baca kolom NIP baris per baris sebagai teks bersih (tanpa ".0", tanpa spasi).
+    Sel NIP kosong dilewati.
+
+    Raises:
+        KeyError: bila kolom NIP tidak ada di file.
+    """
+    for df in baca_potongan(path, [kolom], ukuran):
+        if kolom not in df.columns:
+            raise KeyError(f"kolom '{kolom}' tidak ada di {path}")
+        for nilai in df[kolom]:
+            nip = teks(nilai)
+            if nip:
+                yield nip
@@ -0,0 +1,202 @@
+"""
+Benchmark end-to-end Tugas1.py dan Tugas2.py terhadap server tiruan lokal.
+
+Untuk setiap skrip dan ukuran data (bawaan 10, 100, 1000 baris):
+1. Buat Excel sintetis (dan folder PDF SPMT untuk Tugas1) di `bench/<waktu>/<skrip>_<n>/`.
+2. Jalankan server SIMPEG & SURADI tiruan baru (`server_tiruan`) dengan latensi/galat
+   yang diminta, di port acak.
+3. Jalankan skrip sebagai subprocess dengan SIMPEG_URL / SURADI_URL / SURADI_COOKIE
+   diarahkan ke server tiruan, cwd di folder run (jurnal, cache, log terpisah per run).
+4. Ukur waktu total, lalu baca laporan `profil_waktu` yang ditulis skrip.
+
+Hasil: `bench/<waktu>/hasil.csv` dan `hasil.json` (baris/jam per skrip & ukuran, plus
+p50/p95 fase terlama), dan ringkasannya dicetak di akhir.
+
+Contoh:
+    python benchmark.py --ukuran 10 100 --latensi 0.05 --workers 2 -- --cepat
+Argumen setelah `--` diteruskan ke kedua skrip.
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+import server_tiruan
+from server_tiruan import Konfigurasi, jalankan_server, tulis_cookie_suradi
+
+FOLDER_REPO = Path(__file__).resolve().parent
+FOLDER_BENCH = "bench"
+UKURAN = [10, 100, 1000]
+SKRIP = ["Tugas1", "Tugas2"]
+
+
+def nip_sintetis(i):
+    return f"199001{i:08d}1001"
+
+
+def buat_excel_tugas1(path, n, folder_spmt):
+    """Excel data_jabatan sintetis `n` baris + satu PDF SPMT per baris di `folder_spmt`."""
+    os.makedirs(folder_spmt, exist_ok=True)
+    daftar_unor = [
+        f"{sub} {unit} {skpd}".title()
+        for skpd, units in server_tiruan.UNOR.items()
+        for unit, subs in units.items()
+        for sub in subs
+    ]
+    pdf = server_tiruan._pdf("SPMT tiruan")
+    baris = []
+    for i in range(1, n + 1):
+        jenis = server_tiruan.JENIS_JABATAN[i % len(server_tiruan.JENIS_JABATAN)]
+        kode = f"K{i:05d}"
+        tanggal = date(2024, 1, 1) + timedelta(days=i % 300)
+        with open(os.path.join(folder_spmt, f"SPMT_PPPK_T1_{i}_{kode}_TTE.pdf"), "wb") as f:
+            f.write(pdf)
+        baris.append({
+            "NIP Baru": nip_sintetis(i),
+            "Tahun Lulus": str(2010 + i % 12),
+            "No. Ijazah": f"IJZ/{i:06d}",
+            "Tanggal Ijazah": date(2010 + i % 12, 7, 1 + i % 28).strftime("%d-%m-%Y"),
+            "Kepala Sekolah": f"Kepala {i}",
+            "Jurusan": server_tiruan.JURUSAN_EXCEL[i % len(server_tiruan.JURUSAN_EXCEL)],
+            "Lembaga": server_tiruan.LEMBAGA[i % len(server_tiruan.LEMBAGA)],
+            "No.SPMT": f"800/{kode}/35.73.403/2024",
+            "Tanggal SPMT": tanggal.strftime("%d-%m-%Y"),
+            "TMT SPMT": (tanggal + timedelta(days=30)).strftime("%d-%m-%Y"),
+            "JENIS JABATAN NAMA": f"Jabatan {jenis.title()}",
+            "JABATAN NAMA": server_tiruan.JABATAN[jenis][i % len(server_tiruan.JABATAN[jenis])].title(),
+            "Unor": daftar_unor[i % len(daftar_unor)],
+        })
+    pd.DataFrame(baris).to_excel(path, index=False)
+    return path
+
+
+def buat_excel_tugas2(path, n):
+    """Excel daftar NIP sintetis (kolom 'NIP Baru') `n` baris."""
+    pd.DataFrame({"NIP Baru": [nip_sintetis(i) for i in range(1, n + 1)]}).to_excel(path, index=False)
+    return path
+
+
+def _baca_performa(folder, skrip):
+    pola = "performa_tugas1_*.json" if skrip == "Tugas1" else os.path.join("log", "performa_*.json")
+    daftar = sorted(glob.glob(os.path.join(folder, pola)))
+    if not daftar:
+        return None
+    with open(daftar[-1], encoding="utf-8") as f:
+        return json.load(f)
+
+
+def jalankan_satu(skrip, n, folder_run, konfigurasi, workers, argumen_tambahan, batas_waktu):
+    """
+    Jalankan satu skrip untuk `n` baris terhadap server tiruan baru.
+
+    Returns:
+        dict: satu baris hasil benchmark.
+    """
+    os.makedirs(folder_run, exist_ok=True)
+    excel = os.path.join(folder_run, "data.xlsx")
+    perintah = [sys.executable, str(FOLDER_REPO / f"{skrip}.py"), "--excel", excel, "--workers", str(workers)]
+    if skrip == "Tugas1":
+        folder_spmt = os.path.join(folder_run, "spmt")
+        buat_excel_tugas1(excel, n, folder_spmt)
+        perintah += ["--folder-spmt", folder_spmt]
+    else:
+        buat_excel_tugas2(excel, n)
+        perintah += ["--tahun", str(konfigurasi.tahun)]
+    perintah += argumen_tambahan
+
+    data, hentikan, env_server = jalankan_server(konfigurasi, port_simpeg=0, port_suradi=0)
+    env = {
+        **os.environ,
+        **env_server,
+        "SURADI_COOKIE": os.path.abspath(tulis_cookie_suradi(os.path.join(folder_run, "cookie.json"))),
+        "PYTHONIOENCODING": "utf-8",
+    }
+    print(f"▶️ {skrip} {n} baris → {folder_run}")
+    awal = time.monotonic()
+    try:
+        with open(os.path.join(folder_run, "output.txt"), "w", encoding="utf-8") as keluaran:
+            proses = subprocess.run(perintah, cwd=folder_run, env=env, stdout=keluaran,
+                                    stderr=subprocess.STDOUT, timeout=batas_waktu)
+        kode_keluar = proses.returncode
+    except subprocess.TimeoutExpired:
+        kode_keluar = "timeout"
+    finally:
+        durasi = time.monotonic() - awal
+        hentikan()
+
+    performa = _baca_performa(folder_run, skrip) or {}
+    fase_terlama = performa.get("fase", [{}])[0] if performa.get("fase") else {}
+    hasil = {
+        "skrip": skrip,
+        "baris": n,
+        "workers": workers,
+        "kode_keluar": kode_keluar,
+        "durasi": round(durasi, 1),
+        "baris_per_jam": round(n / durasi * 3600, 1) if durasi else 0.0,
+        "baris_per_jam_fase": performa.get("baris_per_jam"),
+        "fase_terlama": fase_terlama.get("fase"),
+        "p50_fase_terlama": fase_terlama.get("p50"),
+        "p95_fase_terlama": fase_terlama.get("p95"),
+        **{f"server_{k}": v for k, v in data.statistik.items()},
+    }
+    status = "✅" if kode_keluar == 0 else "❌"
+    print(f"{status} {skrip} {n} baris: {hasil['durasi']} detik ({hasil['baris_per_jam']} baris/jam), "
+          f"keluar {kode_keluar}")
+    return hasil
+
+
+def simpan_hasil(folder, hasil):
+    path_csv, path_json = os.path.join(folder, "hasil.csv"), os.path.join(folder, "hasil.json")
+    with open(path_csv, "w", newline="", encoding="utf-8") as f:
+        penulis = csv.DictWriter(f, fieldnames=list(hasil[0]))
+        penulis.writeheader()
+        penulis.writerows(hasil)
+    with open(path_json, "w", encoding="utf-8") as f:
+        json.dump({"dibuat": datetime.now().isoformat(timespec="seconds"), "hasil": hasil}, f,
+                  ensure_ascii=False, indent=2)
+
+    print("\n📊 Hasil benchmark:")
+    print(f"   {'skrip':<8} {'baris':>6} {'durasi':>9} {'baris/jam':>11}  fase terlama (p50/p95)")
+    for r in hasil:
+        fase_info = f"{r['fase_terlama']} ({r['p50_fase_terlama']}s/{r['p95_fase_terlama']}s)" if r["fase_terlama"] else "-"
+        print(f"   {r['skrip']:<8} {r['baris']:>6} {r['durasi']:>8}s {r['baris_per_jam']:>11}  {fase_info}")
+    print(f"📝 Hasil benchmark disimpan di '{path_csv}' dan '{path_json}'")
+    return path_csv, path_json
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Tugas1/Tugas2 terhadap server SIMPEG & SURADI tiruan")
+    parser.add_argument("--skrip", nargs="+", choices=SKRIP, default=SKRIP)
+    parser.add_argument("--ukuran", nargs="+", type=int, default=UKURAN, help="jumlah baris Excel sintetis")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--latensi", type=float, default=0.05, help="latensi server per request (detik)")
+    parser.add_argument("--jitter", type=float, default=0.5)
+    parser.add_argument("--galat", type=float, default=0.0, help="peluang error server per request (0-1)")
+    parser.add_argument("--tahun", type=int, default=2025)
+    parser.add_argument("--umur-sesi", type=float, default=0.0, help="umur sesi login SIMPEG tiruan (detik, 0 = tanpa batas)")
+    parser.add_argument("--aset", help="folder lokal jQuery/Select2/DataTables (lihat server_tiruan.ASET)")
+    parser.add_argument("--batas-waktu", type=int, default=6 * 3600, help="batas waktu per run (detik)")
+    parser.add_argument("argumen_skrip", nargs=argparse.REMAINDER, help="argumen tambahan setelah '--'")
+    args = parser.parse_args()
+    tambahan = [a for a in args.argumen_skrip if a != "--"]
+
+    konfigurasi = Konfigurasi(latensi=args.latensi, jitter=args.jitter, galat=args.galat, tahun=args.tahun,
+                              umur_sesi=args.umur_sesi,
+                              aset=os.path.abspath(args.aset) if args.aset else None)
+    folder = os.path.abspath(os.path.join(FOLDER_BENCH, datetime.now().strftime("%Y-%m-%d_%H-%M-%S")))
+    hasil = [
+        jalankan_satu(skrip, n, os.path.join(folder, f"{skrip}_{n}"), konfigurasi, args.workers,
+                      tambahan, args.batas_waktu)
+        for skrip in args.skrip
+        for n in args.ukuran
+    ]
+    simpan_hasil(folder, hasil)
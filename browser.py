@@ -0,0 +1,148 @@
+"""
+Pembuatan driver Chrome dan login SIMPEG/SURADI yang dipakai bersama oleh Tugas1.py,
+Tugas2.py, dan modul pendukung (misalnya warm-up cache pegawai).
+
+Kedua pembuat driver mendukung "profil cepat" (`cepat=True`):
+- Chrome headless dengan ukuran jendela tetap,
+- `pageLoadStrategy=eager` (driver.get kembali setelah DOMContentLoaded),
+- gambar, font, media, dan skrip analitik diblokir lewat Chrome DevTools Protocol
+  (`Network.setBlockedURLs`). File JS (jQuery, Select2, DataTables) tidak pernah diblokir.
+CSS hanya diblokir bila diminta (`blokir_css=True`), karena pengecekan klik/visibilitas
+Select2 dan indikator processing DataTables bergantung pada stylesheet-nya.
+
+Bila `hitung_perintah.aktifkan()` sudah dipanggil, setiap driver yang dibuat di sini
+ikut dipasangi penghitung perintah WebDriver.
+
+Alamat situs, path chromedriver, dan path cookie SURADI bisa diganti lewat environment
+(`SIMPEG_URL`, `SURADI_URL`, `CHROMEDRIVER`, `SURADI_COOKIE`), misalnya untuk
+menjalankan skrip terhadap `server_tiruan.py`. `CHROMEDRIVER` kosong berarti
+chromedriver dicari otomatis oleh Selenium.
+"""
+
+import json
+import os
+
+import undetected_chromedriver as uc
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+
+import hitung_perintah
+import tunggu
+
+PATH_CHROMEDRIVER = os.environ.get(
+    "CHROMEDRIVER", "C:/Users/HP/Downloads/chromedriver-win64/chromedriver-win64/chromedriver.exe"
+)
+PATH_COOKIE_SURADI = os.environ.get("SURADI_COOKIE", r"D:/PKL/code/2. TUGAS 2/cookie.json")
+URL_SIMPEG = os.environ.get("SIMPEG_URL", "https://simpeg.malangkota.go.id").rstrip("/")
+URL_SURADI = os.environ.get("SURADI_URL", "https://suradi.malangkota.go.id").rstrip("/")
+
+# Pola URL yang diblokir pada profil cepat (format wildcard Network.setBlockedURLs)
+POLA_BLOKIR = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.webp", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*",
+]
+POLA_BLOKIR_CSS = ["*.css"]
+
+UKURAN_JENDELA = "1920,1080"
+
+
+def _terapkan_opsi_cepat(options, argumen_headless=True):
+    options.page_load_strategy = "eager"
+    if argumen_headless:
+        options.add_argument("--headless=new")
+    options.add_argument(f"--window-size={UKURAN_JENDELA}")
+    options.add_argument("--disable-extensions")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+    })
+
+
+def blokir_resource(driver, blokir_css=False):
+    """
+    Blokir resource statis yang tidak dibutuhkan otomasi lewat CDP.
+
+    Berlaku untuk `webdriver.Chrome` maupun `uc.Chrome` (keduanya turunan driver Chromium).
+    """
+    pola = POLA_BLOKIR + (POLA_BLOKIR_CSS if blokir_css else [])
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": pola})
+
+
+def buat_driver_simpeg(cepat=False, blokir_css=False):
+    """
+    Buat `webdriver.Chrome` dengan chromedriver lokal.
+
+    Args:
+        cepat (bool): aktifkan profil cepat (headless, eager, blokir resource statis).
+        blokir_css (bool): ikut blokir CSS pada profil cepat.
+    """
+    service = Service(PATH_CHROMEDRIVER or None)
+    options = webdriver.ChromeOptions()
+    if cepat:
+        _terapkan_opsi_cepat(options)
+    driver = hitung_perintah.pasang(webdriver.Chrome(service=service, options=options))
+    if cepat:
+        blokir_resource(driver, blokir_css)
+    return driver
+
+
+def login_simpeg(driver, username="the-username", password="the-password"):
+    """
+    Login ke SIMPEG: buka halaman login, isi kredensial, klik tombol login,
+    lalu tunggu sampai URL beralih dari halaman login.
+
+    Catatan: ganti "the-username" dan "the-password" dengan kredensial asli.
+    """
+    driver.get(f"{URL_SIMPEG}/login")
+    driver.find_element(By.ID, "username").send_keys(username)
+    driver.find_element(By.ID, "password").send_keys(password)
+    url_login = driver.current_url
+    driver.find_element(By.CLASS_NAME, "btn-primary").click()
+    tunggu.tunggu_url_berubah(driver, url_login, jenis="login")
+
+
+def buka_dengan_cookie(cepat=False, blokir_css=False):
+    """
+    Buka SURADI dengan undetected-chromedriver lalu masuk memakai cookie dari cookie.json.
+
+    Args:
+        cepat (bool): aktifkan profil cepat (headless, eager, blokir resource statis).
+        blokir_css (bool): ikut blokir CSS pada profil cepat.
+    """
+    options = uc.ChromeOptions()
+    if cepat:
+        # Mode headless diserahkan ke uc agar user-agent "HeadlessChrome" ikut disamarkan
+        _terapkan_opsi_cepat(options, argumen_headless=False)
+    driver = hitung_perintah.pasang(uc.Chrome(options=options, headless=cepat))
+    if cepat:
+        blokir_resource(driver, blokir_css)
+    muat_cookie_suradi(driver)
+    return driver
+
+
+def muat_cookie_suradi(driver):
+    """
+    Muat cookie dari cookie.json ke driver SURADI lalu buka dashboard.
+
+    File dibaca ulang setiap kali dipanggil, sehingga cookie yang diperbarui selagi
+    run berjalan ikut terpakai saat sesi dipulihkan (lihat penjaga_sesi).
+    """
+    driver.get(f"{URL_SURADI}/")
+    tunggu.tunggu_halaman_siap(driver)
+
+    with open(PATH_COOKIE_SURADI, "r") as f:
+        cookies = json.load(f)
+        for cookie in cookies:
+            for key in ['sameSite', 'storeId', 'session', 'id', 'hostOnly', 'expirationDate']:
+                cookie.pop(key, None)
+            if cookie.get("domain", "").startswith("."):
+                cookie["domain"] = cookie["domain"][1:]
+            driver.add_cookie(cookie)
+
+    driver.get(f"{URL_SURADI}/admin/dashboard")
+    tunggu.tunggu_halaman_siap(driver)
+    print("✅ Cookie berhasil digunakan, masuk dashboard")
@@ -0,0 +1,287 @@
+"""
+Cache persisten NIP → pegawai_id (SQLite) yang dipakai bersama oleh Tugas1.py dan Tugas2.py.
+
+Mencari pegawai_id lewat browser butuh buka halaman pencarian, isi NIP, klik cari,
+klik "Detil", pindah tab, lalu membaca URL. Pemetaannya hampir tidak pernah berubah, jadi
+hasilnya disimpan di `cache_pegawai.sqlite` dan NIP yang sudah dikenal langsung
+dipakai untuk membuka `add_pendidikan/{id}`, `tambah_jabatan/{id}`, atau
+`detail_pegawai/{id}/tab_disiplin`.
+
+Bila halaman pegawai dengan id dari cache ternyata tidak ada (`periksa_halaman_pegawai`
+melempar `PegawaiTidakDitemukan`), pemanggil mencari ulang dengan `segarkan=True`:
+entri lama dihapus dan pegawai_id dicari lagi lewat browser.
+
+Warm-up satu sheet Excel sebelum run utama:
+
+    python cache_pegawai.py data_jabatan.xlsx
+    python cache_pegawai.py Data_Januari.xlsx --halaman pencarian_pegawai
+"""
+
+import argparse
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support import expected_conditions as EC
+
+import penjaga_sesi
+import tunggu
+from browser import URL_SIMPEG
+from profil_waktu import fase
+
+PATH_CACHE = "cache_pegawai.sqlite"
+
+# URL halaman detail pegawai; grup 1 = pegawai_id
+POLA_URL_DETAIL = re.compile(r"/detail_pegawai/(\d+)(?:[/?#]|$)")
+
+# Potongan judul halaman SIMPEG untuk pegawai_id yang tidak ada
+JUDUL_TIDAK_DITEMUKAN = ("404", "not found", "tidak ditemukan")
+
+
+class PegawaiTidakDitemukan(Exception):
+    """Halaman pegawai untuk pegawai_id tertentu tidak ada (pemetaan NIP → pegawai_id usang)."""
+
+
+class CachePegawai:
+    """
+    Penyimpanan NIP → pegawai_id berbasis SQLite.
+
+    Aman dipakai dari beberapa thread (satu koneksi dengan lock).
+    """
+
+    def __init__(self, path=PATH_CACHE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pegawai ("
+            " nip TEXT PRIMARY KEY, pegawai_id TEXT NOT NULL, diperbarui TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def ambil(self, nip):
+        """Ambil pegawai_id untuk `nip`, atau None bila belum ada di cache."""
+        with self._lock:
+            baris = self._conn.execute(
+                "SELECT pegawai_id FROM pegawai WHERE nip = ?", (nip,)
+            ).fetchone()
+        return baris[0] if baris else None
+
+    def belum_ada(self, daftar_nip):
+        """Kembalikan NIP dari `daftar_nip` yang belum ada di cache (urutan dipertahankan)."""
+        with self._lock:
+            ada = {r[0] for r in self._conn.execute("SELECT nip FROM pegawai")}
+        return [nip for nip in dict.fromkeys(daftar_nip) if nip not in ada]
+
+    def simpan(self, nip, pegawai_id):
+        """Simpan/perbarui pemetaan `nip` → `pegawai_id`."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pegawai (nip, pegawai_id, diperbarui) VALUES (?, ?, ?)",
+                (nip, pegawai_id, datetime.now().isoformat(timespec="seconds")),
+            )
+            self._conn.commit()
+
+    def hapus(self, nip):
+        """Hapus entri `nip` (misalnya bila pegawai_id ternyata tidak valid)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM pegawai WHERE nip = ?", (nip,))
+            self._conn.commit()
+
+    def tutup(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _klik_cari_daftar_pegawai(driver, nip):
+    # Alur Tugas1.py: halaman daftar_pegawai, tombol 'Cari Data', link 'Detil'
+    driver.get(f"{URL_SIMPEG}/kepegawaian/informasi/daftar_pegawai")
+    tunggu.tunggu_halaman_siap(driver)
+    penjaga_sesi.periksa(driver)
+    nip_input = driver.find_element(By.ID, "nip_baru")
+    nip_input.clear()
+    nip_input.send_keys(nip)
+    cari_btn = driver.find_element(By.CLASS_NAME, "btn-primary") # Tombol 'Cari Data'
+    driver.execute_script("arguments[0].scrollIntoView(true);", cari_btn)
+    driver.execute_script("arguments[0].click();", cari_btn)
+    return "//a[contains(@title, 'Detil')]"
+
+
+def _klik_cari_pencarian_pegawai(driver, nip):
+    # Alur Tugas2.py: halaman pencarian_pegawai, termasuk pegawai non aktif, link 'Detil Data'
+    wait = WebDriverWait(driver, 10)
+    driver.get(f"{URL_SIMPEG}/kepegawaian/informasi/pencarian_pegawai")
+    tunggu.tunggu_halaman_siap(driver)
+    penjaga_sesi.periksa(driver)
+    nip_input = wait.until(EC.presence_of_element_located((By.NAME, "nip_baru")))
+    nip_input.clear()
+    nip_input.send_keys(nip)
+
+    select_dropdown = Select(driver.find_element(By.NAME, "status_aktif"))
+    select_dropdown.select_by_visible_text("Pegawai Aktif dan Non Aktif")
+    tunggu.tunggu_ajax_selesai(driver)
+
+    cari_button = wait.until(EC.element_to_be_clickable((By.ID, "search_button")))
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", cari_button)
+    try:
+        cari_button.click()
+    except Exception:
+        print("⚠️ Gagal klik biasa, pakai JS click...")
+        driver.execute_script("arguments[0].click();", cari_button)
+    return "//a[contains(@title, 'Detil Data')]"
+
+
+_ALUR_PENCARIAN = {
+    "daftar_pegawai": _klik_cari_daftar_pegawai,
+    "pencarian_pegawai": _klik_cari_pencarian_pegawai,
+}
+
+
+def _id_dari_url(driver):
+    cocok = POLA_URL_DETAIL.search(driver.current_url)
+    return cocok.group(1) if cocok else None
+
+
+def cari_pegawai_id_browser(driver, nip, halaman="daftar_pegawai"):
+    """
+    Cari pegawai_id lewat browser: cari NIP, klik "Detil", baca ID dari URL tab baru.
+
+    Tab detail ditutup lagi dan fokus dikembalikan ke tab awal, sehingga pemanggil
+    selalu melanjutkan di tab yang sama.
+
+    Args:
+        driver: Selenium WebDriver yang sudah login ke SIMPEG.
+        nip (str): NIP yang dicari.
+        halaman (str): "daftar_pegawai" (alur Tugas1) atau "pencarian_pegawai" (alur Tugas2).
+
+    Returns:
+        str: pegawai_id.
+
+    Raises:
+        TimeoutException: bila link "Detil" tidak muncul.
+        ValueError: bila halaman detail (`/detail_pegawai/<angka>`) tidak terbuka, sehingga
+            tidak ada pegawai_id yang bisa disimpan ke cache.
+    """
+    tab_awal = driver.current_window_handle
+    with fase("search_nip"):
+        xpath_detil = _ALUR_PENCARIAN[halaman](driver, nip)
+
+        detail_btn = tunggu.tunggu_baris_berisi(driver, nip, xpath_detil)
+        if detail_btn is None:
+            detail_btn = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.XPATH, xpath_detil)))
+
+    with fase("open_detail"):
+        jumlah_tab = len(driver.window_handles)
+        driver.execute_script("arguments[0].click();", detail_btn) # klik tombol detil
+
+        if tunggu.tunggu_jendela_baru(driver, jumlah_tab):
+            try:
+                pegawai_id = tunggu.tunggu_kondisi(driver, _id_dari_url, "halaman")
+                url = driver.current_url
+            finally:
+                # Worker harus selalu kembali ke tab awal, walaupun tab detail gagal ditutup
+                try:
+                    driver.close()
+                finally:
+                    driver.switch_to.window(tab_awal)
+        else:
+            # Detil terbuka di tab yang sama: tunggu sampai navigasinya benar-benar terjadi
+            pegawai_id = tunggu.tunggu_kondisi(driver, _id_dari_url, "halaman")
+            url = driver.current_url
+    if not pegawai_id:
+        raise ValueError(f"ID pegawai {nip} tidak terbaca dari URL detail ({url})")
+    return pegawai_id
+
+
+def periksa_halaman_pegawai(driver, pegawai_id):
+    """
+    Pastikan halaman pegawai `pegawai_id` yang baru dibuka memang ada.
+
+    Dipanggil setelah `penjaga_sesi.periksa`, sehingga pengalihan ke /login sudah
+    ditangani sebagai sesi habis.
+
+    Raises:
+        PegawaiTidakDitemukan: bila SIMPEG mengalihkan ke halaman tanpa `pegawai_id`
+            di path-nya, atau judul halaman menyatakan 404 / tidak ditemukan.
+    """
+    judul = (driver.title or "").lower()
+    segmen = urlsplit(driver.current_url).path.split("/")
+    if str(pegawai_id) not in segmen or any(t in judul for t in JUDUL_TIDAK_DITEMUKAN):
+        raise PegawaiTidakDitemukan(f"halaman pegawai {pegawai_id} tidak ditemukan ({driver.current_url})")
+
+
+def cari_pegawai_id(driver, nip, cache=None, halaman="daftar_pegawai", segarkan=False):
+    """
+    Ambil pegawai_id dari cache, atau cari lewat browser lalu simpan ke cache.
+
+    Args:
+        driver: Selenium WebDriver yang sudah login ke SIMPEG.
+        nip (str): NIP pegawai.
+        cache (CachePegawai, optional): cache persisten. None = selalu lewat browser.
+        halaman (str): alur pencarian, lihat `cari_pegawai_id_browser`.
+        segarkan (bool): hapus entri cache `nip` lalu cari ulang lewat browser
+            (misalnya setelah `PegawaiTidakDitemukan` untuk id dari cache).
+
+    Returns:
+        str: pegawai_id.
+    """
+    if cache is not None and segarkan:
+        cache.hapus(nip)
+    elif cache is not None:
+        pegawai_id = cache.ambil(nip)
+        if pegawai_id:
+            print(f"📦 ID Pegawai {nip} dari cache: {pegawai_id}")
+            return pegawai_id
+
+    pegawai_id = cari_pegawai_id_browser(driver, nip, halaman)
+    if cache is not None and pegawai_id:
+        cache.simpan(nip, pegawai_id)
+    return pegawai_id
+
+
+def warm_up(driver, daftar_nip, cache, halaman="daftar_pegawai"):
+    """
+    Resolve semua NIP yang belum ada di cache sebelum run utama.
+
+    Returns:
+        list[tuple]: (nip, pesan error) untuk NIP yang gagal di-resolve.
+    """
+    belum = cache.belum_ada(daftar_nip)
+    print(f"🔥 Warm-up cache pegawai: {len(belum)} NIP belum ada di cache")
+    gagal = []
+    for i, nip in enumerate(belum, start=1):
+        try:
+            pegawai_id = cari_pegawai_id(driver, nip, cache, halaman)
+            print(f"✅ [{i}/{len(belum)}] {nip} → {pegawai_id}")
+        except Exception as e:
+            gagal.append((nip, str(e)))
+            print(f"❌ [{i}/{len(belum)}] {nip} gagal: {e}")
+    return gagal
+
+
+if __name__ == "__main__":
+    import pandas as pd
+    from browser import buat_driver_simpeg, login_simpeg
+    from rencana_kerja import bersihkan_nip
+
+    parser = argparse.ArgumentParser(description="Warm-up cache NIP → pegawai_id dari sheet Excel")
+    parser.add_argument("excel", help="file Excel dengan kolom 'NIP Baru'")
+    parser.add_argument("--halaman", choices=sorted(_ALUR_PENCARIAN), default="daftar_pegawai")
+    parser.add_argument("--cache", default=PATH_CACHE)
+    parser.add_argument("--cepat", action="store_true", help="profil cepat: headless, eager, blokir resource statis")
+    args = parser.parse_args()
+
+    daftar_nip = bersihkan_nip(pd.read_excel(args.excel, dtype={"NIP Baru": str})["NIP Baru"])
+    cache = CachePegawai(args.cache)
+    driver = buat_driver_simpeg(cepat=args.cepat)
+    try:
+        login_simpeg(driver)
+        gagal = warm_up(driver, [n for n in daftar_nip if n], cache, args.halaman)
+        print(f"✨ Warm-up selesai, {len(gagal)} NIP gagal")
+    finally:
+        driver.quit()
+        cache.tutup()
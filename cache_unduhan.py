@@ -0,0 +1,190 @@
+"""
+Cache unduhan PDF SURADI berbasis isi (content-addressed) untuk `hasil_download`.
+
+Surat TTD yang sama diunduh ulang di setiap run Tugas2.py dan di setiap
+verifikasi akhir run. Cache ini menyimpan:
+- isi file sekali per sha256 di `hasil_download/.objek/<sha256>.pdf`,
+- metadata per (nomor_surat, URL) di SQLite: sha256, ukuran, ETag, Last-Modified,
+  waktu unduh, dan waktu akses terakhir.
+
+Selama entri masih segar (`MASA_SEGAR`) file lokal langsung dipakai tanpa jaringan.
+Setelah itu dilakukan request kondisional (If-None-Match / If-Modified-Since); respons
+304 berarti file lokal masih berlaku. Entri lama atau melebihi batas ukuran total
+dibuang lewat `bersihkan`.
+"""
+
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+PATH_DB = os.path.join("hasil_download", "cache_unduhan.sqlite")
+FOLDER_OBJEK = os.path.join("hasil_download", ".objek")
+
+MASA_SEGAR = 7 * 24 * 3600  # detik tanpa revalidasi
+MAKS_UMUR = 30 * 24 * 3600  # detik sejak akses terakhir sebelum dibuang
+MAKS_TOTAL_BYTE = 2 * 1024 ** 3
+
+
+class CacheUnduhan:
+    """
+    Metadata + penyimpanan objek unduhan, aman dipakai beberapa thread (satu koneksi dengan lock).
+    """
+
+    def __init__(self, path=PATH_DB, folder_objek=FOLDER_OBJEK):
+        self.path = path
+        self.folder_objek = folder_objek
+        os.makedirs(folder_objek, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS unduhan ("
+            " kunci TEXT NOT NULL, url TEXT NOT NULL, sha256 TEXT NOT NULL, ukuran INTEGER NOT NULL,"
+            " etag TEXT, last_modified TEXT, path TEXT NOT NULL,"
+            " diunduh REAL NOT NULL, diakses REAL NOT NULL,"
+            " PRIMARY KEY (kunci, url))"
+        )
+        self._conn.commit()
+
+    def path_objek(self, sha256):
+        return os.path.join(self.folder_objek, f"{sha256}.pdf")
+
+    def ambil(self, kunci, url):
+        """
+        Ambil entri cache yang objeknya masih utuh di disk.
+
+        Returns:
+            dict entri (kunci, url, sha256, ukuran, etag, last_modified, path, diunduh,
+            diakses, segar), atau None bila tidak ada / objek hilang / ukurannya berbeda.
+        """
+        with self._lock:
+            baris = self._conn.execute(
+                "SELECT kunci, url, sha256, ukuran, etag, last_modified, path, diunduh, diakses"
+                " FROM unduhan WHERE kunci = ? AND url = ?", (kunci, url)
+            ).fetchone()
+        if baris is None:
+            return None
+        entri = dict(zip(
+            ("kunci", "url", "sha256", "ukuran", "etag", "last_modified", "path", "diunduh", "diakses"),
+            baris,
+        ))
+        objek = self.path_objek(entri["sha256"])
+        if not os.path.exists(objek) or os.path.getsize(objek) != entri["ukuran"]:
+            self._hapus_entri(kunci, url)
+            return None
+        entri["segar"] = time.time() - entri["diunduh"] < MASA_SEGAR
+        return entri
+
+    def pakai(self, entri, diperbarui=False):
+        """
+        Tandai entri dipakai (dan tervalidasi ulang bila `diperbarui`), lalu pastikan
+        file bernama di `entri["path"]` menunjuk ke objeknya.
+
+        Returns:
+            str: path file bernama yang siap diunggah.
+        """
+        sekarang = time.time()
+        with self._lock:
+            if diperbarui:
+                self._conn.execute(
+                    "UPDATE unduhan SET diunduh = ?, diakses = ? WHERE kunci = ? AND url = ?",
+                    (sekarang, sekarang, entri["kunci"], entri["url"]),
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE unduhan SET diakses = ? WHERE kunci = ? AND url = ?",
+                    (sekarang, entri["kunci"], entri["url"]),
+                )
+            self._conn.commit()
+        return self._tautkan(self.path_objek(entri["sha256"]), entri["path"])
+
+    def simpan(self, kunci, url, path_sementara, sha256, path, etag=None, last_modified=None):
+        """
+        Pindahkan file hasil unduhan ke penyimpanan objek dan catat metadatanya.
+
+        Args:
+            path_sementara (str): file `.part` yang sudah lengkap.
+            sha256 (str): hash isi file (dihitung saat streaming).
+            path (str): path file bernama yang dipakai untuk upload.
+
+        Returns:
+            str: `path`, yang menunjuk ke objek sha256 tersebut.
+        """
+        objek = self.path_objek(sha256)
+        ukuran = os.path.getsize(path_sementara)
+        if os.path.exists(objek):
+            os.remove(path_sementara)  # isi yang sama sudah tersimpan
+        else:
+            os.replace(path_sementara, objek)
+        sekarang = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO unduhan"
+                " (kunci, url, sha256, ukuran, etag, last_modified, path, diunduh, diakses)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (kunci, url, sha256, ukuran, etag, last_modified, path, sekarang, sekarang),
+            )
+            self._conn.commit()
+        return self._tautkan(objek, path)
+
+    @staticmethod
+    def _tautkan(objek, path):
+        # File bernama dibuat sebagai hard link ke objek (salinan bila link tidak didukung)
+        if os.path.exists(path):
+            if os.path.samefile(path, objek):
+                return path
+            os.remove(path)
+        try:
+            os.link(objek, path)
+        except OSError:
+            shutil.copyfile(objek, path)
+        return path
+
+    def _hapus_entri(self, kunci, url):
+        with self._lock:
+            self._conn.execute("DELETE FROM unduhan WHERE kunci = ? AND url = ?", (kunci, url))
+            self._conn.commit()
+
+    def bersihkan(self, maks_umur=MAKS_UMUR, maks_total=MAKS_TOTAL_BYTE):
+        """
+        Buang entri yang tidak diakses lebih dari `maks_umur` detik, lalu entri yang paling
+        lama tidak diakses sampai total ukuran objek ≤ `maks_total` byte. Objek dan file
+        bernama ikut dihapus bila tidak dipakai entri lain.
+
+        Returns:
+            int: jumlah entri yang dibuang.
+        """
+        with self._lock:
+            baris = self._conn.execute(
+                "SELECT kunci, url, sha256, ukuran, path, diakses FROM unduhan ORDER BY diakses"
+            ).fetchall()
+        pemakai = Counter(sha for _, _, sha, _, _, _ in baris)
+        total = sum({sha: ukuran for _, _, sha, ukuran, _, _ in baris}.values())
+        batas_waktu = time.time() - maks_umur
+
+        dibuang = []
+        for r in baris:
+            _, _, sha, ukuran, _, diakses = r
+            if diakses >= batas_waktu and total <= maks_total:
+                break  # urut dari akses terlama, sisanya masih segar
+            dibuang.append(r)
+            pemakai[sha] -= 1
+            if pemakai[sha] == 0:
+                total -= ukuran
+
+        path_dipakai = {r[4] for r in baris[len(dibuang):]}
+        for kunci, url, sha, _, path, _ in dibuang:
+            self._hapus_entri(kunci, url)
+            if path not in path_dipakai and os.path.exists(path):
+                os.remove(path)
+            if pemakai[sha] == 0 and os.path.exists(self.path_objek(sha)):
+                os.remove(self.path_objek(sha))
+        if dibuang:
+            print(f"🧹 Cache unduhan: {len(dibuang)} entri dibuang")
+        return len(dibuang)
+
+    def tutup(self):
+        with self._lock:
+            self._conn.close()
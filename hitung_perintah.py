@@ -0,0 +1,156 @@
+"""
+Penghitung perintah WebDriver (round trip HTTP ke chromedriver) per jenis, fase, dan baris.
+
+Setiap `find_element`, `.text`, `get_attribute`, `execute_script`, `send_keys`, dan
+seterusnya adalah satu request HTTP ke chromedriver. `pasang` membungkus
+`driver.command_executor.execute` milik satu driver (berlaku untuk `webdriver.Chrome`
+maupun `uc.Chrome`, keduanya memakai `RemoteConnection` Selenium), lalu setiap perintah
+dicatat jumlah dan durasinya menurut:
+- nama perintah (misalnya `findElement`, `executeScript`, `getElementText`),
+- fase `profil_waktu` yang sedang berjalan di thread tersebut (terdalam),
+- NIP dari `pencatat.konteks` thread tersebut.
+
+Baris (NIP) yang jumlah perintahnya melewati `ambang` diberi peringatan sekali saat
+ambang terlewati dan didaftar di laporan akhir, sehingga jalur kode yang "cerewet"
+mudah ditemukan. Nonaktif secara bawaan; diaktifkan lewat `aktifkan` sebelum driver dibuat.
+"""
+
+import csv
+import json
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import pencatat
+from profil_waktu import fase_aktif
+
+AMBANG_PERINTAH = 300  # perintah per baris sebelum ditandai
+
+_lock = threading.Lock()
+_aktif = [False]
+_ambang = [AMBANG_PERINTAH]
+_per_perintah = defaultdict(lambda: [0, 0.0, 0.0])  # (perintah, fase) → [jumlah, total, maks]
+_per_nip = defaultdict(lambda: [0, 0.0])            # nip → [jumlah, total]
+_ditandai = set()
+
+
+def aktifkan(ambang=AMBANG_PERINTAH):
+    """Aktifkan penghitungan untuk driver yang dibuat setelah ini."""
+    _aktif[0] = True
+    _ambang[0] = ambang
+
+
+def aktif():
+    return _aktif[0]
+
+
+def _catat(perintah, durasi):
+    nama_fase = fase_aktif() or "-"
+    nip = pencatat.konteks_aktif().get("nip")
+    tandai = False
+    with _lock:
+        data = _per_perintah[(perintah, nama_fase)]
+        data[0] += 1
+        data[1] += durasi
+        data[2] = max(data[2], durasi)
+        if nip:
+            per_nip = _per_nip[nip]
+            per_nip[0] += 1
+            per_nip[1] += durasi
+            if per_nip[0] > _ambang[0] and nip not in _ditandai:
+                _ditandai.add(nip)
+                tandai = True
+    if tandai:
+        print(f"⚠️ NIP {nip}: lebih dari {_ambang[0]} perintah WebDriver (fase {nama_fase})")
+
+
+def pasang(driver):
+    """
+    Bungkus command executor `driver` agar setiap perintah dihitung. Tidak melakukan
+    apa pun bila penghitung belum `aktifkan` atau driver sudah terpasang.
+
+    Returns:
+        driver yang sama.
+    """
+    executor = driver.command_executor
+    if not _aktif[0] or getattr(executor, "_dihitung", False):
+        return driver
+    execute_asli = executor.execute
+
+    def execute(perintah, params=None):
+        awal = time.perf_counter()
+        try:
+            return execute_asli(perintah, params)
+        finally:
+            _catat(perintah, time.perf_counter() - awal)
+
+    executor.execute = execute
+    executor._dihitung = True
+    return driver
+
+
+def ringkasan():
+    """
+    Returns:
+        dict: {
+            "total": jumlah semua perintah,
+            "per_perintah": [{perintah, fase, jumlah, total, rata, maks}] urut jumlah terbesar,
+            "per_fase": [{fase, jumlah, total}] urut jumlah terbesar,
+            "baris_boros": [{nip, jumlah, total}] NIP di atas ambang, urut jumlah terbesar,
+            "ambang": ambang yang dipakai,
+        }
+    """
+    with _lock:
+        per_perintah = {k: list(v) for k, v in _per_perintah.items()}
+        per_nip = {k: list(v) for k, v in _per_nip.items()}
+    baris = [
+        {"perintah": perintah, "fase": nama_fase, "jumlah": n, "total": round(total, 3),
+         "rata": round(total / n * 1000, 1), "maks": round(maks, 3)}
+        for (perintah, nama_fase), (n, total, maks) in per_perintah.items()
+    ]
+    per_fase = defaultdict(lambda: [0, 0.0])
+    for r in baris:
+        per_fase[r["fase"]][0] += r["jumlah"]
+        per_fase[r["fase"]][1] += r["total"]
+    return {
+        "total": sum(r["jumlah"] for r in baris),
+        "per_perintah": sorted(baris, key=lambda r: r["jumlah"], reverse=True),
+        "per_fase": sorted(
+            ({"fase": f, "jumlah": n, "total": round(t, 3)} for f, (n, t) in per_fase.items()),
+            key=lambda r: r["jumlah"], reverse=True,
+        ),
+        "baris_boros": sorted(
+            ({"nip": nip, "jumlah": n, "total": round(t, 3)} for nip, (n, t) in per_nip.items() if n > _ambang[0]),
+            key=lambda r: r["jumlah"], reverse=True,
+        ),
+        "ambang": _ambang[0],
+    }
+
+
+def simpan_laporan(path_dasar):
+    """
+    Tulis `<path_dasar>.csv` (per perintah & fase, `rata` dalam milidetik) dan
+    `<path_dasar>.json` (ringkasan lengkap), lalu cetak fase & baris paling cerewet.
+
+    Returns:
+        tuple[str, str]: path CSV dan JSON.
+    """
+    hasil = ringkasan()
+    path_csv, path_json = f"{path_dasar}.csv", f"{path_dasar}.json"
+    with open(path_csv, "w", newline="", encoding="utf-8") as f:
+        penulis = csv.DictWriter(f, fieldnames=["perintah", "fase", "jumlah", "total", "rata", "maks"])
+        penulis.writeheader()
+        penulis.writerows(hasil["per_perintah"])
+    with open(path_json, "w", encoding="utf-8") as f:
+        json.dump({"dibuat": datetime.now().isoformat(timespec="seconds"), **hasil}, f, ensure_ascii=False, indent=2)
+
+    print(f"\n📡 Perintah WebDriver: {hasil['total']} total")
+    for r in hasil["per_fase"][:10]:
+        print(f"   {r['fase']:<24} {r['jumlah']:>7} perintah | {r['total']:>8.1f}s")
+    if hasil["baris_boros"]:
+        print(f"⚠️ {len(hasil['baris_boros'])} NIP melewati {hasil['ambang']} perintah:")
+        for r in hasil["baris_boros"][:10]:
+            print(f"   {r['nip']}: {r['jumlah']} perintah, {r['total']:.1f}s")
+    print(f"📝 Laporan perintah WebDriver disimpan di '{path_csv}' dan '{path_json}'")
+    return path_csv, path_json
@@ -0,0 +1,105 @@
+"""
+Indeks file PDF SPMT (TTE) berdasarkan kode SPMT.
+
+Menggantikan pencarian per baris di Tugas1.py (compile regex + `folder_path.iterdir()`
+untuk setiap pegawai) dengan satu kali scan folder di awal run. Indeks bisa disimpan
+ke JSON bersama mtime folder; bila folder tidak berubah, indeks dipakai langsung,
+dan bila berubah hanya nama file baru yang dicocokkan ulang.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+# Nama file TTE: SPMT_PPPK_T1_<nomor>_<kode>_<sisa>.pdf
+POLA_FILE_SPMT = re.compile(r"^SPMT_PPPK_T1_\d+_(?P<kode>[^_]+)_")
+
+
+def _kode_dari_nama(nama):
+    cocok = POLA_FILE_SPMT.match(nama)
+    return cocok.group("kode") if cocok else None
+
+
+def bangun_indeks_spmt(folder_path, path_cache=None):
+    """
+    Bangun indeks kode SPMT → daftar path file dengan satu kali scan folder.
+
+    Args:
+        folder_path: folder tempat file SPMT TTE disimpan.
+        path_cache: path JSON untuk menyimpan indeks beserta mtime folder (opsional).
+            Bila mtime folder sama dengan yang tersimpan, folder tidak di-scan ulang.
+
+    Returns:
+        dict[str, list[str]]: kode → list path file (terurut), biasanya berisi satu file.
+    """
+    folder_path = Path(folder_path)
+    mtime = folder_path.stat().st_mtime_ns
+    nama_ke_kode = {}
+
+    cache = None
+    if path_cache and Path(path_cache).exists():
+        with open(path_cache, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("folder") != str(folder_path):
+            cache = None
+
+    if cache and cache.get("mtime") == mtime:
+        nama_ke_kode = cache["files"]
+        print(f"📦 Indeks SPMT dimuat dari cache: {len(nama_ke_kode)} file")
+    else:
+        lama = cache["files"] if cache else {}
+        baru = 0
+        with os.scandir(folder_path) as entri:
+            for e in entri:
+                if not e.is_file():
+                    continue
+                if e.name in lama:
+                    kode = lama[e.name]
+                else:
+                    kode = _kode_dari_nama(e.name)
+                    baru += 1
+                # Nama yang tidak cocok pola tetap disimpan (kode None) agar tidak dicocokkan ulang
+                nama_ke_kode[e.name] = kode
+        print(f"🗂️ Indeks SPMT dibangun: {len(nama_ke_kode)} file ({baru} nama baru dicocokkan)")
+        if path_cache:
+            with open(path_cache, "w", encoding="utf-8") as f:
+                json.dump({"folder": str(folder_path), "mtime": mtime, "files": nama_ke_kode}, f)
+
+    indeks = {}
+    for nama in sorted(nama_ke_kode):
+        if nama_ke_kode[nama]:
+            indeks.setdefault(nama_ke_kode[nama], []).append(str(folder_path / nama))
+    return indeks
+
+
+def cari_file_spmt(indeks, kode):
+    """Ambil path file SPMT untuk `kode` (file pertama bila ada lebih dari satu), atau None."""
+    files = indeks.get(kode)
+    return files[0] if files else None
+
+
+def periksa_kode_spmt(indeks, daftar_kode):
+    """
+    Periksa semua kode SPMT sekaligus sebelum browser dijalankan.
+
+    Args:
+        indeks: hasil `bangun_indeks_spmt`.
+        daftar_kode: iterable pasangan (nip, kode). Kode kosong diabaikan
+            (format No.SPMT tidak valid ditangani terpisah).
+
+    Returns:
+        tuple: (hilang, ganda)
+        - hilang: list (nip, kode) yang tidak punya file,
+        - ganda: list (nip, kode, files) yang cocok dengan lebih dari satu file.
+    """
+    hilang, ganda = [], []
+    for nip, kode in daftar_kode:
+        if not kode:
+            continue
+        files = indeks.get(kode, [])
+        if not files:
+            hilang.append((nip, kode))
+        elif len(files) > 1:
+            ganda.append((nip, kode, files))
+    return hilang, ganda
@@ -0,0 +1,158 @@
+"""
+Jurnal run append-only (JSONL) yang tahan crash, dipakai Tugas1.py dan Tugas2.py.
+
+Setiap langkah per NIP (pegawai_id ditemukan, pendidikan/jabatan tersimpan, surat cuti
+terunggah, ...) dicatat sebagai satu baris JSON begitu selesai. Baris langsung di-flush
+ke OS sehingga aman bila Chrome/Python mati, dan di-fsync per batch (setiap
+`BATCH_FSYNC` catatan atau `INTERVAL_FSYNC` detik) agar tetap aman saat listrik padam
+tanpa memperlambat tiap langkah.
+
+Dengan `--resume`, jurnal lama dibaca ulang dan langkah yang statusnya "ok" dilewati.
+Laporan Excel akhir disusun dari jurnal (catatan terakhir per langkah), bukan dari
+list di memori. Pendengar (`dengarkan`, misalnya `laporan.LaporanBerkala`) dipanggil
+setiap ada catatan baru untuk menulis laporan sementara.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+BATCH_FSYNC = 20
+INTERVAL_FSYNC = 2.0  # detik
+
+
+class Jurnal:
+    """
+    Jurnal langkah per NIP, aman dipakai beberapa worker sekaligus.
+
+    Satu catatan: {"waktu", "nip", "langkah", "kunci", "status", ...data}.
+    `kunci` membedakan langkah yang berulang untuk satu NIP (misalnya nomor surat cuti,
+    atau nomor baris rencana kerja bila NIP yang sama muncul di beberapa baris).
+    Data "log" berisi entri laporan (dict) milik langkah tersebut.
+    """
+
+    def __init__(self, path, lanjut=False):
+        """
+        Args:
+            path (str): file JSONL jurnal.
+            lanjut (bool): True = baca jurnal lama dan lanjutkan (`--resume`);
+                False = jurnal lama (bila ada) diarsipkan dengan akhiran waktu.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._catatan = []
+        self._terakhir = {}
+        self._belum_fsync = 0
+        self._fsync_terakhir = time.monotonic()
+        self._pendengar = []
+
+        if os.path.exists(path):
+            if lanjut:
+                self._muat()
+            else:
+                dasar, ext = os.path.splitext(path)
+                arsip = f"{dasar}.{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}{ext}"
+                os.replace(path, arsip)
+                print(f"🗄️ Jurnal lama diarsipkan ke {arsip}")
+
+        self._file = open(path, "a", encoding="utf-8")
+        if lanjut and self._catatan:
+            print(f"↩️ Melanjutkan dari jurnal {path}: {len(self._catatan)} catatan")
+
+    def _muat(self):
+        with open(self.path, "rb") as f:
+            isi = f.read()
+        for baris in isi.decode("utf-8", errors="replace").splitlines():
+            try:
+                self._simpan_memori(json.loads(baris))
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue  # baris terakhir yang terpotong saat crash
+        if isi and not isi.endswith(b"\n"):
+            # Pastikan catatan baru tidak tersambung ke baris yang terpotong
+            with open(self.path, "ab") as f:
+                f.write(b"\n")
+
+    def _simpan_memori(self, catatan):
+        kunci = (catatan["nip"], catatan["langkah"], catatan.get("kunci", ""))
+        self._catatan.append(catatan)
+        self._terakhir[kunci] = catatan
+
+    def catat(self, nip, langkah, status, kunci="", **data):
+        """
+        Tambahkan satu catatan langkah.
+
+        Args:
+            nip (str): NIP pegawai.
+            langkah (str): nama langkah, misalnya "pegawai_id", "pendidikan", "upload".
+            status (str): "ok" atau "gagal".
+            kunci (str): pembeda langkah berulang (misalnya nomor surat).
+            **data: data tambahan (pegawai_id, log, ...), harus bisa di-JSON-kan.
+        """
+        catatan = {
+            "waktu": datetime.now().isoformat(timespec="seconds"),
+            "nip": nip, "langkah": langkah, "kunci": kunci, "status": status,
+            **data,
+        }
+        baris = json.dumps(catatan, ensure_ascii=False, default=str)
+        with self._lock:
+            self._simpan_memori(catatan)
+            self._file.write(baris + "\n")
+            self._file.flush()
+            self._belum_fsync += 1
+            if (self._belum_fsync >= BATCH_FSYNC
+                    or time.monotonic() - self._fsync_terakhir >= INTERVAL_FSYNC):
+                self._fsync()
+        for fungsi in self._pendengar:
+            fungsi(catatan)
+
+    def dengarkan(self, fungsi):
+        """Daftarkan callable(catatan) yang dipanggil di thread pemanggil setelah setiap `catat`."""
+        self._pendengar.append(fungsi)
+        return fungsi
+
+    def _fsync(self):
+        os.fsync(self._file.fileno())
+        self._belum_fsync = 0
+        self._fsync_terakhir = time.monotonic()
+
+    def terakhir(self, nip, langkah, kunci=""):
+        """Catatan terakhir untuk langkah ini, atau None bila belum pernah dicatat."""
+        with self._lock:
+            return self._terakhir.get((nip, langkah, kunci))
+
+    def sudah_selesai(self, nip, langkah, kunci=""):
+        """True bila catatan terakhir langkah ini berstatus "ok"."""
+        catatan = self.terakhir(nip, langkah, kunci)
+        return catatan is not None and catatan["status"] == "ok"
+
+    def laporan(self, urutan_nip=None):
+        """
+        Susun entri laporan dari jurnal: entri "log" milik catatan terakhir tiap langkah.
+
+        Args:
+            urutan_nip (list, optional): urutan NIP di sheet sumber. Entri diurutkan
+                berdasarkan posisi NIP di sini (worker paralel menulis jurnal berselang-seling);
+                NIP yang tidak ada di daftar ditaruh di akhir.
+
+        Returns:
+            list[dict]: entri laporan, urut per NIP lalu urutan langkah pertama kali dicatat.
+        """
+        with self._lock:
+            urutan_kunci = list(dict.fromkeys(
+                (c["nip"], c["langkah"], c.get("kunci", "")) for c in self._catatan
+            ))
+            terakhir = [self._terakhir[k] for k in urutan_kunci]
+        if urutan_nip is not None:
+            posisi = {}
+            for i, nip in enumerate(urutan_nip):
+                posisi.setdefault(nip, i)
+            terakhir.sort(key=lambda c: posisi.get(c["nip"], len(posisi)))
+        return [entri for c in terakhir for entri in c.get("log", [])]
+
+    def tutup(self):
+        with self._lock:
+            self._file.flush()
+            self._fsync()
+            self._file.close()
@@ -0,0 +1,276 @@
+"""
+Katalog opsi lokal untuk dropdown Select2 dan <select> di form SIMPEG.
+
+Alih-alih mengetik teks ke kotak pencarian Select2, menunggu hasil AJAX, lalu
+menekan ENTER tanpa tahu opsi mana yang terpilih, katalog ini:
+- mengambil daftar opsi sekali dari endpoint di balik widget (konfigurasi `ajax`
+  milik Select2, atau opsi <option> langsung untuk <select> biasa),
+- menyimpannya ke disk (`katalog_opsi.json`) dengan TTL,
+- mencocokkan nilai tiap baris ke id opsi secara lokal (normalisasi lalu fuzzy),
+- memilih opsi di halaman lewat JavaScript dengan id yang sudah pasti.
+
+Daftar berjenjang (SKPD → unit kerja → sub unit) disimpan per id induknya.
+"""
+
+import difflib
+import json
+import os
+import re
+import threading
+import time
+
+import tunggu
+
+PATH_KATALOG = "katalog_opsi.json"
+TTL_KATALOG = 24 * 3600  # detik
+
+# Field berjenjang: field anak → field induk
+INDUK = {
+    "unit_kerja": "skpd",
+    "sub_unit_kerja": "unit_kerja",
+}
+
+AMBANG_FUZZY = 0.85
+
+# Ambil opsi <select> langsung dari DOM (tanpa AJAX)
+_JS_OPSI_SELECT = """
+var el = document.getElementById(arguments[0]);
+if (!el || !el.options) return null;
+var hasil = [];
+for (var i = 0; i < el.options.length; i++) {
+    var o = el.options[i];
+    if (o.value !== '') hasil.push({id: o.value, text: o.text.trim()});
+}
+return hasil;
+"""
+
+# Panggil endpoint AJAX milik Select2 (v4) dengan konfigurasi widget itu sendiri
+_JS_OPSI_SELECT2_AJAX = """
+var id = arguments[0], term = arguments[1], selesai = arguments[arguments.length - 1];
+try {
+    var $el = window.jQuery && jQuery('#' + id);
+    var s2 = $el && $el.data('select2');
+    var ajax = s2 && s2.options && s2.options.options && s2.options.options.ajax;
+    if (!ajax) { selesai(null); return; }
+    var params = {term: term, q: term, page: 1, _type: 'query'};
+    var url = typeof ajax.url === 'function' ? ajax.url.call($el, params) : ajax.url;
+    var data = typeof ajax.data === 'function' ? ajax.data.call($el, params) : params;
+    jQuery.ajax({url: url, data: data, type: ajax.type || 'GET', dataType: ajax.dataType || 'json'})
+        .done(function (resp) {
+            var hasil = ajax.processResults ? ajax.processResults(resp, params) : resp;
+            var items = (hasil && hasil.results) || hasil || [];
+            var datar = [];
+            (function tambah(list) {
+                for (var i = 0; i < list.length; i++) {
+                    if (list[i].children) tambah(list[i].children);
+                    else if (list[i].id !== undefined && list[i].id !== '')
+                        datar.push({id: String(list[i].id), text: String(list[i].text).trim()});
+                }
+            })(items);
+            selesai(datar);
+        })
+        .fail(function () { selesai(null); });
+} catch (e) { selesai(null); }
+"""
+
+# Pilih opsi berdasarkan id lalu picu event change agar field berjenjang ikut dimuat
+_JS_PILIH_OPSI = """
+var el = document.getElementById(arguments[0]), id = arguments[1], teks = arguments[2];
+if (!el) return false;
+var ada = false;
+for (var i = 0; i < el.options.length; i++) if (el.options[i].value === id) ada = true;
+if (!ada) el.appendChild(new Option(teks, id, false, false));
+if (window.jQuery) { jQuery(el).val(id).trigger('change'); }
+else { el.value = id; el.dispatchEvent(new Event('change', {bubbles: true})); }
+return el.value === id;
+"""
+
+
+def normalisasi_teks(teks):
+    """Huruf besar, tanda baca jadi spasi, spasi ganda dirapikan (untuk pencocokan opsi)."""
+    teks = re.sub(r"[^0-9A-Z]+", " ", str(teks).upper())
+    return " ".join(teks.split())
+
+
+def cocokkan(opsi, teks, persis=False):
+    """
+    Cocokkan `teks` dengan daftar opsi secara lokal.
+
+    Urutan pencocokan:
+    1. teks ternormalisasi sama persis,
+    2. opsi yang mengandung teks (yang terpendek bila lebih dari satu),
+    3. fuzzy (difflib) dengan rasio ≥ `AMBANG_FUZZY`.
+    Dengan `persis=True` hanya langkah 1 yang dipakai (untuk <select> biasa seperti
+    jurusan, yang sebelumnya dipilih dengan `select_by_visible_text`).
+
+    Returns:
+        dict {"id", "text"} opsi yang cocok, atau None.
+    """
+    cari = normalisasi_teks(teks)
+    if not cari or not opsi:
+        return None
+    per_norm = {}
+    for o in opsi:
+        per_norm.setdefault(normalisasi_teks(o["text"]), o)
+
+    if cari in per_norm:
+        return per_norm[cari]
+    if persis:
+        return None
+    memuat = [n for n in per_norm if cari in n]
+    if memuat:
+        return per_norm[min(memuat, key=len)]
+    mirip = difflib.get_close_matches(cari, list(per_norm), n=1, cutoff=AMBANG_FUZZY)
+    return per_norm[mirip[0]] if mirip else None
+
+
+class KatalogOpsi:
+    """
+    Cache opsi dropdown di disk dengan TTL, aman dipakai beberapa worker sekaligus.
+
+    Kunci cache: "<field>|<id induk>|<term>". Term kosong berarti seluruh daftar;
+    term hanya dipakai bila endpoint tidak mengembalikan apa-apa tanpa kata kunci.
+    Setiap entri ditandai "lengkap" bila berasal dari <option> di DOM; daftar dari
+    endpoint Select2 AJAX bisa terpotong (per halaman atau dibatasi pencarian).
+    """
+
+    def __init__(self, path=PATH_KATALOG, ttl=TTL_KATALOG):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._data = json.load(f)
+
+    @staticmethod
+    def _kunci(field, induk, term):
+        return f"{field}|{induk or ''}|{normalisasi_teks(term)}"
+
+    def _entri(self, kunci):
+        with self._lock:
+            entri = self._data.get(kunci)
+        if entri and time.time() - entri["waktu"] < self.ttl:
+            return entri
+        return None
+
+    def _ke_cache(self, kunci, opsi, lengkap=False):
+        with self._lock:
+            self._data[kunci] = {"waktu": time.time(), "opsi": opsi, "lengkap": lengkap}
+
+    def simpan(self):
+        """Tulis katalog ke disk (atomik lewat file sementara)."""
+        with self._lock:
+            sementara = f"{self.path}.tmp"
+            with open(sementara, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(sementara, self.path)
+
+    def _ambil_dari_halaman(self, driver, field, term):
+        # Returns (opsi, lengkap): hanya daftar <option> dari DOM yang pasti lengkap
+        opsi = driver.execute_async_script(_JS_OPSI_SELECT2_AJAX, field, term)
+        if opsi is not None:
+            return opsi, False
+        return driver.execute_script(_JS_OPSI_SELECT, field), True
+
+    def opsi(self, driver, field, induk=None, term=""):
+        """
+        Ambil daftar opsi `field` dari cache, atau dari halaman yang sedang terbuka.
+
+        Args:
+            driver: WebDriver yang sedang membuka form, atau None untuk cache saja.
+            field (str): id elemen <select> (misalnya "skpd", "jurusan").
+            induk (str, optional): id opsi induk yang sudah dipilih (untuk field berjenjang).
+            term (str): kata kunci pencarian Select2 ("" = seluruh daftar).
+
+        Returns:
+            list[dict] opsi {"id", "text"}, atau None bila tidak tersedia.
+        """
+        entri = self._ambil(driver, field, induk, term)
+        return entri["opsi"] if entri else None
+
+    def _ambil(self, driver, field, induk, term):
+        # Entri {"opsi", "lengkap"} dari cache, atau dari halaman bila ada driver
+        kunci = self._kunci(field, induk, term)
+        entri = self._entri(kunci)
+        if entri is not None or driver is None:
+            return entri
+        opsi, lengkap = self._ambil_dari_halaman(driver, field, term)
+        if opsi is None:
+            return None
+        self._ke_cache(kunci, opsi, lengkap)
+        return {"opsi": opsi, "lengkap": lengkap}
+
+    @staticmethod
+    def _cocokkan_daftar(entri, teks, persis):
+        # Daftar Select2 tanpa kata kunci bisa hanya halaman pertama: opsi yang mirip atau
+        # memuat `teks` di sana belum tentu yang dicari, jadi hanya kecocokan persis diterima
+        lengkap = entri.get("lengkap", False)
+        return cocokkan(entri["opsi"], teks, persis or not lengkap)
+
+    def cari(self, driver, field, teks, induk=None, persis=False):
+        """
+        Selesaikan `teks` menjadi opsi pasti untuk `field`.
+
+        Pertama dicoba seluruh daftar (term kosong): daftar lengkap (<select>) dicocokkan
+        penuh, daftar Select2 AJAX yang mungkin terpotong hanya dicocokkan persis. Bila
+        belum ketemu, dicoba lagi dengan `teks` sebagai term pencarian, dan baru di sana
+        pencocokan "memuat" dan fuzzy dipakai.
+
+        Returns:
+            dict {"id", "text"} atau None.
+        """
+        semua = self._ambil(driver, field, induk, "")
+        hasil = self._cocokkan_daftar(semua, teks, persis) if semua else None
+        if hasil is None and teks:
+            hasil = cocokkan(self.opsi(driver, field, induk, term=teks) or [], teks, persis)
+        return hasil
+
+    def periksa(self, field, teks, induk=None, persis=False):
+        """
+        Cocokkan `teks` hanya dari cache (tanpa browser), untuk validasi offline.
+
+        Returns:
+            dict {"id", "text"} bila cocok; False bila pasti tidak ada, yaitu tidak cocok
+            dengan daftar hasil pencarian `teks` atau dengan daftar lengkap (<select>);
+            None bila belum bisa dipastikan (belum di cache, TTL habis, atau hanya ada
+            daftar Select2 tanpa kata kunci yang mungkin terpotong).
+        """
+        pasti = False
+        for term in ("", teks):
+            entri = self._entri(self._kunci(field, induk, term))
+            if entri is None:
+                continue
+            hasil = cocokkan(entri["opsi"], teks, persis) if term else self._cocokkan_daftar(entri, teks, persis)
+            if hasil is not None:
+                return hasil
+            if term or entri.get("lengkap"):
+                pasti = True
+        return False if pasti else None
+
+    def pilih(self, driver, field, teks, induk=None, persis=False):
+        """
+        Selesaikan `teks` lalu pilih opsinya langsung di halaman (tanpa mengetik di Select2).
+
+        Returns:
+            dict {"id", "text"} opsi yang terpilih, atau None bila tidak bisa diselesaikan.
+        """
+        hasil = self.cari(driver, field, teks, induk, persis)
+        if hasil is None:
+            return None
+        if not driver.execute_script(_JS_PILIH_OPSI, field, hasil["id"], hasil["text"]):
+            return None
+        tunggu.tunggu_ajax_selesai(driver)
+        return hasil
+
+    def resolver_http(self, persis=False):
+        """
+        Buat resolver untuk `kirim_http.PengirimForm.kirim` yang hanya membaca cache.
+
+        Field berjenjang memakai id induk yang sudah diselesaikan pada form yang sama.
+        """
+        def resolver(field, teks, terpilih):
+            induk = terpilih.get(INDUK[field]) if field in INDUK else None
+            hasil = self.cari(None, field, teks, induk, persis)
+            return hasil["id"] if hasil else None
+        return resolver
@@ -0,0 +1,348 @@
+"""
+Mesin pengiriman form SIMPEG lewat HTTP langsung (tanpa render browser).
+
+Form `pegawai_pendidikan/add_pendidikan/{id}` dan `pegawai_jabatan/tambah_jabatan/{id}`
+adalah POST HTML biasa (jabatan berupa multipart karena ada `file_spmt`). Modul ini:
+- memakai cookie login dari sesi Selenium di dalam satu `requests.Session` ber-pool,
+- membaca form dari halaman tiap pegawai (action, field hidden/CSRF, nilai bawaan, opsi <select>),
+- mengirim data yang sama dengan yang dikirim browser, termasuk file PDF.
+
+Hasil kiriman dibedakan tiga (lihat `PengirimForm.kirim`):
+- BERHASIL,
+- BELUM_TERKIRIM: POST belum sampai ke SIMPEG (opsi Select2 AJAX tidak bisa
+  diselesaikan, form tidak terbaca, token CSRF ditolak, sesi kedaluwarsa) atau ditolak
+  validasi (`.error-block`, HTTP 4xx); form aman diisi ulang lewat jalur browser,
+- TIDAK_PASTI: POST sudah dikirim tetapi hasilnya tidak diketahui (timeout, koneksi
+  putus, HTTP 5xx); form "tambah" mungkin sudah tersimpan, jadi tidak boleh dikirim ulang.
+"""
+
+import os
+import time
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from browser import URL_SIMPEG
+from pengendali_host import pengendali
+
+URL_FORM = {
+    "pendidikan": URL_SIMPEG + "/kepegawaian/informasi/pegawai_pendidikan/add_pendidikan/{id}",
+    "jabatan": URL_SIMPEG + "/kepegawaian/informasi/pegawai_jabatan/tambah_jabatan/{id}",
+}
+
+TIMEOUT_HTTP = 30
+
+# Hasil `PengirimForm.kirim`
+BERHASIL = "berhasil"
+BELUM_TERKIRIM = "belum_terkirim"
+TIDAK_PASTI = "tidak_pasti"
+
+
+class _PembacaForm(HTMLParser):
+    """Parser HTML sederhana: kumpulkan form beserta field-nya dan teks `.error-block`."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.forms = []
+        self.errors = []
+        self._form = None
+        self._select = None
+        self._option = None
+        self._textarea = None
+        self._error = None
+
+    def handle_starttag(self, tag, attrs):
+        a = {k: (v or "") for k, v in attrs}
+        if self._error is not None and tag == self._error["tag"]:
+            self._error["depth"] += 1
+        if "error-block" in a.get("class", "").split():
+            self._error = {"tag": tag, "depth": 1, "teks": []}
+
+        if tag == "form":
+            self._form = {
+                "action": a.get("action", ""),
+                "method": a.get("method", "get").lower(),
+                "enctype": a.get("enctype", ""),
+                "fields": [],
+                "ids": {},
+                "selects": {},
+                "submit": None,
+            }
+            self.forms.append(self._form)
+            return
+        if self._form is None:
+            return
+
+        nama = a.get("name")
+        if nama and a.get("id"):
+            self._form["ids"][a["id"]] = nama
+
+        if tag in ("input", "select", "textarea") and "disabled" in a:
+            # Field nonaktif tidak ikut dikirim browser
+            return
+
+        if tag == "input" and nama:
+            jenis = a.get("type", "text").lower()
+            if jenis in ("button", "reset", "image"):
+                return
+            if jenis == "submit":
+                self._form["submit"] = self._form["submit"] or (nama, a.get("value", ""))
+            elif jenis in ("checkbox", "radio"):
+                if "checked" in a:
+                    self._form["fields"].append((nama, jenis, a.get("value", "on")))
+            else:
+                self._form["fields"].append((nama, jenis, a.get("value", "")))
+        elif tag == "button" and nama and a.get("type", "submit").lower() == "submit":
+            self._form["submit"] = self._form["submit"] or (nama, a.get("value", ""))
+        elif tag == "select" and nama:
+            self._select = nama
+            self._form["selects"][nama] = []
+            self._form["fields"].append((nama, "select-multiple" if "multiple" in a else "select", None))
+        elif tag == "option" and self._select:
+            self._option = {"value": a.get("value"), "teks": [], "selected": "selected" in a}
+            self._form["selects"][self._select].append(self._option)
+        elif tag == "textarea" and nama:
+            self._textarea = [nama, []]
+
+    def handle_endtag(self, tag):
+        if self._error is not None and tag == self._error["tag"]:
+            self._error["depth"] -= 1
+            if self._error["depth"] == 0:
+                teks = " ".join("".join(self._error["teks"]).split())
+                if teks:
+                    self.errors.append(teks)
+                self._error = None
+        if tag == "form":
+            self._form = None
+        elif tag == "select":
+            self._select = None
+            self._option = None
+        elif tag == "option":
+            self._option = None
+        elif tag == "textarea" and self._textarea and self._form is not None:
+            self._form["fields"].append((self._textarea[0], "textarea", "".join(self._textarea[1])))
+            self._textarea = None
+
+    def handle_data(self, data):
+        if self._error is not None:
+            self._error["teks"].append(data)
+        if self._option is not None:
+            self._option["teks"].append(data)
+        if self._textarea is not None:
+            self._textarea[1].append(data)
+
+
+def baca_halaman(html):
+    """
+    Parse HTML halaman form.
+
+    Returns:
+        tuple: (forms, errors) — list dict form dan list teks `.error-block` yang tidak kosong.
+    """
+    pembaca = _PembacaForm()
+    pembaca.feed(html)
+    pembaca.close()
+    for form in pembaca.forms:
+        for opsi in form["selects"].values():
+            for o in opsi:
+                o["teks"] = " ".join("".join(o["teks"]).split())
+                if o["value"] is None:
+                    o["value"] = o["teks"]
+    return pembaca.forms, pembaca.errors
+
+
+def cocokkan_opsi(opsi, teks, persis=False):
+    """
+    Cari value opsi <select> yang cocok dengan `teks`, meniru pencarian Select2.
+
+    Urutan: teks sama persis (tanpa beda huruf besar/kecil), lalu opsi pertama yang
+    mengandung `teks` (kecuali `persis=True`, meniru `select_by_visible_text`).
+    Opsi placeholder dengan value kosong diabaikan.
+
+    Returns:
+        str value opsi, atau None bila tidak ada yang cocok.
+    """
+    cari = " ".join(str(teks).split()).upper()
+    kandidat = [o for o in opsi if o["value"] not in ("", None)]
+    for o in kandidat:
+        if o["teks"].upper() == cari:
+            return o["value"]
+    if persis:
+        return None
+    for o in kandidat:
+        if cari and cari in o["teks"].upper():
+            return o["value"]
+    return None
+
+
+def nilai_bawaan(form):
+    """
+    Pasangan (name, value) yang dikirim browser untuk `form` bila tidak ada yang diubah:
+    input teks/hidden, checkbox/radio yang tercentang, <option selected> (atau opsi pertama
+    pada <select> tunggal), dan isi <textarea>. Input file dan tombol submit tidak termasuk.
+    """
+    data = []
+    for nama, jenis, nilai in form["fields"]:
+        if jenis == "file":
+            continue
+        if jenis in ("select", "select-multiple"):
+            opsi = form["selects"].get(nama, [])
+            terpilih = [o for o in opsi if o["selected"]]
+            if jenis == "select":
+                terpilih = terpilih[-1:] or opsi[:1]
+            data.extend((nama, o["value"]) for o in terpilih)
+        else:
+            data.append((nama, nilai or ""))
+    return data
+
+
+def buat_session_dari_driver(driver, ukuran_pool=10):
+    """
+    Buat `requests.Session` ber-pool yang memakai cookie dan user-agent dari driver Selenium.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=ukuran_pool, pool_maxsize=ukuran_pool)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+    salin_cookie(driver, session)
+    return session
+
+
+def salin_cookie(driver, session):
+    """Salin (ulang) semua cookie dari driver Selenium ke `session`."""
+    for c in driver.get_cookies():
+        session.cookies.set(c["name"], c["value"], domain=c.get("domain"), path=c.get("path", "/"))
+
+
+class PengirimForm:
+    """
+    Pengirim form SIMPEG lewat HTTP untuk satu sesi login (satu worker).
+
+    Form dibaca ulang dari halaman tiap pegawai sebelum dikirim, sehingga field hidden
+    per pegawai (id, NIP, token CSRF, ...) dan nilai bawaan field lain selalu milik
+    pegawai tersebut, sama seperti yang dikirim browser.
+    """
+
+    def __init__(self, driver, ukuran_pool=10):
+        self.driver = driver
+        self.session = buat_session_dari_driver(driver, ukuran_pool)
+
+    def segarkan_cookie(self):
+        """Salin ulang cookie dari driver SIMPEG (misalnya setelah login ulang)."""
+        salin_cookie(self.driver, self.session)
+
+    def ambil_form(self, jenis, pegawai_id, kunci_wajib):
+        """Baca form `jenis` dari halaman pegawai `pegawai_id`; action sudah berupa URL absolut."""
+        url = URL_FORM[jenis].format(id=pegawai_id)
+        r = self.session.get(url, timeout=TIMEOUT_HTTP)
+        r.raise_for_status()
+        if "/login" in r.url:
+            raise PermissionError("sesi SIMPEG kedaluwarsa (diarahkan ke /login)")
+        forms, _ = baca_halaman(r.text)
+        if not forms:
+            raise ValueError(f"form {jenis} tidak ditemukan di {url}")
+
+        def skor(form):
+            kunci = set(form["ids"]) | {f[0] for f in form["fields"]}
+            return len(kunci & set(kunci_wajib))
+
+        form = max(forms, key=skor)
+        form["action"] = urljoin(r.url, form["action"] or r.url)
+        return form
+
+    def _nama_field(self, form, kunci):
+        # Kunci boleh berupa id elemen (seperti di jalur browser) atau name field
+        return form["ids"].get(kunci, kunci)
+
+    def kirim(self, jenis, pegawai_id, nilai, pilihan, files=None, resolver=None, persis=()):
+        """
+        Kirim satu form SIMPEG lewat HTTP.
+
+        Field yang tidak disebut di `nilai`/`pilihan`/`files` dikirim dengan nilai
+        bawaannya di halaman (lihat `nilai_bawaan`).
+
+        Args:
+            jenis (str): "pendidikan" atau "jabatan".
+            pegawai_id (str): ID pegawai tujuan.
+            nilai (dict): id/name field → nilai teks yang diisi apa adanya.
+            pilihan (dict): id/name field <select>/Select2 → teks opsi yang dipilih
+                (sama dengan teks yang diketik di kotak pencarian Select2).
+            files (dict, optional): id/name field file → path file yang diunggah.
+            resolver (callable, optional): resolver(field, teks, terpilih) → value opsi
+                untuk field yang opsinya tidak ada di HTML (Select2 AJAX). `terpilih`
+                berisi value pilihan lain yang sudah diselesaikan (untuk opsi berjenjang).
+            persis (iterable): field pilihan yang teksnya harus sama persis (<select> biasa).
+
+        Returns:
+            tuple: (hasil, pesan) dengan hasil BERHASIL, BELUM_TERKIRIM (boleh diisi ulang
+            lewat browser), atau TIDAK_PASTI (jangan dikirim ulang).
+        """
+        awal = time.monotonic()
+        try:
+            hasil, pesan = self._kirim(jenis, pegawai_id, nilai, pilihan, files, resolver, persis)
+        except (requests.RequestException, ValueError, PermissionError, OSError) as e:
+            # Semua error sebelum POST: form belum sampai ke SIMPEG
+            pengendali("SIMPEG").lapor(time.monotonic() - awal, e, "http")
+            return BELUM_TERKIRIM, f"{type(e).__name__}: {e}"
+        # Hanya dilaporkan (tanpa izin): kiriman ini berjalan di dalam izin baris browser
+        galat = None if hasil == BERHASIL else RuntimeError(pesan)
+        pengendali("SIMPEG").lapor(time.monotonic() - awal, galat, "http")
+        return hasil, pesan
+
+    def _kirim(self, jenis, pegawai_id, nilai, pilihan, files, resolver, persis):
+        kunci_wajib = list(nilai) + list(pilihan) + list(files or {})
+        for percobaan in range(2):
+            form = self.ambil_form(jenis, pegawai_id, kunci_wajib)
+            diisi = {}
+            for kunci, isi in nilai.items():
+                diisi[self._nama_field(form, kunci)] = "" if isi is None else str(isi)
+
+            terpilih = {}
+            for kunci, teks in pilihan.items():
+                nama = self._nama_field(form, kunci)
+                value = cocokkan_opsi(form["selects"].get(nama, []), teks, persis=kunci in persis)
+                if value is None and resolver is not None:
+                    value = resolver(kunci, teks, terpilih)
+                if value is None:
+                    return BELUM_TERKIRIM, f"opsi '{teks}' untuk field {kunci} tidak bisa diselesaikan lewat HTTP"
+                terpilih[kunci] = value
+                diisi[nama] = value
+
+            nama_berkas = {self._nama_field(form, kunci): path for kunci, path in (files or {}).items()}
+            data = [(n, v) for n, v in nilai_bawaan(form) if n not in diisi and n not in nama_berkas]
+            data.extend(diisi.items())
+            if form["submit"]:
+                data.append(form["submit"])
+
+            berkas = {}
+            try:
+                for nama, path in nama_berkas.items():
+                    berkas[nama] = (os.path.basename(path), open(path, "rb"), "application/pdf")
+                try:
+                    r = self.session.post(form["action"], data=data, files=berkas or None, timeout=TIMEOUT_HTTP)
+                except requests.ConnectTimeout:
+                    raise  # belum tersambung: POST belum terkirim
+                except requests.RequestException as e:
+                    return TIDAK_PASTI, f"{type(e).__name__}: {e}"
+            finally:
+                for _, f, _ in berkas.values():
+                    f.close()
+
+            if "/login" in r.url:
+                return BELUM_TERKIRIM, "sesi SIMPEG kedaluwarsa (diarahkan ke /login)"
+            if r.status_code in (403, 419) and percobaan == 0:
+                # Token CSRF ditolak: baca ulang form lalu coba sekali lagi
+                continue
+            if r.status_code >= 500:
+                return TIDAK_PASTI, f"HTTP {r.status_code}"
+            if r.status_code >= 400:
+                return BELUM_TERKIRIM, f"HTTP {r.status_code}"
+
+            _, errors = baca_halaman(r.text)
+            if errors:
+                return BELUM_TERKIRIM, "; ".join(errors)
+            return BERHASIL, "Berhasil"
+        return BELUM_TERKIRIM, "token CSRF ditolak"
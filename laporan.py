@@ -0,0 +1,134 @@
+"""
+Laporan Excel per NIP (log_upload_cutian Tugas2, log-semua-kegagalan Tugas1).
+
+Entri laporan dari jurnal dikelompokkan per NIP: baris pertama tiap kelompok diberi
+nomor urut dan jumlah entri NIP tersebut, baris berikutnya NIP-nya dikosongkan.
+Penomoran dihitung sekaligus per kolom (shift/cumsum/value_counts), bukan dengan
+`iterrows` + `.at` per sel.
+
+`LaporanBerkala` menulis ulang laporan ke disk setiap `SETIAP_ENTRI` entri baru
+tercatat di jurnal, sehingga laporan sebagian tetap ada bila run berhenti di tengah.
+File ditulis ke `<path>.part` lalu `os.replace`, jadi tidak pernah setengah jadi.
+"""
+
+import os
+import threading
+
+import pandas as pd
+
+SETIAP_ENTRI = 200
+
+
+def nomori_per_nip(df, kolom_total, kolom_nip="NIP"):
+    """
+    Beri nomor urut per kelompok NIP berurutan dan kosongkan NIP yang berulang.
+
+    Args:
+        df (pd.DataFrame): entri laporan, sudah urut per NIP.
+        kolom_total (str): nama kolom jumlah entri per NIP (diisi di baris pertama kelompok).
+
+    Returns:
+        pd.DataFrame: salinan `df` dengan kolom "No" di depan dan `kolom_total` setelah NIP.
+    """
+    nip = df[kolom_nip].fillna("").astype(str)
+    # NIP kosong tidak memutus kelompok: dibandingkan dengan NIP terisi sebelumnya
+    sebelumnya = nip.mask(nip == "").ffill().shift()
+    awal = (nip != "") & (nip != sebelumnya)
+    jumlah = nip.map(nip[nip != ""].value_counts()).fillna(0).astype(int)
+
+    hasil = df.copy()
+    hasil[kolom_nip] = nip.where(awal, "")
+    hasil.insert(0, "No", awal.cumsum().astype(object).where(awal, ""))
+    hasil.insert(hasil.columns.get_loc(kolom_nip) + 1, kolom_total, jumlah.astype(object).where(awal, ""))
+    return hasil
+
+
+def susun_laporan(entri, kolom, kolom_total, kolom_nip="NIP"):
+    """
+    Susun DataFrame laporan dari entri jurnal.
+
+    Args:
+        entri (list[dict]): hasil `Jurnal.laporan`.
+        kolom (list[str]): kolom entri yang ditampilkan setelah NIP (urut).
+        kolom_total (str): nama kolom jumlah entri per NIP.
+
+    Returns:
+        pd.DataFrame: kolom ["No", NIP, `kolom_total`, *kolom].
+    """
+    df = pd.DataFrame(entri).reindex(columns=[kolom_nip, *kolom]).fillna("")
+    return nomori_per_nip(df, kolom_total, kolom_nip)[["No", kolom_nip, kolom_total, *kolom]]
+
+
+def tulis_excel(df, path):
+    """Tulis `df` ke `path` (.xlsx) lewat `<path>.part` lalu `os.replace`."""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    sementara = f"{path}.part"
+    with open(sementara, "wb") as f:
+        df.to_excel(f, index=False, engine="openpyxl")
+    os.replace(sementara, path)
+    return path
+
+
+class LaporanBerkala:
+    """
+    Laporan yang ditulis ulang berkala selagi jurnal bertambah.
+
+    Args:
+        path (str): file .xlsx tujuan.
+        jurnal (Jurnal): sumber entri; laporan didengarkan lewat `jurnal.dengarkan`.
+        susun: callable(list[dict]) → pd.DataFrame.
+        urutan_nip (list, optional): urutan NIP di sheet sumber (boleh bertambah selama run).
+        setiap (int): jumlah entri baru sebelum laporan ditulis ulang; 0 = hanya `tulis()` manual.
+    """
+
+    def __init__(self, path, jurnal, susun, urutan_nip=None, setiap=SETIAP_ENTRI):
+        self.path = path
+        self.jurnal = jurnal
+        self.susun = susun
+        self.urutan_nip = urutan_nip
+        self.setiap = setiap
+        self._lock = threading.Lock()
+        self._menulis = threading.Lock()
+        self._baru = 0
+        self._ditulis = False
+        if setiap:
+            jurnal.dengarkan(self._saat_catat)
+
+    def _saat_catat(self, catatan):
+        with self._lock:
+            self._baru += len(catatan.get("log", []))
+            if self._baru < self.setiap:
+                return
+        # Satu penulisan sekaligus; worker lain tidak ikut menunggu
+        if self._menulis.acquire(blocking=False):
+            try:
+                self.tulis()
+            except Exception as e:
+                print(f"⚠️ Gagal menulis laporan sementara {self.path}: {e}")
+            finally:
+                self._menulis.release()
+
+    def tulis(self, hapus_bila_kosong=False):
+        """
+        Susun laporan dari jurnal saat ini lalu tulis ke `path`.
+
+        Args:
+            hapus_bila_kosong (bool): bila laporan kosong, hapus file yang sempat ditulis
+                run ini alih-alih menulis file kosong.
+
+        Returns:
+            pd.DataFrame: laporan yang disusun.
+        """
+        with self._lock:
+            self._baru = 0
+        urutan = list(self.urutan_nip) if self.urutan_nip is not None else None
+        df = self.susun(self.jurnal.laporan(urutan_nip=urutan))
+        if df.empty and hapus_bila_kosong:
+            if self._ditulis and os.path.exists(self.path):
+                os.remove(self.path)
+            return df
+        tulis_excel(df, self.path)
+        self._ditulis = True
+        return df
@@ -0,0 +1,158 @@
+"""
+Fungsi normalisasi data pegawai dari Excel agar sesuai format input SIMPEG.
+
+Dipakai bersama oleh Tugas1.py dan tahap perencanaan di rencana_kerja.py.
+"""
+
+def normalisasi_jurusan(text):
+    """
+    Normalisasi teks jurusan/pendidikan agar lebih seragam.
+
+    Fungsi ini mengubah input jurusan mentah (misalnya dari data pegawai) 
+    ke format baku dengan beberapa aturan standarisasi dan mapping tertentu.
+
+    Aturan normalisasi:
+    - Mengubah huruf menjadi kapital, lalu menghapus spasi berlebih di awal/akhir.
+    - Mengganti pola tertentu, misalnya:
+        * "S-1 " → "SARJANA-"
+        * "D-3 " → "DIPLOMA III-"
+        * "SMA PAKET C " → "SMA-Paket C"
+    - Jika ditemukan kata kunci dalam `mapping`, maka diganti sesuai nilai normalisasi.
+      Contoh mapping:
+        * "SLTA SEDERAJAT" → "Sekolah Menengah Atas"
+
+    Args:
+        text (str): Teks jurusan mentah.
+
+    Returns:
+        str: Hasil normalisasi jurusan dengan format baku.
+             Jika tidak ada yang cocok, mengembalikan teks dengan kapitalisasi awal kata.
+
+    Examples:
+        >>> normalisasi_jurusan("S-1 TEKNIK INFORMATIKA")
+        'Sarjana-Teknik Informatika'
+        >>> normalisasi_jurusan("D-3 Akuntansi")
+        'DIPLOMA III-Akuntansi'
+        >>> normalisasi_jurusan("SLTA SEDERAJAT")
+        'Sekolah Menengah Atas'
+        >>> normalisasi_jurusan("SMA PAKET C IPS")
+        'Sma-Paket C Ips'
+
+
+        
+    """
+    text = text.upper().strip()
+
+    # Standarisasi awal
+    text = text.replace("S-1 ", "SARJANA-")
+    text = text.replace("D-3 ", "DIPLOMA III-")
+    text = text.replace("SMA PAKET C ", "SMA-Paket C")
+
+    # Mapping kata kunci ke hasil normalisasi
+    mapping = {
+        #"SMA PAKET C": "SMA-Paket C",
+        "SLTA SEDERAJAT": "SEKOLAH MENENGAH ATAS",
+        #"STM": "SEKOLAH TEKNIK MENENGAH"
+    }
+
+    for keyword, hasil in mapping.items():
+        if keyword in text:
+            return hasil.title()
+
+    return text.title()  # fallback kalau tidak cocok apa-apa
+
+def normalisasi_jabatan(jabatan_raw):
+    """
+    Normalisasi teks jabatan mentah menjadi kategori baku.
+
+    Fungsi ini mengubah input jabatan mentah menjadi salah satu dari empat kategori:
+    - "Pelaksana" jika mengandung kata "pelaksana"
+    - "Fungsional" jika mengandung kata "fungsional"
+    - "Struktural" jika mengandung kata "struktural"
+    - "lainnya" jika tidak cocok dengan tiga kategori di atas
+
+    Args:
+        jabatan_raw (str): Teks jabatan mentah (misalnya dari input spreadsheet atau database).
+
+    Returns:
+        str: Kategori jabatan yang sudah dinormalisasi.
+             Nilai yang mungkin: "Pelaksana", "Fungsional", "Struktural", atau "lainnya".
+
+    Examples:
+        >>> normalisasi_jabatan("Jabatan Pelaksana")
+        'Pelaksana'
+        >>> normalisasi_jabatan("Tenaga Fungsional Umum")
+        'Fungsional'
+        >>> normalisasi_jabatan("Pejabat Struktural X")
+        'Struktural'
+        >>> normalisasi_jabatan("Magang")
+        'lainnya'
+    """
+    jabat = str(jabatan_raw).lower()
+    if "pelaksana" in jabat:
+        return "Pelaksana"
+    if "fungsional" in jabat:
+        return "Fungsional"
+    if "struktural" in jabat:
+        return "Struktural"
+    return "lainnya"
+
+def ekstrak_sub_unit_unit_skpd(unor):
+    """
+    Ekstrak sub-unit, unit, dan SKPD dari field 'Unor' yang berupa teks lurus.
+
+    Format input umumnya: "<Sub Unit> <Unit Keyword> <SKPD Keyword> <Nama SKPD>". 
+    Fungsi mencari kata kunci SKPD ("Dinas", "Satuan", "Kecamatan") dari akhir teks,
+    lalu mencari kata kunci unit ("Bidang", "Seksi", "UPT") di bagian sebelum SKPD.
+
+    Args:
+        unor: String yang berisi nama Unor (contoh: "Bidang Pelayanan Perizinan dan Nonperizinan Ekonomi, 
+        Pariwisata dan Sosial Budaya Dinas Tenaga Kerja, Penanaman Modal dan Pelayanan Terpadu Satu Pintu").
+
+    Returns:
+        tuple yang berisi (sub_unit, unit_kerja, skpd).
+        - sub_unit: teks sebelum kata kunci unit (atau seluruh sisa bila tidak ditemukan)
+        - unit_kerja: bagian yang dimulai dari kata kunci unit (atau "" jika tidak ada)
+        - skpd: bagian yang dimulai dari kata kunci SKPD (atau "" jika tidak ada)
+
+    Examples:
+        >>> ekstrak_sub_unit_unit_skpd("Seksi Pengendalian Bidang Ketertiban Dinas X")
+        ("Seksi Pengendalian", "Bidang Ketertiban", "Dinas X")
+    """
+    unor = str(unor)
+
+    skpd_keywords = ["Dinas", "Satuan", "Kecamatan"]
+    unit_keywords = ["Bidang", "SMPN", "Kelurahan", "Seksi", "Sekretariat", "UPT", "Puskesmas"]
+
+    skpd1 = ""
+    unit_kerja1 = ""
+    sub_unit1 = ""
+
+    skpd_idx = -1
+    unit_idx = -1
+
+    # Cari SKPD paling akhir (karena biasanya di akhir kalimat)
+    for kata in skpd_keywords:
+        idx = unor.rfind(kata)
+        if idx != -1:
+            skpd_idx = idx
+            skpd1 = unor[idx:].strip()
+            break
+
+    # Sisa sebelum SKPD → cari unit kerja
+    sisa = unor[:skpd_idx].strip() if skpd_idx != -1 else unor
+
+    for kata in unit_keywords:
+        idx = sisa.find(kata)
+        if idx != -1:
+            unit_idx = idx
+            unit_kerja1 = sisa[idx:].strip()
+            break
+
+    # Sisanya jadi sub unit
+    if unit_idx != -1:
+        sub_unit1 = sisa[:unit_idx].strip()
+    else:
+        sub_unit1 = sisa
+
+    return sub_unit1, unit_kerja1, skpd1
@@ -0,0 +1,238 @@
+"""
+Log terminal asinkron: `print` tidak pernah menunggu disk atau konsol.
+
+Menggantikan kelas `Tee` di Tugas2.py yang memanggil `flush()` ke konsol dan file log
+pada setiap `write`. `pasang_pencatat` mengganti `sys.stdout`/`sys.stderr` dengan
+aliran yang hanya memasukkan baris ke `queue.Queue` (tanpa batas, jadi `put` tidak
+pernah menahan thread otomasi). Satu thread latar belakang lalu:
+- meneruskan baris ke konsol asli (teks apa adanya, disaring `level_konsol`),
+- menulis `log_terminal/<nama>_<waktu>.log` (teks, ber-buffer),
+- menulis `log_terminal/<nama>_<waktu>.jsonl`: satu record per baris berisi waktu,
+  level, thread, NIP, langkah, dan durasi (untuk record penutup `konteks`),
+- mem-flush file setiap `INTERVAL_FLUSH` detik, atau segera bila ada record ERROR.
+
+Level ditebak dari emoji di awal baris (❌ → ERROR, ⚠️/🚫 → WARNING), selain itu INFO
+untuk stdout dan WARNING untuk stderr. NIP dan langkah diambil dari `konteks` milik
+thread yang mencetak, sehingga output beberapa worker paralel tetap bisa dipisahkan.
+"""
+
+import atexit
+import functools
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+FOLDER_LOG = "log_terminal"
+INTERVAL_FLUSH = 1.0  # detik
+UKURAN_BUFFER = 64 * 1024
+
+LEVEL = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+_LEVEL_EMOJI = (("❌", "ERROR"), ("⚠️", "WARNING"), ("🚫", "WARNING"))
+
+_BERHENTI = object()
+_lokal = threading.local()
+_aktif = None
+
+
+def tebak_level(baris, bawaan="INFO"):
+    """Level dari emoji di awal baris (setelah spasi/baris kosong), atau `bawaan`."""
+    awal = baris.lstrip()
+    for emoji, level in _LEVEL_EMOJI:
+        if awal.startswith(emoji):
+            return level
+    return bawaan
+
+
+def konteks_aktif():
+    """Salinan konteks (nip, langkah, ...) thread ini."""
+    return dict(getattr(_lokal, "konteks", {}))
+
+
+@contextmanager
+def konteks(**data):
+    """
+    Tandai semua log thread ini di dalam blok dengan `data` (misalnya nip, langkah).
+
+    Saat blok selesai dicatat satu record DEBUG "selesai" berisi `durasi` (detik) dan
+    status ok/error. Konteks bisa bersarang; nilai dalam menimpa nilai luar.
+    """
+    lama = getattr(_lokal, "konteks", {})
+    _lokal.konteks = {**lama, **data}
+    awal = time.monotonic()
+    status = "ok"
+    try:
+        yield
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        catat("DEBUG", f"selesai ({status})", durasi=round(time.monotonic() - awal, 3), status=status)
+        _lokal.konteks = lama
+
+
+def per_item(fungsi, langkah, nip_dari=lambda item: item):
+    """
+    Bungkus `fungsi(sesi, item, ...)` (bentuk proses pool_browser/pipeline) agar
+    berjalan di dalam `konteks(nip=nip_dari(item), langkah=langkah)`.
+    """
+    @functools.wraps(fungsi)
+    def bungkus(sesi, item, *args):
+        with konteks(nip=nip_dari(item), langkah=langkah):
+            return fungsi(sesi, item, *args)
+    return bungkus
+
+
+def catat(level, pesan, **data):
+    """Catat satu record terstruktur (di luar `print`). Tanpa pencatat aktif: diabaikan."""
+    if _aktif is not None:
+        _aktif.kirim(level, pesan, "stdout", **data)
+
+
+class _AliranLog:
+    """Pengganti sys.stdout/sys.stderr: memotong teks per baris (per thread) lalu mengantrekannya."""
+
+    def __init__(self, pencatat, asli, nama, level_bawaan):
+        self._pencatat = pencatat
+        self._asli = asli
+        self._nama = nama
+        self._level_bawaan = level_bawaan
+        self._sisa = threading.local()
+
+    def write(self, data):
+        teks = getattr(self._sisa, "teks", "") + data
+        *baris, sisa = teks.split("\n")
+        self._sisa.teks = sisa
+        for b in baris:
+            self._pencatat.kirim(tebak_level(b, self._level_bawaan), b, self._nama)
+        return len(data)
+
+    def flush(self):
+        # Baris yang belum diakhiri newline (misalnya print(..., end="", flush=True))
+        sisa = getattr(self._sisa, "teks", "")
+        if sisa:
+            self._sisa.teks = ""
+            self._pencatat.kirim(tebak_level(sisa, self._level_bawaan), sisa, self._nama, baris_baru=False)
+
+    def __getattr__(self, nama):
+        return getattr(self._asli, nama)
+
+
+class Pencatat:
+    """
+    Penulis log di thread latar belakang. Dibuat dan dipasang lewat `pasang_pencatat`.
+
+    Args:
+        path_teks (str): file log teks.
+        path_jsonl (str): file log JSONL.
+        konsol (dict): nama aliran ("stdout"/"stderr") → stream konsol asli.
+        level_konsol (str): level minimum yang diteruskan ke konsol (file selalu lengkap).
+    """
+
+    def __init__(self, path_teks, path_jsonl, konsol, level_konsol="INFO"):
+        self.path_teks = path_teks
+        self.path_jsonl = path_jsonl
+        self._konsol = konsol
+        self._min_konsol = LEVEL[level_konsol]
+        self._antrean = queue.Queue()
+        self._teks = open(path_teks, "w", encoding="utf-8", buffering=UKURAN_BUFFER)
+        self._jsonl = open(path_jsonl, "w", encoding="utf-8", buffering=UKURAN_BUFFER)
+        self._thread = threading.Thread(target=self._jalan, name="pencatat", daemon=True)
+        self._thread.start()
+
+    def kirim(self, level, pesan, aliran="stdout", baris_baru=True, **data):
+        record = {
+            "waktu": time.time(),
+            "level": level,
+            "thread": threading.current_thread().name,
+            **konteks_aktif(),
+            **data,
+            "pesan": pesan,
+        }
+        self._antrean.put((record, aliran, baris_baru))
+
+    def _tulis(self, record, aliran, baris_baru):
+        waktu = datetime.fromtimestamp(record["waktu"])
+        if LEVEL[record["level"]] >= self._min_konsol:
+            self._konsol[aliran].write(record["pesan"] + ("\n" if baris_baru else ""))
+        label = " ".join(str(record[k]) for k in ("nip", "langkah") if record.get(k))
+        self._teks.write(
+            f"{waktu:%Y-%m-%d %H:%M:%S} {record['level']:<7} {f'[{label}] ' if label else ''}{record['pesan']}\n"
+        )
+        self._jsonl.write(json.dumps(
+            {**record, "waktu": waktu.isoformat(timespec="milliseconds")}, ensure_ascii=False, default=str
+        ) + "\n")
+
+    def _jalan(self):
+        flush_terakhir = time.monotonic()
+        berhenti = False
+        while not berhenti:
+            try:
+                batch = [self._antrean.get(timeout=INTERVAL_FLUSH)]
+            except queue.Empty:
+                batch = []
+            # Ambil semua yang sudah menunggu agar konsol & file ditulis per batch
+            while True:
+                try:
+                    batch.append(self._antrean.get_nowait())
+                except queue.Empty:
+                    break
+            ada_error = False
+            for item in batch:
+                if item is _BERHENTI:
+                    berhenti = True
+                    continue
+                try:
+                    self._tulis(*item)
+                except Exception:
+                    pass  # log tidak boleh menghentikan thread penulis
+                ada_error = ada_error or item[0]["level"] == "ERROR"
+            for s in self._konsol.values():
+                try:
+                    s.flush()
+                except Exception:
+                    pass
+            if berhenti or ada_error or time.monotonic() - flush_terakhir >= INTERVAL_FLUSH:
+                self._teks.flush()
+                self._jsonl.flush()
+                flush_terakhir = time.monotonic()
+
+    def tutup(self):
+        """Tulis semua record yang masih antre lalu tutup file."""
+        self._antrean.put(_BERHENTI)
+        self._thread.join()
+        self._teks.close()
+        self._jsonl.close()
+
+
+def pasang_pencatat(nama="terminal", folder=FOLDER_LOG, level_konsol="INFO"):
+    """
+    Alihkan sys.stdout/sys.stderr ke pencatat asinkron. Dipulihkan otomatis saat keluar.
+
+    Returns:
+        str: path file log teks (pasangan `.jsonl`-nya di folder yang sama).
+    """
+    global _aktif
+    if _aktif is not None:
+        return _aktif.path_teks
+    os.makedirs(folder, exist_ok=True)
+    dasar = os.path.join(folder, f"{nama}_{datetime.now():%Y-%m-%d_%H-%M-%S}")
+    stdout_asli, stderr_asli = sys.stdout, sys.stderr
+    _aktif = Pencatat(f"{dasar}.log", f"{dasar}.jsonl", {"stdout": stdout_asli, "stderr": stderr_asli}, level_konsol)
+    sys.stdout = _AliranLog(_aktif, stdout_asli, "stdout", "INFO")
+    sys.stderr = _AliranLog(_aktif, stderr_asli, "stderr", "WARNING")
+
+    def lepas():
+        global _aktif
+        sys.stdout.flush()
+        sys.stderr.flush()
+        sys.stdout, sys.stderr = stdout_asli, stderr_asli
+        _aktif.tutup()
+        _aktif = None
+
+    atexit.register(lepas)
+    return _aktif.path_teks
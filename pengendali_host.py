@@ -0,0 +1,265 @@
+"""
+Pengendali beban per host (SIMPEG, SURADI): konkurensi adaptif, backoff, dan circuit breaker.
+
+Satu `PengendaliHost` per host dipakai bersama oleh semua worker browser dan thread
+HTTP dalam satu proses (registri global seperti `profil_waktu`):
+- Konkurensi AIMD: `izin()` membatasi jumlah operasi bersamaan ke host sampai `batas`.
+  Setiap operasi sukses yang latensinya masih wajar (≤ `TOLERANSI_LAMBAT` × rata-rata
+  bergerak operasi sejenis, misalnya "baris", "http", "unduh") menaikkan `batas`
+  sebesar 1/batas (≈ +1 per satu putaran penuh); timeout, HTTP 5xx, atau koneksi
+  putus memotong `batas` menjadi setengahnya (paling sering sekali per rata-rata
+  latensi, agar satu ledakan error tidak memotong berkali-kali).
+  Operasi yang sukses tetapi lambat menahan `batas` (tidak naik).
+- Circuit breaker: `AMBANG_GAGAL` kegagalan server berturut-turut membuka sirkuit;
+  selama terbuka `izin()` menunggu (baris tidak digagalkan) sampai jeda habis, lalu satu
+  operasi percobaan dilewatkan. Sukses menutup sirkuit, gagal membukanya lagi dengan
+  jeda dua kali lipat (maksimal `JEDA_BUKA_MAKS`).
+- `coba()` mengulang operasi yang gagal karena server (bukan karena data) dengan
+  backoff eksponensial ber-jitter, menggantikan jeda tetap 5s → 10s → 20s.
+
+Error yang bukan masalah server (misalnya elemen tidak ditemukan, validasi form)
+tidak mengubah laju. Operasi yang sudah berada di bawah `izin()` host yang sama dan
+hanya ingin menyumbang sinyal (misalnya request HTTP di dalam baris browser) cukup
+memanggil `lapor()` agar tidak menunggu izin kedua.
+"""
+
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from browser import URL_SIMPEG, URL_SURADI
+
+BATAS_AWAL = 2
+BATAS_MIN = 1
+BATAS_MAKS = 16
+KALI_TURUN = 0.5
+TOLERANSI_LAMBAT = 3.0      # latensi > 3 × rata-rata bergerak = server mulai kewalahan
+BOBOT_EWMA = 0.2
+AMBANG_GAGAL = 5            # kegagalan server berturut-turut sebelum sirkuit terbuka
+JEDA_BUKA = 30.0            # detik
+JEDA_BUKA_MAKS = 300.0
+BACKOFF_DASAR = 2.0         # detik
+BACKOFF_MAKS = 60.0
+
+_POLA_5XX = re.compile(r"\bHTTP 5\d\d\b")
+_POLA_KONEKSI = ("net::ERR_", "ERR_CONNECTION", "ERR_TIMED_OUT", "ERR_NAME_NOT_RESOLVED")
+
+
+class SirkuitTerbuka(Exception):
+    """Sirkuit host terbuka lebih lama dari batas tunggu pemanggil."""
+
+
+def jenis_galat(e):
+    """
+    Golongkan exception: "timeout", "5xx", "koneksi", atau None bila bukan masalah server.
+    """
+    if isinstance(e, (requests.Timeout, TimeoutException, TimeoutError)):
+        return "timeout"
+    if isinstance(e, requests.HTTPError):
+        status = e.response.status_code if e.response is not None else 0
+        return "5xx" if status >= 500 else None
+    if isinstance(e, requests.ConnectionError):
+        return "koneksi"
+    pesan = str(e)
+    if _POLA_5XX.search(pesan):
+        return "5xx"
+    if isinstance(e, WebDriverException) and any(p in pesan for p in _POLA_KONEKSI):
+        return "koneksi"
+    return None
+
+
+class PengendaliHost:
+    """
+    Pengendali beban satu host. Aman dipakai banyak thread.
+
+    Args:
+        nama (str): nama host untuk log dan laporan.
+        batas_awal, batas_min, batas_maks (int): batas konkurensi awal, bawah, dan atas.
+    """
+
+    def __init__(self, nama, batas_awal=BATAS_AWAL, batas_min=BATAS_MIN, batas_maks=BATAS_MAKS):
+        self.nama = nama
+        self.batas_min = batas_min
+        self.batas_maks = batas_maks
+        self._kondisi = threading.Condition()
+        self._batas = float(max(batas_min, min(batas_awal, batas_maks)))
+        self._aktif = 0
+        self._ewma = {}             # operasi → rata-rata bergerak latensi (detik)
+        self._turun_terakhir = 0.0
+        self._gagal_beruntun = 0
+        self._status = "tertutup"   # tertutup / terbuka / setengah
+        self._buka_sampai = 0.0
+        self._trip_beruntun = 0
+        self._uji_berjalan = False
+        self.statistik = {"sukses": 0, "lambat": 0, "gagal": 0, "trip": 0, "tunggu": 0.0,
+                          "batas_terendah": self._batas, "batas_tertinggi": self._batas}
+
+    def konkurensi(self):
+        """Batas konkurensi saat ini (bilangan bulat, minimal `batas_min`)."""
+        with self._kondisi:
+            return max(self.batas_min, int(self._batas))
+
+    def _ambil(self, batas_tunggu):
+        awal = time.monotonic()
+        with self._kondisi:
+            while True:
+                sekarang = time.monotonic()
+                if batas_tunggu is not None and sekarang - awal > batas_tunggu:
+                    raise SirkuitTerbuka(f"host {self.nama}: tidak ada izin setelah {batas_tunggu:.0f} detik")
+                if self._status == "terbuka":
+                    if sekarang < self._buka_sampai:
+                        self._kondisi.wait(self._buka_sampai - sekarang)
+                        continue
+                    self._status = "setengah"
+                if self._status == "setengah":
+                    if not self._uji_berjalan and self._aktif == 0:
+                        self._uji_berjalan = True
+                        break
+                elif self._aktif < max(self.batas_min, int(self._batas)):
+                    break
+                self._kondisi.wait(1.0)
+            self._aktif += 1
+            self.statistik["tunggu"] += time.monotonic() - awal
+
+    def _lepas(self):
+        with self._kondisi:
+            self._aktif -= 1
+            self._uji_berjalan = False
+            self._kondisi.notify_all()
+
+    @contextmanager
+    def izin(self, operasi="umum", batas_tunggu=None):
+        """
+        Jalankan blok sebagai satu `operasi` ke host: tunggu slot, ukur latensi, laporkan hasil.
+
+        Raises:
+            SirkuitTerbuka: bila `batas_tunggu` (detik) terlewati sebelum mendapat izin.
+        """
+        self._ambil(batas_tunggu)
+        awal = time.monotonic()
+        galat = None
+        try:
+            yield
+        except BaseException as e:
+            galat = e
+            raise
+        finally:
+            # Hasil dicatat sebelum slot dilepas agar status sirkuit sudah diperbarui
+            self.lapor(time.monotonic() - awal, galat, operasi)
+            self._lepas()
+
+    def lapor(self, durasi, galat=None, operasi="umum"):
+        """Catat hasil satu operasi (tanpa izin): sukses bila `galat` None."""
+        jenis = jenis_galat(galat) if galat is not None else None
+        pesan = None
+        with self._kondisi:
+            sekarang = time.monotonic()
+            ewma = self._ewma.get(operasi)
+            if galat is None:
+                lambat = ewma is not None and durasi > TOLERANSI_LAMBAT * ewma
+                self.statistik["lambat" if lambat else "sukses"] += 1
+                if not lambat:
+                    self._batas = min(self.batas_maks, self._batas + 1.0 / self._batas)
+                self._ewma[operasi] = durasi if ewma is None else (1 - BOBOT_EWMA) * ewma + BOBOT_EWMA * durasi
+                self._gagal_beruntun = 0
+                if self._status == "setengah":
+                    self._status, self._trip_beruntun = "tertutup", 0
+                    pesan = f"✅ Host {self.nama} pulih, sirkuit ditutup lagi"
+            elif jenis is not None:
+                self.statistik["gagal"] += 1
+                self._gagal_beruntun += 1
+                if sekarang - self._turun_terakhir >= (ewma or 0.0):
+                    self._batas = max(float(self.batas_min), self._batas * KALI_TURUN)
+                    self._turun_terakhir = sekarang
+                if self._status == "setengah" or self._gagal_beruntun >= AMBANG_GAGAL:
+                    jeda = min(JEDA_BUKA_MAKS, JEDA_BUKA * 2 ** self._trip_beruntun)
+                    self._status, self._buka_sampai = "terbuka", sekarang + jeda
+                    self._trip_beruntun += 1
+                    self._gagal_beruntun = 0
+                    self.statistik["trip"] += 1
+                    pesan = (f"⚠️ Host {self.nama} bermasalah ({jenis}): sirkuit dibuka, "
+                             f"operasi ditahan {jeda:.0f} detik")
+            self.statistik["batas_terendah"] = min(self.statistik["batas_terendah"], self._batas)
+            self.statistik["batas_tertinggi"] = max(self.statistik["batas_tertinggi"], self._batas)
+            self._kondisi.notify_all()
+        if pesan:
+            print(pesan)
+
+    def jeda_ulang(self, percobaan):
+        """Jeda sebelum percobaan ulang ke-`percobaan` (mulai 0): eksponensial dengan full jitter."""
+        return random.uniform(0, min(BACKOFF_MAKS, BACKOFF_DASAR * 2 ** percobaan))
+
+    def coba(self, fungsi, *args, operasi="umum", maks_coba=3, **kwargs):
+        """
+        Jalankan `fungsi(*args, **kwargs)` di bawah `izin(operasi)`, ulangi bila gagal karena server.
+
+        Returns:
+            hasil `fungsi`.
+
+        Raises:
+            exception terakhir bila semua percobaan gagal, atau langsung bila error-nya
+            bukan masalah server.
+        """
+        for percobaan in range(maks_coba):
+            try:
+                with self.izin(operasi):
+                    return fungsi(*args, **kwargs)
+            except Exception as e:
+                jenis = jenis_galat(e)
+                if jenis is None or percobaan == maks_coba - 1:
+                    raise
+                jeda = self.jeda_ulang(percobaan)
+                print(f"⚠️ {self.nama} {jenis} (percobaan {percobaan + 1}/{maks_coba}), ulangi dalam {jeda:.1f} detik")
+                time.sleep(jeda)
+
+    def ringkasan(self):
+        with self._kondisi:
+            return {
+                "host": self.nama,
+                "batas": round(self._batas, 2),
+                "status": self._status,
+                "latensi": {k: round(v, 3) for k, v in self._ewma.items()},
+                **{k: round(v, 2) if isinstance(v, float) else v for k, v in self.statistik.items()},
+            }
+
+
+_lock = threading.Lock()
+_registri = {}
+
+
+def pengendali(nama, **opsi):
+    """
+    PengendaliHost bersama untuk host `nama` ("SIMPEG", "SURADI", atau netloc lain).
+    `opsi` (batas_awal, batas_min, batas_maks) hanya dipakai saat pertama kali dibuat.
+    """
+    with _lock:
+        if nama not in _registri:
+            _registri[nama] = PengendaliHost(nama, **opsi)
+        return _registri[nama]
+
+
+def nama_host(url):
+    """Nama host untuk `url`: "SIMPEG", "SURADI", atau URL apa adanya."""
+    if url.startswith(URL_SIMPEG):
+        return "SIMPEG"
+    if url.startswith(URL_SURADI):
+        return "SURADI"
+    return url.split("/")[2] if "://" in url else url
+
+
+def cetak_ringkasan():
+    """Cetak ringkasan semua host yang pernah dipakai; kembalikan list ringkasannya."""
+    with _lock:
+        daftar = [p.ringkasan() for p in _registri.values()]
+    for r in daftar:
+        print(
+            f"🚦 {r['host']}: batas {r['batas']} (rentang {r['batas_terendah']}-{r['batas_tertinggi']}) | "
+            f"sukses {r['sukses']} | lambat {r['lambat']} | gagal {r['gagal']} | trip {r['trip']} | "
+            f"tunggu {r['tunggu']}s | latensi {', '.join(f'{k} {v}s' for k, v in r['latensi'].items()) or '-'}"
+        )
+    return daftar
@@ -0,0 +1,188 @@
+"""
+Penjaga sesi login SIMPEG dan SURADI: deteksi sesi kedaluwarsa, masuk ulang, ulangi langkah.
+
+Run ribuan baris lebih lama dari umur sesi login SIMPEG maupun cookie SURADI dari
+`cookie.json`. Tanpa penjaga, setiap baris setelah sesi habis gagal satu per satu
+setelah menunggu penuh `WebDriverWait` di halaman login.
+
+Setiap driver dipasangi satu `PenjagaSesi` (`pasang_simpeg` / `pasang_suradi`, seperti
+`hitung_perintah.pasang`). Lalu:
+- `periksa(driver)` dipanggil tepat setelah halaman dibuka. Bila URL berpindah ke
+  halaman login (SIMPEG) atau halaman awal SURADI, `SesiKedaluwarsa` langsung dilempar
+  (satu perintah WebDriver, tanpa menunggu elemen form yang tidak akan pernah muncul).
+- `PenjagaSesi.jalankan(fungsi, ...)` menjalankan satu langkah. Bila langkah melempar
+  `SesiKedaluwarsa`, atau gagal sementara sesi ternyata sudah habis, penjaga masuk
+  ulang di Chrome yang sama lalu mengulang langkah tersebut:
+  * SIMPEG: isi ulang form login (`login_simpeg`),
+  * SURADI: baca ulang `cookie.json` (bisa diperbarui selagi run berjalan) lalu muat
+    ke driver.
+  Setelah pulih, `setelah_pulih` dipanggil, misalnya untuk menyalin ulang cookie ke
+  `requests.Session` milik PengunduhPDF / PengirimForm.
+- `dengan_pemulihan(fungsi)` membungkus fungsi per item pool_browser/pipeline agar
+  satu baris diulang (langkah yang sudah selesai dilewati lewat jurnal).
+"""
+
+import functools
+from urllib.parse import urlsplit
+
+from browser import URL_SIMPEG, URL_SURADI, login_simpeg, muat_cookie_suradi
+from profil_waktu import fase
+
+# Berapa kali satu langkah boleh diulang setelah masuk ulang
+MAKS_PULIH = 2
+
+
+class SesiKedaluwarsa(Exception):
+    """Halaman yang dibuka ternyata halaman login: sesi SIMPEG/SURADI sudah habis."""
+
+
+def _path(url):
+    return urlsplit(url or "").path.rstrip("/").lower()
+
+
+def sesi_simpeg_habis(driver):
+    """True bila driver SIMPEG sedang berada di halaman login."""
+    url = driver.current_url
+    return url.startswith(URL_SIMPEG) and "/login" in _path(url)
+
+
+def sesi_suradi_habis(driver):
+    """True bila driver SURADI dikembalikan ke halaman awal / login (cookie tidak berlaku)."""
+    url = driver.current_url
+    return url.startswith(URL_SURADI) and (_path(url) == "" or "login" in _path(url))
+
+
+class PenjagaSesi:
+    """
+    Penjaga sesi satu driver. Hanya dipakai dari thread pemilik driver.
+
+    Args:
+        nama (str): "SIMPEG" atau "SURADI" (untuk log dan nama fase).
+        driver: WebDriver yang dijaga.
+        habis: callable(driver) → bool, deteksi sesi kedaluwarsa.
+        masuk_ulang: callable(driver), memulihkan sesi di driver yang sama.
+        maks_pulih (int): batas pengulangan satu langkah.
+    """
+
+    def __init__(self, nama, driver, habis, masuk_ulang, maks_pulih=MAKS_PULIH):
+        self.nama = nama
+        self.driver = driver
+        self.habis = habis
+        self.masuk_ulang = masuk_ulang
+        self.maks_pulih = maks_pulih
+        self.jumlah_pulih = 0
+        self._setelah_pulih = []
+
+    def setelah_pulih(self, fungsi):
+        """Daftarkan callable() yang dipanggil setiap kali sesi berhasil dipulihkan."""
+        self._setelah_pulih.append(fungsi)
+        return fungsi
+
+    def periksa(self):
+        """Lempar `SesiKedaluwarsa` bila halaman saat ini menandakan sesi habis."""
+        if self.habis(self.driver):
+            raise SesiKedaluwarsa(f"sesi {self.nama} kedaluwarsa ({self.driver.current_url})")
+
+    def _sudah_habis(self):
+        try:
+            return self.habis(self.driver)
+        except Exception:
+            return False  # driver bermasalah: bukan urusan penjaga sesi
+
+    def pulihkan(self):
+        """
+        Masuk ulang di driver yang sama.
+
+        Raises:
+            SesiKedaluwarsa: bila setelah masuk ulang sesi tetap tidak berlaku
+                (kredensial salah, cookie.json sudah kedaluwarsa).
+        """
+        print(f"🔑 Sesi {self.nama} kedaluwarsa, masuk ulang tanpa menutup Chrome...")
+        with fase(f"relogin_{self.nama.lower()}"):
+            self.masuk_ulang(self.driver)
+            if self.habis(self.driver):
+                raise SesiKedaluwarsa(f"masuk ulang {self.nama} gagal, sesi tetap di {self.driver.current_url}")
+        self.jumlah_pulih += 1
+        for fungsi in self._setelah_pulih:
+            fungsi()
+        print(f"✅ Sesi {self.nama} dipulihkan (ke-{self.jumlah_pulih})")
+
+    def jalankan(self, fungsi, *args, gagal_bila=None, **kwargs):
+        """
+        Jalankan `fungsi(*args, **kwargs)`; ulangi setelah masuk ulang bila sesi habis.
+
+        Args:
+            gagal_bila: callable(hasil) → bool, opsional. Untuk langkah yang menelan
+                error-nya sendiri dan hanya mengembalikan status (misalnya False); bila
+                hasilnya dianggap gagal dan sesi ternyata habis, langkah juga diulang.
+
+        Returns:
+            hasil `fungsi` dari percobaan terakhir.
+        """
+        for percobaan in range(self.maks_pulih + 1):
+            terakhir = percobaan == self.maks_pulih
+            try:
+                hasil = fungsi(*args, **kwargs)
+            except SesiKedaluwarsa:
+                if terakhir:
+                    raise
+            except Exception:
+                if terakhir or not self._sudah_habis():
+                    raise
+            else:
+                if terakhir or gagal_bila is None or not gagal_bila(hasil) or not self._sudah_habis():
+                    return hasil
+            self.pulihkan()
+
+
+def pasang(driver, penjaga):
+    driver.penjaga_sesi = penjaga
+    return penjaga
+
+
+def pasang_simpeg(driver, login=login_simpeg):
+    """Pasang penjaga sesi SIMPEG (masuk ulang lewat form login) pada `driver`."""
+    return pasang(driver, PenjagaSesi("SIMPEG", driver, sesi_simpeg_habis, login))
+
+
+def pasang_suradi(driver, pengunduh=None):
+    """
+    Pasang penjaga sesi SURADI (muat ulang cookie.json) pada `driver`. Cookie baru ikut
+    disalin ke `pengunduh` (PengunduhPDF) bila diberikan.
+    """
+    penjaga = pasang(driver, PenjagaSesi("SURADI", driver, sesi_suradi_habis, muat_cookie_suradi))
+    if pengunduh is not None:
+        penjaga.setelah_pulih(pengunduh.segarkan_cookie)
+    return penjaga
+
+
+def penjaga(driver):
+    """PenjagaSesi milik `driver`, atau None bila belum dipasang."""
+    return getattr(driver, "penjaga_sesi", None)
+
+
+def periksa(driver):
+    """Periksa sesi `driver` setelah membuka halaman; tanpa penjaga tidak melakukan apa-apa."""
+    p = penjaga(driver)
+    if p is not None:
+        p.periksa()
+
+
+def jalankan(driver, fungsi, *args, **kwargs):
+    """`PenjagaSesi.jalankan` milik `driver`, atau panggil `fungsi` langsung bila tanpa penjaga."""
+    p = penjaga(driver)
+    if p is None:
+        kwargs.pop("gagal_bila", None)
+        return fungsi(*args, **kwargs)
+    return p.jalankan(fungsi, *args, **kwargs)
+
+
+def dengan_pemulihan(fungsi, driver_dari=lambda sesi: sesi["driver"]):
+    """
+    Bungkus `fungsi(sesi, item, ...)` (bentuk proses pool_browser/pipeline) agar satu
+    item diulang setelah sesi driver `driver_dari(sesi)` dipulihkan.
+    """
+    @functools.wraps(fungsi)
+    def bungkus(sesi, item, *args):
+        return jalankan(driver_dari(sesi), fungsi, sesi, item, *args)
+    return bungkus
@@ -0,0 +1,246 @@
+"""
+Pipeline producer/consumer bertahap dengan antrean terbatas dan statistik per tahap.
+
+Berbeda dengan `pool_browser.jalankan_pool` (setiap worker mengerjakan satu item dari
+awal sampai akhir), di sini pekerjaan dipecah menjadi beberapa tahap yang berjalan
+bersamaan, misalnya untuk Tugas2.py:
+
+    NIP → [pindai SIMPEG] → cuti tanpa file → [cek & unduh SURADI] → PDF → [upload SIMPEG]
+
+Setiap tahap punya thread sendiri (masing-masing dengan konteks sendiri, misalnya
+driver Chrome), dihubungkan oleh `queue.Queue(maxsize=...)`. Bila tahap berikutnya
+lambat, `put` ke antrean penuh menahan tahap sebelumnya (back-pressure), sehingga
+memori dan jumlah PDF yang menunggu tetap terbatas.
+
+Tahap yang diberi `pengendali` (pengendali_host) menjalankan setiap item di bawah
+izin host tersebut, sehingga beberapa tahap yang membebani host yang sama berbagi
+satu batas konkurensi adaptif. Item hasil tahap itu baru diteruskan ke antrean
+berikutnya setelah izin dilepas: tahap yang tertahan back-pressure tidak memegang
+slot host yang dibutuhkan tahap hilir.
+"""
+
+import queue
+import threading
+import time
+
+_SELESAI = object()
+
+UKURAN_ANTREAN = 8
+INTERVAL_LAPORAN = 30  # detik
+
+
+class Tahap:
+    """
+    Definisi satu tahap pipeline.
+
+    Args:
+        nama (str): nama tahap untuk log & statistik.
+        proses: callable(konteks, item, kirim) → None. Panggil `kirim(item_baru)` untuk
+            meneruskan nol atau lebih item ke tahap berikutnya.
+        jumlah_thread (int): jumlah thread paralel untuk tahap ini.
+        buat_konteks: callable(id_thread) → konteks (misalnya driver yang sudah login).
+            None = konteks None.
+        tutup_konteks: callable(konteks) → None.
+        saat_error: callable(item, exception) → None, dipanggil bila `proses` gagal
+            atau tidak ada thread tahap ini yang berhasil membuat konteks.
+        pengendali (PengendaliHost, optional): host yang dibebani satu item tahap ini.
+    """
+
+    def __init__(self, nama, proses, jumlah_thread=1, buat_konteks=None, tutup_konteks=None,
+                 saat_error=None, pengendali=None):
+        self.nama = nama
+        self.proses = proses
+        self.jumlah_thread = max(1, jumlah_thread)
+        self.buat_konteks = buat_konteks
+        self.tutup_konteks = tutup_konteks
+        self.saat_error = saat_error
+        self.pengendali = pengendali
+
+
+class StatistikTahap:
+    """Penghitung per tahap: item masuk/keluar/gagal, waktu sibuk, dan waktu tertahan back-pressure."""
+
+    def __init__(self, nama):
+        self.nama = nama
+        self._lock = threading.Lock()
+        self.masuk = 0
+        self.keluar = 0
+        self.gagal = 0
+        self.sibuk = 0.0
+        self.tertahan = 0.0
+        self.mulai = None
+        self.selesai = None
+
+    def tambah(self, **nilai):
+        with self._lock:
+            for nama, n in nilai.items():
+                setattr(self, nama, getattr(self, nama) + n)
+
+    def ringkasan(self):
+        """dict ringkasan; `per_menit` dihitung dari item masuk selama tahap berjalan."""
+        with self._lock:
+            akhir = self.selesai or time.monotonic()
+            durasi = akhir - self.mulai if self.mulai else 0.0
+            return {
+                "tahap": self.nama,
+                "masuk": self.masuk,
+                "keluar": self.keluar,
+                "gagal": self.gagal,
+                "durasi": round(durasi, 1),
+                "sibuk": round(self.sibuk, 1),
+                "tertahan": round(self.tertahan, 1),
+                "per_menit": round(self.masuk / durasi * 60, 2) if durasi else 0.0,
+            }
+
+
+def _cetak_statistik(statistik, antrean):
+    for st, q in zip(statistik, antrean):
+        r = st.ringkasan()
+        print(
+            f"📊 [{r['tahap']}] antre {q.qsize()} | masuk {r['masuk']} | keluar {r['keluar']} | "
+            f"gagal {r['gagal']} | {r['per_menit']}/menit | sibuk {r['sibuk']}s | tertahan {r['tertahan']}s"
+        )
+
+
+def jalankan_pipeline(sumber, daftar_tahap, ukuran_antrean=UKURAN_ANTREAN, interval_laporan=INTERVAL_LAPORAN):
+    """
+    Jalankan pipeline sampai semua item dari `sumber` melewati semua tahap.
+
+    Args:
+        sumber: iterable item untuk tahap pertama.
+        daftar_tahap (list[Tahap]): tahap berurutan.
+        ukuran_antrean (int): kapasitas antrean di antara dua tahap (back-pressure).
+        interval_laporan (float): jeda cetak statistik berkala (detik); 0 = tidak dicetak.
+
+    Returns:
+        list[dict]: ringkasan statistik per tahap (lihat `StatistikTahap.ringkasan`).
+    """
+    # Antrean masukan tahap pertama tidak dibatasi: item sumber ringan, dan diisi thread
+    # pengisi selagi `sumber` dibaca agar tahap pertama bisa langsung mulai
+    antrean = [queue.Queue()] + [queue.Queue(maxsize=ukuran_antrean) for _ in daftar_tahap[1:]]
+    statistik = [StatistikTahap(t.nama) for t in daftar_tahap]
+    galat_pengisi = []
+
+    def pengisi():
+        try:
+            for item in sumber:
+                antrean[0].put(item)
+        except Exception as e:
+            print(f"❌ Gagal membaca sumber pipeline: {e}")
+            galat_pengisi.append(e)
+        finally:
+            for _ in range(daftar_tahap[0].jumlah_thread):
+                antrean[0].put(_SELESAI)
+
+    threads = [threading.Thread(target=pengisi, name="pengisi", daemon=True)]
+    for i, tahap in enumerate(daftar_tahap):
+        masuk = antrean[i]
+        keluar = antrean[i + 1] if i + 1 < len(daftar_tahap) else None
+        jumlah_berikut = daftar_tahap[i + 1].jumlah_thread if keluar is not None else 0
+        st = statistik[i]
+        siap = threading.Barrier(tahap.jumlah_thread)
+        sisa_thread = [tahap.jumlah_thread]
+        hidup = [0]
+        kunci = threading.Lock()
+
+        def kirim(item, keluar=keluar, st=st):
+            if keluar is None:
+                return
+            awal = time.monotonic()
+            keluar.put(item)
+            st.tambah(keluar=1, tertahan=time.monotonic() - awal)
+
+        def lapor_error(tahap, item, e, st):
+            st.tambah(gagal=1)
+            if tahap.saat_error is not None:
+                try:
+                    tahap.saat_error(item, e)
+                except Exception as e2:
+                    print(f"❌ [{tahap.nama}] Gagal mencatat error: {e2}")
+
+        def worker(id_thread, tahap=tahap, masuk=masuk, keluar=keluar, jumlah_berikut=jumlah_berikut,
+                   st=st, siap=siap, sisa_thread=sisa_thread, hidup=hidup, kunci=kunci, kirim=kirim):
+            nama = f"{tahap.nama}-{id_thread}"
+            konteks, ok = None, True
+            try:
+                if tahap.buat_konteks is not None:
+                    konteks = tahap.buat_konteks(id_thread)
+            except Exception as e:
+                print(f"❌ [{nama}] Gagal membuat konteks: {e}")
+                ok = False
+            with kunci:
+                hidup[0] += ok
+                if st.mulai is None:
+                    st.mulai = time.monotonic()
+            siap.wait()
+            # Bila semua thread tahap ini gagal, thread tetap menguras antrean agar
+            # tahap sebelumnya tidak tertahan selamanya; setiap item dicatat gagal.
+            if ok or hidup[0] == 0:
+                try:
+                    while True:
+                        item = masuk.get()
+                        if item is _SELESAI:
+                            break
+                        st.tambah(masuk=1)
+                        if not ok:
+                            lapor_error(tahap, item, RuntimeError(f"tidak ada konteks aktif untuk tahap {tahap.nama}"), st)
+                            continue
+                        awal = time.monotonic()
+                        try:
+                            if tahap.pengendali is None:
+                                tahap.proses(konteks, item, kirim)
+                            else:
+                                # Izin host hanya dipegang selama `proses`; hasilnya diteruskan
+                                # setelah izin dilepas, agar menunggu antrean penuh tidak menahan
+                                # slot host (dan tidak terhitung sebagai latensi host)
+                                tertunda = []
+                                try:
+                                    with tahap.pengendali.izin(tahap.nama):
+                                        tahap.proses(konteks, item, tertunda.append)
+                                finally:
+                                    for hasil in tertunda:
+                                        kirim(hasil)
+                        except Exception as e:
+                            print(f"❌ [{nama}] Error tidak tertangani: {e}")
+                            lapor_error(tahap, item, e, st)
+                        finally:
+                            st.tambah(sibuk=time.monotonic() - awal)
+                finally:
+                    if ok and tahap.tutup_konteks is not None:
+                        try:
+                            tahap.tutup_konteks(konteks)
+                        except Exception:
+                            pass
+
+            with kunci:
+                sisa_thread[0] -= 1
+                terakhir = sisa_thread[0] == 0
+            if terakhir:
+                st.selesai = time.monotonic()
+                if keluar is not None:
+                    for _ in range(jumlah_berikut):
+                        keluar.put(_SELESAI)
+
+        for id_thread in range(1, tahap.jumlah_thread + 1):
+            threads.append(threading.Thread(
+                target=worker, args=(id_thread,), name=f"{tahap.nama}-{id_thread}", daemon=True
+            ))
+
+    berhenti = threading.Event()
+
+    def pelapor():
+        while not berhenti.wait(interval_laporan):
+            _cetak_statistik(statistik, antrean)
+
+    if interval_laporan:
+        threading.Thread(target=pelapor, name="statistik", daemon=True).start()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    berhenti.set()
+
+    _cetak_statistik(statistik, antrean)
+    if galat_pengisi:
+        raise galat_pengisi[0]
+    return [st.ringkasan() for st in statistik]
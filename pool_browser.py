@@ -0,0 +1,116 @@
+"""
+Pool worker browser: membagi baris Excel ke N sesi Chrome yang masing-masing sudah login.
+
+Setiap worker adalah thread yang memiliki sesi sendiri (driver SIMPEG, dan untuk
+Tugas2 juga driver SURADI). Worker mengambil pekerjaan dari satu antrean bersama,
+sehingga worker yang lebih cepat otomatis mengerjakan lebih banyak baris.
+Log kegagalan/hasil tiap worker dikumpulkan terpisah lalu digabung sesuai urutan
+baris aslinya.
+
+`pekerjaan` boleh berupa generator (misalnya `rencana_kerja.alirkan_rencana`): item
+dimasukkan ke antrean oleh thread pengisi selagi dibaca, jadi worker mulai bekerja
+tanpa menunggu seluruh file masukan selesai dibaca.
+
+Bila diberi `pengendali` (pengendali_host), setiap baris berjalan di bawah izinnya:
+jumlah worker yang benar-benar aktif mengikuti batas konkurensi adaptif host tersebut
+dan berhenti sementara saat sirkuitnya terbuka.
+"""
+
+import queue
+import threading
+from contextlib import nullcontext
+
+_SELESAI = object()
+
+
+def jalankan_pool(pekerjaan, jumlah_worker, buat_sesi, proses, tutup_sesi, saat_error=None, pengendali=None):
+    """
+    Jalankan `proses` untuk setiap item di `pekerjaan` memakai N worker paralel.
+
+    Args:
+        pekerjaan: iterable item (misalnya RencanaPegawai atau NIP); dibaca bertahap.
+        jumlah_worker (int): jumlah sesi browser paralel (minimal 1).
+        buat_sesi: callable(id_worker) → sesi; membuat driver dan login.
+        proses: callable(sesi, item, log) → None; `log` adalah list milik item ini,
+            isi dengan dict hasil/kegagalan seperti `log_gagal` / `log_list`.
+        tutup_sesi: callable(sesi) → None; menutup driver milik worker.
+        saat_error: callable(item, exception) → dict | None, dipanggil bila `proses`
+            melempar exception (atau tidak ada worker yang hidup). Dict yang dikembalikan
+            ditambahkan ke log gabungan.
+        pengendali (PengendaliHost, optional): host yang dibebani satu baris; None = tanpa batas.
+
+    Returns:
+        list[dict]: gabungan log semua worker, urut sesuai urutan item di `pekerjaan`.
+    """
+    antrean = queue.Queue()
+    if hasattr(pekerjaan, "__len__"):
+        jumlah_worker = min(jumlah_worker, len(pekerjaan) or 1)
+    jumlah_worker = max(1, jumlah_worker)
+    hasil = {}
+    galat_pengisi = []
+
+    def pengisi():
+        try:
+            for urutan, item in enumerate(pekerjaan):
+                hasil[urutan] = []
+                antrean.put((urutan, item))
+        except Exception as e:
+            print(f"❌ Gagal membaca pekerjaan: {e}")
+            galat_pengisi.append(e)
+        finally:
+            for _ in range(jumlah_worker):
+                antrean.put(_SELESAI)
+
+    def catat_error(urutan, item, e):
+        if saat_error is not None:
+            entri = saat_error(item, e)
+            if entri:
+                hasil[urutan].append(entri)
+
+    def worker(id_worker):
+        try:
+            sesi = buat_sesi(id_worker)
+        except Exception as e:
+            print(f"❌ [W{id_worker}] Gagal membuat sesi browser: {e}")
+            return
+        print(f"🧑‍💻 [W{id_worker}] Sesi browser siap")
+        try:
+            while True:
+                tugas = antrean.get()
+                if tugas is _SELESAI:
+                    break
+                urutan, item = tugas
+                try:
+                    with pengendali.izin("baris") if pengendali is not None else nullcontext():
+                        proses(sesi, item, hasil[urutan])
+                except Exception as e:
+                    print(f"❌ [W{id_worker}] Error tidak tertangani: {e}")
+                    catat_error(urutan, item, e)
+        finally:
+            try:
+                tutup_sesi(sesi)
+            except Exception:
+                pass
+
+    threads = [threading.Thread(target=pengisi, name="pengisi", daemon=True)] + [
+        threading.Thread(target=worker, args=(i,), name=f"W{i}", daemon=True)
+        for i in range(1, jumlah_worker + 1)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Sisa pekerjaan bila semua worker gagal membuat sesi
+    while True:
+        try:
+            tugas = antrean.get_nowait()
+        except queue.Empty:
+            break
+        if tugas is not _SELESAI:
+            urutan, item = tugas
+            catat_error(urutan, item, RuntimeError("tidak ada worker browser yang aktif"))
+
+    if galat_pengisi:
+        raise galat_pengisi[0]
+    return [entri for log in hasil.values() for entri in log]
@@ -0,0 +1,145 @@
+"""
+Pengukuran waktu per fase (span) dan laporan performa akhir run.
+
+Setiap fase yang dibungkus `with fase("nama"):` (misalnya `search_nip`, `open_detail`,
+`select_skpd`, `upload_spmt`, `suradi_lookup`, `download_pdf`) dicatat durasinya beserta
+NIP dari `pencatat.konteks` thread tersebut. Di akhir run `simpan_laporan` menulis
+ringkasan per fase (jumlah, total, rata-rata, p50, p95, maks, gagal) dan throughput
+baris/jam ke CSV dan JSON.
+
+Pencatatan bersifat global per proses (seperti `pencatat`), aman dipakai banyak
+thread, dan modul lain (misalnya `cache_pegawai`) bisa ikut mencatat fase tanpa
+perlu diberi objek apa pun.
+"""
+
+import csv
+import json
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+import pencatat
+
+_lock = threading.Lock()
+_durasi = defaultdict(list)  # fase → [detik]
+_gagal = defaultdict(int)    # fase → jumlah yang berakhir exception
+_nip = set()
+_rentang = [None, None]      # (awal span pertama, akhir span terakhir), time.monotonic()
+_lokal = threading.local()   # tumpukan fase yang sedang berjalan di thread ini
+
+
+def fase_aktif():
+    """Nama fase terdalam yang sedang berjalan di thread ini, atau None."""
+    tumpukan = getattr(_lokal, "tumpukan", None)
+    return tumpukan[-1] if tumpukan else None
+
+
+@contextmanager
+def fase(nama):
+    """Ukur durasi blok sebagai fase `nama`; exception tetap diteruskan (dan dihitung gagal)."""
+    if not hasattr(_lokal, "tumpukan"):
+        _lokal.tumpukan = []
+    _lokal.tumpukan.append(nama)
+    awal = time.monotonic()
+    gagal = False
+    try:
+        yield
+    except BaseException:
+        gagal = True
+        raise
+    finally:
+        akhir = time.monotonic()
+        _lokal.tumpukan.pop()
+        nip = pencatat.konteks_aktif().get("nip")
+        with _lock:
+            _durasi[nama].append(akhir - awal)
+            _gagal[nama] += gagal
+            if nip:
+                _nip.add(nip)
+            if _rentang[0] is None or awal < _rentang[0]:
+                _rentang[0] = awal
+            if _rentang[1] is None or akhir > _rentang[1]:
+                _rentang[1] = akhir
+        pencatat.catat("DEBUG", f"fase {nama}: {akhir - awal:.2f} detik", fase=nama,
+                       durasi=round(akhir - awal, 3), gagal=gagal)
+
+
+def persentil(data_urut, p):
+    """Persentil metode nearest-rank dari list yang sudah terurut (p dalam 0-100)."""
+    if not data_urut:
+        return 0.0
+    return data_urut[max(0, math.ceil(p / 100 * len(data_urut)) - 1)]
+
+
+def ringkasan():
+    """
+    Returns:
+        list[dict]: per fase {fase, jumlah, gagal, total, rata, p50, p95, maks} (detik),
+        diurutkan dari total waktu terbesar.
+    """
+    with _lock:
+        salinan = {nama: sorted(d) for nama, d in _durasi.items()}
+        gagal = dict(_gagal)
+    hasil = [
+        {
+            "fase": nama,
+            "jumlah": len(d),
+            "gagal": gagal.get(nama, 0),
+            "total": round(sum(d), 3),
+            "rata": round(sum(d) / len(d), 3),
+            "p50": round(persentil(d, 50), 3),
+            "p95": round(persentil(d, 95), 3),
+            "maks": round(d[-1], 3),
+        }
+        for nama, d in salinan.items()
+    ]
+    return sorted(hasil, key=lambda r: r["total"], reverse=True)
+
+
+def throughput(jumlah_baris=None):
+    """
+    Baris per jam selama rentang span pertama sampai terakhir.
+
+    Args:
+        jumlah_baris (int, optional): jumlah baris yang diproses; default jumlah NIP
+            berbeda yang tercatat di span.
+    """
+    with _lock:
+        awal, akhir = _rentang
+        baris = len(_nip) if jumlah_baris is None else jumlah_baris
+    durasi = akhir - awal if awal is not None else 0.0
+    return {
+        "baris": baris,
+        "durasi": round(durasi, 1),
+        "baris_per_jam": round(baris / durasi * 3600, 1) if durasi else 0.0,
+    }
+
+
+def simpan_laporan(path_dasar, jumlah_baris=None):
+    """
+    Tulis laporan performa ke `<path_dasar>.csv` (satu baris per fase) dan
+    `<path_dasar>.json` (throughput + fase), lalu cetak ringkasannya.
+
+    Returns:
+        tuple[str, str]: path CSV dan JSON.
+    """
+    fase_run = ringkasan()
+    tp = throughput(jumlah_baris)
+    path_csv, path_json = f"{path_dasar}.csv", f"{path_dasar}.json"
+    with open(path_csv, "w", newline="", encoding="utf-8") as f:
+        penulis = csv.DictWriter(f, fieldnames=["fase", "jumlah", "gagal", "total", "rata", "p50", "p95", "maks"])
+        penulis.writeheader()
+        penulis.writerows(fase_run)
+    with open(path_json, "w", encoding="utf-8") as f:
+        json.dump({"dibuat": datetime.now().isoformat(timespec="seconds"), **tp, "fase": fase_run},
+                  f, ensure_ascii=False, indent=2)
+
+    print(f"\n⏱️ Performa: {tp['baris']} baris dalam {tp['durasi']} detik ({tp['baris_per_jam']} baris/jam)")
+    for r in fase_run:
+        print(f"   {r['fase']:<24} n={r['jumlah']:<5} p50 {r['p50']:>7.2f}s | p95 {r['p95']:>7.2f}s | "
+              f"maks {r['maks']:>7.2f}s | total {r['total']:>8.1f}s")
+    print(f"📝 Laporan performa disimpan di '{path_csv}' dan '{path_json}'")
+    return path_csv, path_json
@@ -0,0 +1,240 @@
+"""
+Tahap perencanaan untuk Tugas1.py: baca data_jabatan.xlsx satu kali, lalu
+normalisasi semua kolom sekaligus menjadi daftar rencana kerja per pegawai.
+
+Hasilnya berupa list `RencanaPegawai` yang siap dipakai loop browser tanpa
+perlu memanggil `pd.read_excel`, `pd.to_datetime`, atau fungsi normalisasi lagi.
+Rencana bisa disimpan ke JSON/Parquet supaya run berikutnya tidak perlu
+mem-parsing Excel ulang selama file Excel-nya tidak berubah.
+
+`alirkan_rencana` menyusun rencana per potongan baris (`baca_masukan`), sehingga
+pegawai pertama sudah bisa diproses sebelum sisa file selesai dibaca. Selain .xlsx,
+masukan boleh berupa .csv atau .parquet dengan nama kolom yang sama.
+"""
+
+import json
+from dataclasses import dataclass, asdict, fields
+from pathlib import Path
+
+import pandas as pd
+
+from baca_masukan import baca_potongan, teks, UKURAN_POTONGAN
+from normalisasi import normalisasi_jurusan, normalisasi_jabatan, ekstrak_sub_unit_unit_skpd
+
+# Kolom teks yang dipakai dari Excel, dibaca eksplisit sebagai string
+KOLOM_TEKS = [
+    "NIP Baru", "Tahun Lulus", "No. Ijazah", "Kepala Sekolah", "Jurusan", "Lembaga",
+    "No.SPMT", "JENIS JABATAN NAMA", "JABATAN NAMA", "Unor",
+]
+
+# Kolom tanggal; dibiarkan apa adanya saat dibaca (sel tanggal Excel tetap datetime)
+# lalu diparse sekaligus dengan dayfirst=True
+KOLOM_TANGGAL = ["Tanggal Ijazah", "Tanggal SPMT", "TMT SPMT"]
+
+FORMAT_TANGGAL = "%d-%m-%Y"
+
+
+@dataclass
+class RencanaPegawai:
+    """Satu baris data_jabatan.xlsx yang sudah dinormalisasi untuk diinput ke SIMPEG."""
+    baris: int
+    nip: str
+    tahun_lulus: str
+    no_ijazah: str
+    kepala: str
+    tanggal_ijazah: str
+    jurusan: str
+    lembaga: str
+    no_spmt: str
+    kode_spmt: str
+    tanggal_spmt: str
+    tanggal_tmt: str
+    jenis_jabatan: str
+    jabatan_nama: str
+    unor: str
+    sub_unit: str
+    unit_kerja: str
+    skpd: str
+
+
+def bersihkan_nip(kolom):
+    """
+    Ubah kolom NIP menjadi string angka tanpa akhiran ".0" dan tanpa spasi.
+
+    Args:
+        kolom (pd.Series): kolom "NIP Baru" yang dibaca sebagai string.
+
+    Returns:
+        pd.Series: NIP bersih.
+    """
+    return kolom.fillna("").astype(str).str.strip().str.replace(r"\.0$", "", regex=True)
+
+
+def parse_tanggal(kolom):
+    """
+    Parse satu kolom tanggal sekaligus (dayfirst) dan format ke "dd-mm-YYYY".
+
+    Nilai yang tidak bisa diparse menjadi string kosong, supaya bisa ditolak
+    di tahap validasi alih-alih membuat loop browser berhenti.
+    """
+    hasil = pd.to_datetime(kolom, dayfirst=True, errors="coerce", format="mixed")
+    # Teks berformat ISO (YYYY-MM-DD) jangan dibaca dayfirst, agar 2010-06-01 tidak jadi 6 Januari
+    iso = kolom.astype(str).str.match(r"^\d{4}-\d{2}-\d{2}")
+    if iso.any():
+        hasil[iso] = pd.to_datetime(kolom[iso].astype(str).str[:10], format="%Y-%m-%d", errors="coerce")
+    return hasil.dt.strftime(FORMAT_TANGGAL).fillna("")
+
+
+def _terapkan_unik(kolom, fungsi):
+    # Fungsi normalisasi hanya dipanggil sekali per nilai unik, lalu dipetakan ke seluruh kolom
+    peta = {nilai: fungsi(nilai) for nilai in kolom.unique()}
+    return kolom.map(peta)
+
+
+def _rapikan(df):
+    for kolom in KOLOM_TEKS:
+        if kolom in df.columns:
+            df[kolom] = df[kolom].map(teks).astype(str)
+    return df
+
+
+def baca_potongan_excel(path_excel, ukuran=UKURAN_POTONGAN):
+    """
+    Baca data jabatan (.xlsx/.csv/.parquet) per potongan dengan tipe kolom eksplisit.
+
+    Yields:
+        pd.DataFrame: kolom teks sebagai string (kosong → ""), kolom tanggal mentah.
+    """
+    for df in baca_potongan(path_excel, KOLOM_TEKS + KOLOM_TANGGAL, ukuran):
+        yield _rapikan(df)
+
+
+def baca_excel(path_excel):
+    """
+    Baca seluruh data jabatan sekaligus dengan tipe kolom eksplisit.
+
+    Returns:
+        pd.DataFrame: kolom teks sebagai string (kosong → ""), kolom tanggal mentah.
+    """
+    potongan = list(baca_potongan_excel(path_excel))
+    if not potongan:
+        return pd.DataFrame(columns=KOLOM_TEKS + KOLOM_TANGGAL)
+    return pd.concat(potongan, ignore_index=True)
+
+
+def susun_rencana(df, baris_awal=1):
+    """
+    Normalisasi DataFrame data jabatan per kolom dan susun daftar rencana per pegawai.
+
+    Args:
+        df (pd.DataFrame): hasil `baca_excel` atau satu potongan `baca_potongan_excel`.
+        baris_awal (int): nomor baris rencana untuk baris pertama `df`.
+
+    Returns:
+        list[RencanaPegawai]: satu rencana per baris, urutannya sama dengan Excel.
+    """
+    tanggal = {kolom: parse_tanggal(df[kolom]) for kolom in KOLOM_TANGGAL}
+    unor_terurai = _terapkan_unik(df["Unor"], ekstrak_sub_unit_unit_skpd)
+
+    kolom = pd.DataFrame({
+        "baris": range(baris_awal, baris_awal + len(df)),
+        "nip": bersihkan_nip(df["NIP Baru"]),
+        "tahun_lulus": df["Tahun Lulus"].str.replace(r"\.0$", "", regex=True),
+        "no_ijazah": df["No. Ijazah"],
+        "kepala": df["Kepala Sekolah"],
+        "tanggal_ijazah": tanggal["Tanggal Ijazah"],
+        "jurusan": _terapkan_unik(df["Jurusan"], normalisasi_jurusan),
+        "lembaga": df["Lembaga"],
+        "no_spmt": df["No.SPMT"],
+        "kode_spmt": df["No.SPMT"].str.split("/").str[1].fillna("").str.strip(),
+        "tanggal_spmt": tanggal["Tanggal SPMT"],
+        "tanggal_tmt": tanggal["TMT SPMT"],
+        "jenis_jabatan": _terapkan_unik(df["JENIS JABATAN NAMA"], normalisasi_jabatan),
+        "jabatan_nama": df["JABATAN NAMA"],
+        "unor": df["Unor"],
+        "sub_unit": unor_terurai.str[0],
+        "unit_kerja": unor_terurai.str[1],
+        "skpd": unor_terurai.str[2],
+    }, index=df.index)
+
+    return [RencanaPegawai(*nilai) for nilai in kolom.itertuples(index=False, name=None)]
+
+
+def simpan_rencana(rencana, path):
+    """
+    Simpan rencana kerja ke disk. Format ditentukan dari ekstensi: .parquet atau .json.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        pd.DataFrame([asdict(r) for r in rencana]).to_parquet(path, index=False)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([asdict(r) for r in rencana], f, ensure_ascii=False)
+
+
+def muat_rencana(path):
+    """Muat rencana kerja yang sebelumnya disimpan dengan `simpan_rencana`."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        records = pd.read_parquet(path).to_dict("records")
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+    nama_kolom = [f.name for f in fields(RencanaPegawai)]
+    return [RencanaPegawai(**{k: r[k] for k in nama_kolom}) for r in records]
+
+
+def siapkan_rencana(path_excel, path_rencana=None):
+    """
+    Ambil rencana kerja dari cache di disk bila masih valid, atau susun ulang dari Excel.
+
+    Cache dianggap valid bila file rencana lebih baru daripada file Excel.
+
+    Args:
+        path_excel: path ke data_jabatan.xlsx.
+        path_rencana: path cache rencana (.json/.parquet). None = tanpa cache.
+
+    Returns:
+        list[RencanaPegawai]
+    """
+    path_excel = Path(path_excel)
+    if path_rencana:
+        path_rencana = Path(path_rencana)
+        if path_rencana.exists() and path_rencana.stat().st_mtime >= path_excel.stat().st_mtime:
+            print(f"📦 Rencana kerja dimuat dari cache: {path_rencana}")
+            return muat_rencana(path_rencana)
+
+    rencana = susun_rencana(baca_excel(path_excel))
+    print(f"🗂️ Rencana kerja disusun dari {path_excel}: {len(rencana)} pegawai")
+    if path_rencana:
+        simpan_rencana(rencana, path_rencana)
+    return rencana
+
+
+def alirkan_rencana(path_excel, path_rencana=None, ukuran=UKURAN_POTONGAN):
+    """
+    Seperti `siapkan_rencana`, tetapi rencana dihasilkan satu per satu selagi file dibaca.
+
+    Setiap potongan `ukuran` baris dinormalisasi per kolom lalu langsung diteruskan.
+    Cache rencana hanya ditulis bila seluruh file selesai dibaca.
+
+    Yields:
+        RencanaPegawai, urut sesuai baris file.
+    """
+    path_excel = Path(path_excel)
+    if path_rencana:
+        path_rencana = Path(path_rencana)
+        if path_rencana.exists() and path_rencana.stat().st_mtime >= path_excel.stat().st_mtime:
+            print(f"📦 Rencana kerja dimuat dari cache: {path_rencana}")
+            yield from muat_rencana(path_rencana)
+            return
+
+    print(f"🗂️ Rencana kerja dibaca bertahap dari {path_excel}")
+    semua = []
+    for df in baca_potongan_excel(path_excel, ukuran):
+        potongan = susun_rencana(df, baris_awal=len(semua) + 1)
+        semua.extend(potongan)
+        yield from potongan
+    print(f"🗂️ Rencana kerja selesai dibaca: {len(semua)} pegawai")
+    if path_rencana:
+        simpan_rencana(semua, path_rencana)
@@ -0,0 +1,792 @@
+"""
+Server tiruan SIMPEG & SURADI untuk benchmark lokal (tanpa menyentuh situs produksi).
+
+Meniru halaman dan endpoint yang disentuh Tugas1.py dan Tugas2.py, dengan struktur
+DOM yang sama dengan yang dibaca skrip:
+- SIMPEG: `/login`, `daftar_pegawai` & `pencarian_pegawai` (hasil pencarian lewat AJAX
+  dengan link "Detil" / "Detil Data" di tab baru), `detail_pegawai/{id}`,
+  `add_pendidikan/{id}` & `tambah_jabatan/{id}` (Select2 statis dan AJAX berjenjang,
+  <select> biasa, token CSRF, konfirmasi submit, validasi `.error-block`),
+  `tab_disiplin` dengan `datatable_cuti` server-side berhalaman, dan `edit_cuti/{id}`.
+- SURADI: halaman awal & dashboard (butuh cookie), `table_server` server-side pada
+  halaman surat pengajuan, dan PDF "Surat TTD" (ETag / If-None-Match).
+
+Data dibuat deterministik dari NIP / nomor surat, sehingga NIP apa pun "ada".
+Latensi (dengan jitter) dan error acak bisa diatur; error muncul sebagai HTTP 500 pada
+endpoint AJAX/PDF dan sebagai `.error-block` pada submit form.
+
+jQuery, Select2, dan DataTables dimuat dari CDN, atau dari folder lokal lewat `--aset`
+(berisi file dengan nama seperti di `ASET`) bila mesin benchmark tidak punya internet.
+
+Pemakaian:
+    python server_tiruan.py --latensi 0.1 --galat 0.02
+lalu jalankan skrip dengan environment yang dicetak (SIMPEG_URL, SURADI_URL, ...).
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from email import policy
+from email.parser import BytesParser
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from normalisasi import normalisasi_jurusan
+
+HOST = "127.0.0.1"
+PORT_SIMPEG = 8701
+PORT_SURADI = 8702
+
+COOKIE_SIMPEG = "simpeg_sesi"
+COOKIE_CSRF = "csrf_simpeg"
+COOKIE_SURADI = "suradi_sesi"
+
+ASET = {
+    "jquery.min.js": "https://code.jquery.com/jquery-3.7.1.min.js",
+    "select2.min.js": "https://cdn.jsdelivr.net/npm/select2@4.1.0-rc.0/dist/js/select2.min.js",
+    "select2.min.css": "https://cdn.jsdelivr.net/npm/select2@4.1.0-rc.0/dist/css/select2.min.css",
+    "jquery.dataTables.min.js": "https://cdn.datatables.net/1.13.8/js/jquery.dataTables.min.js",
+    "jquery.dataTables.min.css": "https://cdn.datatables.net/1.13.8/css/jquery.dataTables.min.css",
+}
+
+# === Data referensi (dipakai juga benchmark.py untuk membuat Excel sintetis) ===
+JURUSAN_EXCEL = [
+    "S-1 TEKNIK INFORMATIKA", "D-3 AKUNTANSI", "SLTA SEDERAJAT",
+    "S-1 PENDIDIKAN GURU SEKOLAH DASAR", "S-1 KEPERAWATAN",
+]
+LEMBAGA = [
+    "UNIVERSITAS BRAWIJAYA", "UNIVERSITAS NEGERI MALANG", "POLITEKNIK NEGERI MALANG",
+    "SMA NEGERI 1 MALANG", "UNIVERSITAS MUHAMMADIYAH MALANG",
+]
+JENIS_JABATAN = ["PELAKSANA", "FUNGSIONAL", "STRUKTURAL"]
+JABATAN = {
+    "PELAKSANA": ["PENGADMINISTRASI UMUM", "PENGELOLA DATA", "PENGEMUDI"],
+    "FUNGSIONAL": ["GURU AHLI PERTAMA", "PERAWAT TERAMPIL", "PRANATA KOMPUTER AHLI PERTAMA"],
+    "STRUKTURAL": ["KEPALA SEKSI", "KEPALA SUB BAGIAN"],
+}
+# SKPD → unit kerja → sub unit; teks mengikuti hasil normalisasi.ekstrak_sub_unit_unit_skpd
+UNOR = {
+    "DINAS PENDIDIKAN DAN KEBUDAYAAN": {
+        "BIDANG PEMBINAAN SEKOLAH DASAR": ["SEKSI KURIKULUM", "SEKSI PESERTA DIDIK"],
+        "BIDANG KEBUDAYAAN": ["SEKSI CAGAR BUDAYA"],
+    },
+    "DINAS KESEHATAN": {
+        "PUSKESMAS ARJUNO": ["UNIT RAWAT INAP"],
+        "BIDANG PELAYANAN KESEHATAN": ["SEKSI RUJUKAN", "SEKSI MUTU"],
+    },
+    "KECAMATAN KLOJEN": {
+        "KELURAHAN KAUMAN": ["SEKSI PEMERINTAHAN", "SEKSI KESEJAHTERAAN SOSIAL"],
+    },
+}
+PEJABAT = ["Walikota Malang", "Sekretaris Daerah", "Kepala BKPSDM"]
+
+STATUS_SURADI = (("Sudah TTE", 80), ("Diproses", 10), ("Ditolak", 10))
+
+
+@dataclass
+class Konfigurasi:
+    """
+    Perilaku server: latensi (detik, ± jitter relatif), peluang error, jumlah cuti, dan
+    umur sesi login SIMPEG (detik; 0 = tidak pernah kedaluwarsa).
+    """
+    latensi: float = 0.0
+    jitter: float = 0.5
+    galat: float = 0.0
+    umur_sesi: float = 0.0
+    tahun: int = 2025
+    cuti_min: int = 1
+    cuti_maks: int = 4
+    persen_ada_file: int = 30
+    aset: str = None
+    benih: int = 1
+
+
+def _hash(teks, n=12):
+    return hashlib.sha1(str(teks).encode()).hexdigest()[:n]
+
+
+def _pdf(isi):
+    # PDF minimal yang valid, cukup untuk pemeriksaan tanda tangan %PDF
+    teks = isi.replace("(", "[").replace(")", "]")
+    stream = f"BT /F1 12 Tf 72 720 Td ({teks}) Tj ET".encode()
+    objek = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+    ]
+    keluar = b"%PDF-1.4\n"
+    posisi = []
+    for i, o in enumerate(objek, start=1):
+        posisi.append(len(keluar))
+        keluar += b"%d 0 obj\n" % i + o + b"\nendobj\n"
+    xref = len(keluar)
+    keluar += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objek) + 1)
+    keluar += b"".join(b"%010d 00000 n \n" % p for p in posisi)
+    keluar += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objek) + 1, xref)
+    return keluar
+
+
+class DataTiruan:
+    """Keadaan server (pegawai, cuti, upload, form tersimpan), aman untuk banyak thread."""
+
+    def __init__(self, konfigurasi):
+        self.k = konfigurasi
+        self._lock = threading.Lock()
+        self._acak = random.Random(konfigurasi.benih)
+        self.nip_pegawai = {}       # pegawai_id → nip
+        self.cuti = {}              # pegawai_id → list cuti
+        self.cuti_per_id = {}       # cuti_id → cuti
+        self.berkas = {}            # kode berkas SURADI → nomor surat
+        self.sesi = {}              # token sesi SIMPEG → waktu login (time.monotonic)
+        self.statistik = {"request": 0, "galat": 0, "login": 0, "pendidikan": 0, "jabatan": 0, "upload_cuti": 0, "pdf": 0}
+        self.jurusan = [normalisasi_jurusan(j).upper() for j in JURUSAN_EXCEL] + ["SARJANA-HUKUM"]
+
+    def tambah(self, nama, n=1):
+        with self._lock:
+            self.statistik[nama] += n
+
+    def gagal(self):
+        """True dengan peluang `galat` (error yang disuntikkan)."""
+        with self._lock:
+            kena = self._acak.random() < self.k.galat
+            if kena:
+                self.statistik["galat"] += 1
+        return kena
+
+    def tunda(self):
+        if self.k.latensi > 0:
+            with self._lock:
+                faktor = self._acak.uniform(1 - self.k.jitter, 1 + self.k.jitter)
+            time.sleep(max(0.0, self.k.latensi * faktor))
+
+    def buat_sesi(self):
+        token = _hash(time.time_ns())
+        with self._lock:
+            self.sesi[token] = time.monotonic()
+            self.statistik["login"] += 1
+        return token
+
+    def sesi_berlaku(self, token):
+        with self._lock:
+            awal = self.sesi.get(token)
+        if awal is None:
+            return False
+        return not self.k.umur_sesi or time.monotonic() - awal < self.k.umur_sesi
+
+    def id_pegawai(self, nip):
+        pegawai_id = str(100000 + int(_hash(nip, 8), 16) % 900000)
+        with self._lock:
+            self.nip_pegawai[pegawai_id] = nip
+        return pegawai_id
+
+    def daftar_cuti(self, pegawai_id):
+        with self._lock:
+            if pegawai_id not in self.cuti:
+                acak = random.Random(f"{self.k.benih}-{pegawai_id}")
+                daftar = []
+                jumlah = acak.randint(self.k.cuti_min, self.k.cuti_maks)
+                # Ditambah satu cuti tahun sebelumnya agar filter tahun ikut teruji
+                for i in range(jumlah + 1):
+                    tahun = self.k.tahun if i < jumlah else self.k.tahun - 1
+                    tanggal = date(tahun, 1, 1) + timedelta(days=acak.randint(0, 330))
+                    cuti_id = f"{pegawai_id}{i:02d}"
+                    c = {
+                        "id": cuti_id,
+                        "jenis": acak.choice(["Cuti Tahunan", "Cuti Sakit", "Cuti Alasan Penting"]),
+                        "tanggal": tanggal.strftime("%d-%m-%Y"),
+                        "tanggal_urut": tanggal,
+                        "nomor_surat": f"800.1.11.4/{cuti_id}/35.73.403/{tahun}",
+                        "lama": acak.randint(1, 6),
+                        "ada_file": acak.randint(1, 100) <= self.k.persen_ada_file,
+                    }
+                    daftar.append(c)
+                    self.cuti_per_id[cuti_id] = c
+                self.cuti[pegawai_id] = daftar
+            return self.cuti[pegawai_id]
+
+    def status_surat(self, nomor):
+        nilai = int(_hash(nomor, 6), 16) % 100
+        batas = 0
+        for status, persen in STATUS_SURADI:
+            batas += persen
+            if nilai < batas:
+                return status
+        return STATUS_SURADI[-1][0]
+
+    def kode_berkas(self, nomor):
+        kode = _hash(nomor)
+        with self._lock:
+            self.berkas[kode] = nomor
+        return kode
+
+
+# === Kerangka HTML ===
+
+def _url_aset(k, nama):
+    return f"/aset/{nama}" if k.aset else ASET[nama]
+
+
+def _halaman(k, judul, isi, skrip=""):
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(judul)}</title>
+<link rel="stylesheet" href="{_url_aset(k, 'select2.min.css')}">
+<link rel="stylesheet" href="{_url_aset(k, 'jquery.dataTables.min.css')}">
+<style>.error-block{{color:#b00}} .select2-container{{min-width:300px}}</style>
+</head><body>
+<h3>{html.escape(judul)}</h3>
+{isi}
+<script src="{_url_aset(k, 'jquery.min.js')}"></script>
+<script src="{_url_aset(k, 'select2.min.js')}"></script>
+<script src="{_url_aset(k, 'jquery.dataTables.min.js')}"></script>
+<script>{skrip}</script>
+</body></html>"""
+
+
+# Select2 statis (.s2) dan AJAX (.s2-ajax, data-url, data-induk = id field induk)
+_JS_SELECT2 = """
+$(function () {
+    $('select.s2').select2({width: '100%'});
+    $('select.s2-ajax').each(function () {
+        var $el = $(this), induk = $el.data('induk');
+        $el.select2({width: '100%', ajax: {
+            url: $el.data('url'), dataType: 'json', delay: 100,
+            data: function (p) {
+                var d = {term: p.term || ''};
+                if (induk) d.induk = $('#' + induk).val() || '';
+                return d;
+            },
+            processResults: function (r) { return r; }
+        }});
+        if (induk) $('#' + induk).on('change', function () { $el.val(null).trigger('change'); });
+    });
+});
+"""
+
+
+def _opsi(daftar, kosong=True):
+    awal = '<option value=""></option>' if kosong else ""
+    return awal + "".join(f'<option value="{html.escape(v)}">{html.escape(t)}</option>' for v, t in daftar)
+
+
+def _error_block(errors):
+    return "".join(f'<span class="error-block">{html.escape(e)}</span><br>' for e in errors)
+
+
+class _HandlerDasar(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "ServerTiruan/1.0"
+    data = None      # DataTiruan, diisi saat server dibuat
+    rute = ()        # (metode, regex path, nama method handler)
+
+    def log_message(self, format, *args):
+        pass
+
+    # --- utilitas respons ---
+    def kirim(self, status=200, isi=b"", tipe="text/html; charset=utf-8", header=None):
+        if isinstance(isi, str):
+            isi = isi.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", tipe)
+        self.send_header("Content-Length", str(len(isi)))
+        for k, v in (header or {}).items():
+            if isinstance(v, list):
+                for item in v:
+                    self.send_header(k, item)
+            else:
+                self.send_header(k, v)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(isi)
+
+    def kirim_json(self, obj, status=200):
+        self.kirim(status, json.dumps(obj), "application/json")
+
+    def alihkan(self, lokasi, cookie=None):
+        header = {"Location": lokasi}
+        if cookie:
+            header["Set-Cookie"] = cookie
+        self.kirim(302, b"", header=header)
+
+    def cookie(self):
+        c = SimpleCookie()
+        c.load(self.headers.get("Cookie", ""))
+        return {k: m.value for k, m in c.items()}
+
+    def query(self):
+        return {k: v[-1] for k, v in parse_qs(urlsplit(self.path).query, keep_blank_values=True).items()}
+
+    def baca_form(self):
+        """Isi POST (urlencoded atau multipart) sebagai (field: str, berkas: {nama: bytes})."""
+        panjang = int(self.headers.get("Content-Length") or 0)
+        tubuh = self.rfile.read(panjang)
+        tipe = self.headers.get("Content-Type", "")
+        if tipe.startswith("multipart/form-data"):
+            pesan = BytesParser(policy=policy.HTTP).parsebytes(
+                f"Content-Type: {tipe}\r\n\r\n".encode() + tubuh
+            )
+            field, berkas = {}, {}
+            for bagian in pesan.iter_parts():
+                nama = bagian.get_param("name", header="content-disposition")
+                if bagian.get_filename() is not None:
+                    berkas[nama] = bagian.get_payload(decode=True) or b""
+                else:
+                    field[nama] = (bagian.get_payload(decode=True) or b"").decode("utf-8", "replace")
+            return field, berkas
+        return {k: v[-1] for k, v in parse_qs(tubuh.decode("utf-8"), keep_blank_values=True).items()}, {}
+
+    # --- routing ---
+    def _rute(self, metode):
+        path = urlsplit(self.path).path
+        if path.startswith("/aset/"):
+            return self.aset(path[len("/aset/"):])
+        self.data.tambah("request")
+        self.data.tunda()
+        for m, pola, nama in self.rute:
+            cocok = re.fullmatch(pola, path)
+            if m == metode and cocok:
+                return getattr(self, nama)(*cocok.groups())
+        self.kirim(404, "Tidak ditemukan")
+
+    def do_GET(self):
+        self._rute("GET")
+
+    def do_HEAD(self):
+        self._rute("GET")
+
+    def do_POST(self):
+        self._rute("POST")
+
+    def aset(self, nama):
+        folder = self.data.k.aset
+        path = os.path.join(folder, os.path.basename(nama)) if folder else None
+        if not path or not os.path.exists(path):
+            return self.kirim(404, "Aset tidak ada")
+        tipe = "text/css" if nama.endswith(".css") else "application/javascript"
+        with open(path, "rb") as f:
+            self.kirim(200, f.read(), tipe, {"Cache-Control": "max-age=86400"})
+
+
+_P = "/kepegawaian/informasi"
+
+
+class HandlerSimpeg(_HandlerDasar):
+    rute = (
+        ("GET", r"/login", "login"),
+        ("POST", r"/login", "login_kirim"),
+        ("GET", r"/(?:dashboard)?", "dashboard"),
+        ("GET", _P + r"/daftar_pegawai", "daftar_pegawai"),
+        ("GET", _P + r"/pencarian_pegawai", "pencarian_pegawai"),
+        ("GET", _P + r"/cari_pegawai", "cari_pegawai"),
+        ("GET", _P + r"/daftar_pegawai/detail_pegawai/(\d+)", "detail_pegawai"),
+        ("GET", _P + r"/daftar_pegawai/detail_pegawai/(\d+)/tab_disiplin", "tab_disiplin"),
+        ("GET", _P + r"/daftar_pegawai/detail_pegawai/(\d+)/tab_disiplin/data", "data_cuti"),
+        ("GET", _P + r"/pegawai_cuti/edit_cuti/(\d+)", "edit_cuti"),
+        ("POST", _P + r"/pegawai_cuti/edit_cuti/(\d+)", "edit_cuti_kirim"),
+        ("GET", _P + r"/pegawai_pendidikan/add_pendidikan/(\d+)", "form_pendidikan"),
+        ("POST", _P + r"/pegawai_pendidikan/add_pendidikan/(\d+)", "pendidikan_kirim"),
+        ("GET", _P + r"/pegawai_jabatan/tambah_jabatan/(\d+)", "form_jabatan"),
+        ("POST", _P + r"/pegawai_jabatan/tambah_jabatan/(\d+)", "jabatan_kirim"),
+        ("GET", r"/referensi/(\w+)", "referensi"),
+    )
+
+    def _rute(self, metode):
+        path = urlsplit(self.path).path
+        if not path.startswith(("/login", "/aset/")) and not self.data.sesi_berlaku(self.cookie().get(COOKIE_SIMPEG)):
+            self.data.tambah("request")
+            return self.alihkan("/login")
+        return super()._rute(metode)
+
+    def halaman(self, judul, isi, skrip=""):
+        self.kirim(200, _halaman(self.data.k, judul, isi, skrip))
+
+    def login(self):
+        self.halaman("Login SIMPEG", """
+<form method="post" action="/login">
+  <input type="text" id="username" name="username">
+  <input type="password" id="password" name="password">
+  <button type="submit" class="btn btn-primary">Login</button>
+</form>""")
+
+    def login_kirim(self):
+        self.baca_form()
+        token = self.data.buat_sesi()
+        self.alihkan("/dashboard", [
+            f"{COOKIE_SIMPEG}={token}; Path=/; HttpOnly",
+            f"{COOKIE_CSRF}={_hash(token)}; Path=/",
+        ])
+
+    def dashboard(self):
+        self.halaman("Dashboard SIMPEG", "<p>Selamat datang.</p>")
+
+    def daftar_pegawai(self):
+        self.halaman("Daftar Pegawai", """
+<input type="text" id="nip_baru" name="nip_baru">
+<button type="button" class="btn btn-primary" id="cari">Cari Data</button>
+<table id="hasil"><tbody></tbody></table>""", """
+$('#cari').on('click', function () {
+    $.get('/kepegawaian/informasi/cari_pegawai', {nip_baru: $('#nip_baru').val(), judul: 'Detil'})
+        .done(function (h) { $('#hasil tbody').html(h); });
+});""")
+
+    def pencarian_pegawai(self):
+        self.halaman("Pencarian Pegawai", """
+<input type="text" name="nip_baru">
+<select name="status_aktif"><option value="1">Pegawai Aktif</option>
+<option value="2">Pegawai Aktif dan Non Aktif</option></select>
+<button type="button" id="search_button">Cari</button>
+<table id="hasil"><tbody></tbody></table>""", """
+$('#search_button').on('click', function () {
+    $.get('/kepegawaian/informasi/cari_pegawai', {nip_baru: $('[name=nip_baru]').val(), judul: 'Detil Data'})
+        .done(function (h) { $('#hasil tbody').html(h); });
+});""")
+
+    def cari_pegawai(self):
+        if self.data.gagal():
+            return self.kirim(500, "Kesalahan server (tiruan)")
+        q = self.query()
+        nip = q.get("nip_baru", "").strip()
+        if not nip.isdigit():
+            return self.kirim(200, '<tr><td colspan="4">Data tidak ditemukan</td></tr>')
+        pegawai_id = self.data.id_pegawai(nip)
+        judul = html.escape(q.get("judul", "Detil"))
+        self.kirim(200, (
+            f'<tr><td>1</td><td>{nip}</td><td>Pegawai {nip[-4:]}</td>'
+            f'<td><a class="btn" title="{judul}" target="_blank" '
+            f'href="{_P}/daftar_pegawai/detail_pegawai/{pegawai_id}">{judul}</a></td></tr>'
+        ))
+
+    def detail_pegawai(self, pegawai_id):
+        nip = self.data.nip_pegawai.get(pegawai_id, "-")
+        self.halaman(f"Detail Pegawai {pegawai_id}", f"<p>NIP {nip}</p>")
+
+    def tab_disiplin(self, pegawai_id):
+        self.halaman("Riwayat Cuti", """
+<table id="datatable_cuti" class="display"><thead><tr>
+<th>No</th><th>Jenis</th><th>Tanggal</th><th>Nomor Surat</th><th>Lama</th>
+<th>Keterangan</th><th>Status</th><th>File</th><th>Aksi</th>
+</tr></thead><tbody></tbody></table>""", f"""
+$(function () {{
+    $('#datatable_cuti').DataTable({{
+        serverSide: true, processing: true, pageLength: 10,
+        ajax: {{url: '{_P}/daftar_pegawai/detail_pegawai/{pegawai_id}/tab_disiplin/data'}}
+    }});
+}});""")
+
+    def data_cuti(self, pegawai_id):
+        if self.data.gagal():
+            return self.kirim(500, "Kesalahan server (tiruan)")
+        q = self.query()
+        daftar = list(self.data.daftar_cuti(pegawai_id))
+        total = len(daftar)
+        cari = q.get("search[value]", "").strip().lower()
+        if cari:
+            daftar = [c for c in daftar if cari in f"{c['jenis']} {c['tanggal']} {c['nomor_surat']}".lower()]
+        cari_tanggal = q.get("columns[2][search][value]", "").strip()
+        if cari_tanggal:
+            daftar = [c for c in daftar if cari_tanggal in c["tanggal"]]
+        if q.get("order[0][column]") == "2":
+            daftar.sort(key=lambda c: c["tanggal_urut"], reverse=q.get("order[0][dir]") == "desc")
+        mulai, panjang = int(q.get("start") or 0), int(q.get("length") or 10)
+        halaman = daftar[mulai:] if panjang < 0 else daftar[mulai:mulai + panjang]
+        baris = [[
+            str(mulai + i + 1), c["jenis"], c["tanggal"], c["nomor_surat"], f"{c['lama']} hari", "-",
+            "Disetujui",
+            f'<a href="/berkas_cuti/{c["id"]}.pdf" target="_blank">Lihat</a>' if c["ada_file"] else "-",
+            f'<a class="btn" href="{_P}/pegawai_cuti/edit_cuti/{c["id"]}">Edit</a>',
+        ] for i, c in enumerate(halaman)]
+        self.kirim_json({
+            "draw": int(q.get("draw") or 0), "recordsTotal": total,
+            "recordsFiltered": len(daftar), "data": baris,
+        })
+
+    def _form_cuti(self, cuti_id, errors=()):
+        self.halaman("Edit Cuti", f"""
+{_error_block(errors)}
+<form method="post" enctype="multipart/form-data" action="{_P}/pegawai_cuti/edit_cuti/{cuti_id}">
+  <input type="file" name="file_surat_cuti">
+  <input type="text" name="lampiran_kota" value="">
+  <button type="submit" id="submit_button" class="btn btn-success">Simpan</button>
+</form>""")
+
+    def edit_cuti(self, cuti_id):
+        if cuti_id not in self.data.cuti_per_id:
+            self.data.daftar_cuti(cuti_id[:-2])
+        if cuti_id not in self.data.cuti_per_id:
+            return self.kirim(404, "Cuti tidak ditemukan")
+        self._form_cuti(cuti_id)
+
+    def edit_cuti_kirim(self, cuti_id):
+        field, berkas = self.baca_form()
+        cuti = self.data.cuti_per_id.get(cuti_id)
+        if cuti is None:
+            return self.kirim(404, "Cuti tidak ditemukan")
+        errors = []
+        if not berkas.get("file_surat_cuti", b"").startswith(b"%PDF"):
+            errors.append("File surat cuti wajib berupa PDF")
+        if self.data.gagal():
+            errors.append("Terjadi kesalahan server (tiruan), silakan coba lagi")
+        if errors:
+            return self._form_cuti(cuti_id, errors)
+        cuti["ada_file"] = True
+        self.data.tambah("upload_cuti")
+        self.alihkan(f"{_P}/daftar_pegawai/detail_pegawai/{cuti_id[:-2]}/tab_disiplin")
+
+    def _csrf(self):
+        return self.cookie().get(COOKIE_CSRF, "")
+
+    def _form_pendidikan(self, pegawai_id, errors=()):
+        jurusan = _opsi((j, j) for j in self.data.jurusan)
+        self.halaman("Tambah Pendidikan", f"""
+{_error_block(errors)}
+<form method="post" action="{_P}/pegawai_pendidikan/add_pendidikan/{pegawai_id}">
+  <input type="hidden" name="_token" value="{self._csrf()}">
+  <input type="hidden" name="pegawai_id" value="{pegawai_id}">
+  <input type="text" id="tanggal_ijazah" name="tanggal_ijazah">
+  <input type="text" id="nama_kepala" name="nama_kepala">
+  <input type="text" id="tahun_lulus" name="tahun_lulus">
+  <input type="text" id="keterangan" name="keterangan">
+  <select id="jurusan" name="jurusan">{jurusan}</select>
+  <select id="categories" name="categories" class="s2-ajax" data-url="/referensi/lembaga"></select>
+  <select id="pendidikan_cpns" name="pendidikan_cpns" class="s2">{_opsi([("1", "Ya"), ("0", "Tidak")])}</select>
+  <button type="submit" id="submit_button" name="simpan" value="1">Simpan</button>
+</form>""", _JS_SELECT2)
+
+    def form_pendidikan(self, pegawai_id):
+        self._form_pendidikan(pegawai_id)
+
+    def _validasi(self, field, wajib):
+        errors = [f"Field {nama} wajib diisi" for nama in wajib if not field.get(nama, "").strip()]
+        if field.get("_token") != self._csrf():
+            errors.append("Token CSRF tidak valid")
+        if self.data.gagal():
+            errors.append("Terjadi kesalahan server (tiruan), silakan coba lagi")
+        return errors
+
+    def pendidikan_kirim(self, pegawai_id):
+        field, _ = self.baca_form()
+        errors = self._validasi(field, ["tanggal_ijazah", "nama_kepala", "tahun_lulus", "jurusan",
+                                        "categories", "pendidikan_cpns"])
+        if field.get("jurusan") and field["jurusan"] not in self.data.jurusan:
+            errors.append("Jurusan tidak dikenal")
+        if errors:
+            return self._form_pendidikan(pegawai_id, errors)
+        self.data.tambah("pendidikan")
+        self.alihkan(f"{_P}/daftar_pegawai/detail_pegawai/{pegawai_id}")
+
+    def _form_jabatan(self, pegawai_id, errors=()):
+        jab = "".join(
+            f'<select id="jab_{jenis.lower()}" name="jab_{jenis.lower()}" class="s2-ajax" '
+            f'data-url="/referensi/jabatan_{jenis.lower()}"></select>'
+            for jenis in JENIS_JABATAN
+        )
+        self.halaman("Tambah Jabatan", f"""
+{_error_block(errors)}
+<form method="post" enctype="multipart/form-data" action="{_P}/pegawai_jabatan/tambah_jabatan/{pegawai_id}"
+      onsubmit="return confirm('Simpan data jabatan?');">
+  <input type="hidden" name="_token" value="{self._csrf()}">
+  <select id="jenis_jabatan" name="jenis_jabatan" class="s2">{_opsi((j, j) for j in JENIS_JABATAN)}</select>
+  <select id="skpd" name="skpd" class="s2-ajax" data-url="/referensi/skpd"></select>
+  <select id="unit_kerja" name="unit_kerja" class="s2-ajax" data-url="/referensi/unit_kerja" data-induk="skpd"></select>
+  <select id="sub_unit_kerja" name="sub_unit_kerja" class="s2-ajax" data-url="/referensi/sub_unit_kerja" data-induk="unit_kerja"></select>
+  {jab}
+  <select id="pejabat" name="pejabat">{_opsi((p, p) for p in PEJABAT)}</select>
+  <input type="text" id="nomor_sk" name="nomor_sk">
+  <input type="text" id="inp_tanggal_sk" name="tanggal_sk">
+  <input type="text" id="inp_tmt_sk" name="tmt_sk">
+  <input type="text" id="inp_tmt_pelantikan" name="tmt_pelantikan">
+  <input type="text" id="inp_tmt_mutasi" name="tmt_mutasi">
+  <input type="text" id="ket_pejabat" name="ket_pejabat">
+  <input type="file" id="file_spmt" name="file_spmt">
+  <button type="submit" name="submit" value="1">Submit</button>
+</form>""", _JS_SELECT2)
+
+    def form_jabatan(self, pegawai_id):
+        self._form_jabatan(pegawai_id)
+
+    def jabatan_kirim(self, pegawai_id):
+        field, berkas = self.baca_form()
+        errors = self._validasi(field, ["jenis_jabatan", "skpd", "unit_kerja", "pejabat", "nomor_sk",
+                                        "tanggal_sk", "tmt_sk"])
+        jenis = field.get("jenis_jabatan", "")
+        if jenis in JABATAN and not field.get(f"jab_{jenis.lower()}"):
+            errors.append(f"Nama jabatan {jenis.lower()} wajib dipilih")
+        if not berkas.get("file_spmt", b"").startswith(b"%PDF"):
+            errors.append("File SPMT wajib berupa PDF")
+        if errors:
+            return self._form_jabatan(pegawai_id, errors)
+        self.data.tambah("jabatan")
+        self.alihkan(f"{_P}/daftar_pegawai/detail_pegawai/{pegawai_id}")
+
+    def referensi(self, jenis):
+        if self.data.gagal():
+            return self.kirim(500, "Kesalahan server (tiruan)")
+        q = self.query()
+        term, induk = q.get("term", "").strip().upper(), q.get("induk", "")
+        if jenis == "lembaga":
+            opsi = [(f"L{i}", t) for i, t in enumerate(LEMBAGA, start=1)]
+        elif jenis == "skpd":
+            opsi = [(f"S{i}", t) for i, t in enumerate(UNOR, start=1)]
+        elif jenis == "unit_kerja":
+            opsi = [
+                (f"S{i}-U{j}", u)
+                for i, units in enumerate(UNOR.values(), start=1)
+                for j, u in enumerate(units, start=1)
+                if f"S{i}" == induk
+            ]
+        elif jenis == "sub_unit_kerja":
+            opsi = [
+                (f"S{i}-U{j}-B{m}", s)
+                for i, units in enumerate(UNOR.values(), start=1)
+                for j, subs in enumerate(units.values(), start=1)
+                for m, s in enumerate(subs, start=1)
+                if f"S{i}-U{j}" == induk
+            ]
+        elif jenis.startswith("jabatan_") and jenis[len("jabatan_"):].upper() in JABATAN:
+            kategori = jenis[len("jabatan_"):].upper()
+            opsi = [(f"{kategori[:1]}{i}", t) for i, t in enumerate(JABATAN[kategori], start=1)]
+        else:
+            return self.kirim_json({"results": []}, 404)
+        self.kirim_json({"results": [{"id": v, "text": t} for v, t in opsi if term in t]})
+
+
+PATH_PENGAJUAN = "/surat_bkpsdm/surat_pengajuan/TJS202206060000083"
+
+
+class HandlerSuradi(_HandlerDasar):
+    rute = (
+        ("GET", r"/", "awal"),
+        ("GET", r"/admin/dashboard", "dashboard"),
+        ("GET", PATH_PENGAJUAN, "pengajuan"),
+        ("GET", r"/surat_bkpsdm/data_pengajuan", "data_pengajuan"),
+        ("GET", r"/berkas/(\w+)\.pdf", "berkas"),
+    )
+
+    def _rute(self, metode):
+        path = urlsplit(self.path).path
+        if path not in ("/",) and not path.startswith("/aset/") and COOKIE_SURADI not in self.cookie():
+            self.data.tambah("request")
+            return self.alihkan("/")
+        return super()._rute(metode)
+
+    def awal(self):
+        self.kirim(200, _halaman(self.data.k, "SURADI", "<p>Silakan masuk.</p>"))
+
+    def dashboard(self):
+        self.kirim(200, _halaman(self.data.k, "Dashboard SURADI", "<p>Dashboard</p>"))
+
+    def pengajuan(self):
+        self.kirim(200, _halaman(self.data.k, "Surat Pengajuan", """
+<table id="table_server" class="display"><thead><tr>
+<th>No</th><th>Nomor Surat</th><th>Perihal</th><th>Status</th><th>Aksi</th>
+</tr></thead><tbody></tbody></table>""", """
+$(function () {
+    $('#table_server').DataTable({
+        serverSide: true, processing: true, pageLength: 10,
+        ajax: {url: '/surat_bkpsdm/data_pengajuan'}
+    });
+});"""))
+
+    def data_pengajuan(self):
+        if self.data.gagal():
+            return self.kirim(500, "Kesalahan server (tiruan)")
+        q = self.query()
+        nomor = q.get("search[value]", "").strip()
+        baris = []
+        # Hanya nomor berformat surat cuti tiruan yang "ada" di SURADI
+        if re.fullmatch(r"800\.1\.11\.4/\d+/35\.73\.403/\d{4}", nomor):
+            status = self.data.status_surat(nomor)
+            aksi = "-"
+            if status == "Sudah TTE":
+                aksi = f'<a href="/berkas/{self.data.kode_berkas(nomor)}.pdf" target="_blank">Surat TTD</a>'
+            baris.append(["1", nomor, "Permohonan cuti", f'<span class="label">{status}</span>', aksi])
+        self.kirim_json({
+            "draw": int(q.get("draw") or 0), "recordsTotal": len(baris),
+            "recordsFiltered": len(baris), "data": baris,
+        })
+
+    def berkas(self, kode):
+        nomor = self.data.berkas.get(kode)
+        if nomor is None:
+            return self.kirim(404, "Berkas tidak ditemukan")
+        if self.data.gagal():
+            return self.kirim(500, "Kesalahan server (tiruan)")
+        etag = f'"{kode}"'
+        header = {"ETag": etag, "Last-Modified": "Mon, 06 Jan 2025 00:00:00 GMT"}
+        if self.headers.get("If-None-Match") == etag:
+            return self.kirim(304, b"", header=header)
+        self.data.tambah("pdf")
+        self.kirim(200, _pdf(f"Surat cuti {nomor}"), "application/pdf", header)
+
+
+def jalankan_server(konfigurasi, host=HOST, port_simpeg=PORT_SIMPEG, port_suradi=PORT_SURADI):
+    """
+    Jalankan server SIMPEG & SURADI tiruan di thread latar belakang.
+
+    Returns:
+        tuple: (DataTiruan, fungsi hentikan(), dict environment untuk skrip).
+    """
+    data = DataTiruan(konfigurasi)
+    server = []
+    for handler, port in ((HandlerSimpeg, port_simpeg), (HandlerSuradi, port_suradi)):
+        kelas = type(handler.__name__, (handler,), {"data": data})
+        srv = ThreadingHTTPServer((host, port), kelas)
+        srv.daemon_threads = True
+        threading.Thread(target=srv.serve_forever, name=f"tiruan-{port}", daemon=True).start()
+        server.append(srv)
+
+    def hentikan():
+        for srv in server:
+            srv.shutdown()
+            srv.server_close()
+
+    env = {
+        "SIMPEG_URL": f"http://{host}:{server[0].server_address[1]}",
+        "SURADI_URL": f"http://{host}:{server[1].server_address[1]}",
+    }
+    return data, hentikan, env
+
+
+def tulis_cookie_suradi(path):
+    """Tulis cookie.json SURADI tiruan (format ekspor ekstensi browser, tanpa domain)."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([{"name": COOKIE_SURADI, "value": "tiruan", "path": "/"}], f)
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server tiruan SIMPEG & SURADI untuk benchmark lokal")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port-simpeg", type=int, default=PORT_SIMPEG)
+    parser.add_argument("--port-suradi", type=int, default=PORT_SURADI)
+    parser.add_argument("--latensi", type=float, default=0.0, help="latensi per request (detik)")
+    parser.add_argument("--jitter", type=float, default=0.5, help="variasi latensi relatif (0.5 = ±50%%)")
+    parser.add_argument("--galat", type=float, default=0.0, help="peluang error per request AJAX/submit/PDF (0-1)")
+    parser.add_argument("--tahun", type=int, default=2025, help="tahun sebagian besar cuti tiruan")
+    parser.add_argument("--umur-sesi", type=float, default=0.0, help="umur sesi login SIMPEG (detik, 0 = tanpa batas)")
+    parser.add_argument("--aset", help="folder lokal berisi jQuery/Select2/DataTables (lihat ASET)")
+    parser.add_argument("--cookie", default="cookie_tiruan.json", help="path cookie.json SURADI yang ditulis")
+    args = parser.parse_args()
+
+    konfigurasi = Konfigurasi(latensi=args.latensi, jitter=args.jitter, galat=args.galat,
+                              tahun=args.tahun, umur_sesi=args.umur_sesi, aset=args.aset)
+    data, hentikan, env = jalankan_server(konfigurasi, args.host, args.port_simpeg, args.port_suradi)
+    env["SURADI_COOKIE"] = os.path.abspath(tulis_cookie_suradi(args.cookie))
+    print("🧪 Server tiruan berjalan. Environment untuk Tugas1.py / Tugas2.py:")
+    for k, v in env.items():
+        print(f"   {k}={v}")
+    try:
+        while True:
+            time.sleep(60)
+            print(f"📊 {json.dumps(data.statistik)}")
+    except KeyboardInterrupt:
+        hentikan()
@@ -0,0 +1,171 @@
+"""
+Pencarian status surat di SURADI secara massal lewat tabel `table_server` (DataTables).
+
+Cara lama: untuk setiap nomor surat halaman `surat_pengajuan/...` dimuat ulang, nomor
+diketik di kotak search, lalu hanya `rows[0]` yang dibaca. Di sini halaman dibuka
+sekali, lalu semua nomor surat dicari dalam satu `execute_async_script`:
+- tabel server-side: endpoint AJAX DataTables dipanggil langsung (parameter request
+  terakhir dipakai ulang, hanya nilai search yang diganti), beberapa request paralel;
+- selain itu: tabel difilter ulang lewat DataTables JS API (`search().draw()`)
+  satu per satu tanpa memuat ulang halaman.
+
+Hasil per nomor: status ("Sudah TTE", "Ditolak", "Diproses", ...) dan URL PDF "Surat TTD".
+"""
+
+import penjaga_sesi
+import tunggu
+from browser import URL_SURADI
+
+URL_PENGAJUAN = f"{URL_SURADI}/surat_bkpsdm/surat_pengajuan/TJS202206060000083"
+
+STATUS_DIKENAL = ("Sudah TTE", "Ditolak", "Diproses")
+STATUS_TIDAK_DITEMUKAN = "Nomor surat tidak ditemukan"
+STATUS_TIDAK_DIKENALI = "Status tidak dikenali"
+
+# Jumlah request AJAX bersamaan ke endpoint DataTables
+PARALEL = 6
+
+_JS_CEK_STATUS = """
+var daftar = arguments[0], paralel = arguments[1], selesai = arguments[arguments.length - 1];
+var STATUS = ['Sudah TTE', 'Ditolak', 'Diproses'];
+
+function bacaSel(nilai) {
+    var div = document.createElement('div');
+    div.innerHTML = nilai == null ? '' : String(nilai);
+    var url = null;
+    div.querySelectorAll('a').forEach(function (a) {
+        if (!url && a.textContent.indexOf('Surat TTD') !== -1) url = a.href;
+    });
+    return {teks: div.textContent, url: url};
+}
+
+function ringkas(nomor, baris) {
+    // baris: array sel (HTML/teks) tiap baris hasil pencarian
+    if (!baris.length) return {ditemukan: false, status: null, url: null};
+    var pilih = baris[0];
+    for (var i = 0; i < baris.length; i++) {
+        if (baris[i].map(function (s) { return s.teks; }).join(' ').indexOf(nomor) !== -1) {
+            pilih = baris[i];
+            break;
+        }
+    }
+    var status = null, url = null;
+    STATUS.forEach(function (st) {
+        if (!status && pilih.some(function (s) { return s.teks.indexOf(st) !== -1; })) status = st;
+    });
+    pilih.forEach(function (s) { if (!url && s.url) url = s.url; });
+    return {ditemukan: true, status: status, url: url};
+}
+
+try {
+    var dt = jQuery('#table_server').DataTable();
+    var s = dt.settings()[0];
+    var ajax = s.ajax;
+    var url = dt.ajax.url() || (typeof ajax === 'string' ? ajax : ajax && ajax.url) || s.sAjaxSource;
+    var dasar = dt.ajax.params();
+    var hasil = {};
+
+    if (s.oFeatures.bServerSide && url && dasar && typeof ajax !== 'function') {
+        // Panggil endpoint DataTables langsung, beberapa request sekaligus
+        var tipe = (ajax && ajax.type) || s.sServerMethod || 'GET';
+        var sumber = ajax && ajax.dataSrc;
+        var draw = 1000;
+        var antre = daftar.slice();
+        var cari = function (nomor) {
+            var p = jQuery.extend(true, {}, dasar);
+            if (p.search) { p.search.value = nomor; p.search.regex = false; }
+            if ('sSearch' in p) p.sSearch = nomor;
+            if ('start' in p) p.start = 0;
+            if ('iDisplayStart' in p) p.iDisplayStart = 0;
+            if ('draw' in p) p.draw = ++draw;
+            return jQuery.ajax({url: url, type: tipe, data: p, dataType: 'json'}).then(function (json) {
+                var data = typeof sumber === 'function' ? sumber(json)
+                    : typeof sumber === 'string' && sumber ? json[sumber]
+                    : (json.data || json.aaData || []);
+                var baris = data.map(function (r) {
+                    var sel = Array.isArray(r) ? r : Object.keys(r).map(function (k) { return r[k]; });
+                    return sel.map(bacaSel);
+                });
+                hasil[nomor] = ringkas(nomor, baris);
+            });
+        };
+        var pekerja = function () {
+            if (!antre.length) return jQuery.Deferred().resolve().promise();
+            return cari(antre.shift()).then(pekerja);
+        };
+        var jalur = [];
+        for (var i = 0; i < Math.min(paralel, daftar.length); i++) jalur.push(pekerja());
+        jQuery.when.apply(jQuery, jalur)
+            .done(function () { selesai({ok: true, mode: 'ajax', hasil: hasil}); })
+            .fail(function (xhr) { selesai({ok: false, error: 'HTTP ' + (xhr && xhr.status)}); });
+    } else {
+        // Filter ulang tabel yang sudah dimuat lewat DataTables API, satu nomor per draw
+        var antre2 = daftar.slice();
+        var lanjut = function () {
+            if (!antre2.length) { selesai({ok: true, mode: 'api', hasil: hasil}); return; }
+            var nomor = antre2.shift();
+            var baca = function () {
+                var baris = [];
+                dt.rows({search: 'applied'}).nodes().each(function (tr) {
+                    baris.push(Array.prototype.map.call(tr.cells, function (td) { return bacaSel(td.innerHTML); }));
+                });
+                hasil[nomor] = ringkas(nomor, baris);
+                lanjut();
+            };
+            if (s.oFeatures.bServerSide) { jQuery('#table_server').one('draw.dt', baca); dt.search(nomor).draw(); }
+            else { dt.search(nomor).draw(); baca(); }
+        };
+        lanjut();
+    }
+} catch (e) { selesai({ok: false, error: String(e)}); }
+"""
+
+
+def buka_tabel_pengajuan(driver):
+    """Buka halaman surat pengajuan SURADI (bila belum terbuka) dan tunggu `table_server` siap."""
+    if not driver.current_url.startswith(URL_PENGAJUAN):
+        driver.get(URL_PENGAJUAN)
+        tunggu.tunggu_halaman_siap(driver)
+        penjaga_sesi.periksa(driver)
+    tunggu.tunggu_tabel_selesai(driver, "table_server")
+
+
+def cek_status_massal(driver, daftar_nomor, paralel=PARALEL):
+    """
+    Cari status dan URL "Surat TTD" untuk banyak nomor surat sekaligus.
+
+    Args:
+        driver: WebDriver SURADI yang sudah masuk (cookie).
+        daftar_nomor (list[str]): nomor surat (duplikat diabaikan).
+        paralel (int): jumlah request AJAX bersamaan pada mode endpoint langsung.
+
+    Returns:
+        dict: nomor_surat → {"status": str, "url_pdf": str | None}. Status berisi salah
+        satu `STATUS_DIKENAL`, `STATUS_TIDAK_DITEMUKAN`, atau `STATUS_TIDAK_DIKENALI`.
+
+    Raises:
+        RuntimeError: bila pencarian di halaman gagal (tabel tidak ada, request error).
+    """
+    daftar_nomor = list(dict.fromkeys(daftar_nomor))
+    if not daftar_nomor:
+        return {}
+    buka_tabel_pengajuan(driver)
+    timeout_lama = driver.timeouts.script
+    driver.set_script_timeout(max(30, 5 * len(daftar_nomor)))
+    try:
+        respon = driver.execute_async_script(_JS_CEK_STATUS, daftar_nomor, paralel)
+    finally:
+        driver.set_script_timeout(timeout_lama)
+    if not respon or not respon.get("ok"):
+        raise RuntimeError(f"Pencarian massal SURADI gagal: {respon and respon.get('error')}")
+
+    hasil = {}
+    for nomor in daftar_nomor:
+        info = respon["hasil"].get(nomor) or {"ditemukan": False}
+        if not info["ditemukan"]:
+            status = STATUS_TIDAK_DITEMUKAN
+        else:
+            status = info["status"] or STATUS_TIDAK_DIKENALI
+        hasil[nomor] = {"status": status, "url_pdf": info.get("url")}
+    print(f"🔎 Status {len(hasil)} surat dicek sekaligus di SURADI (mode {respon['mode']})")
+    return hasil
@@ -0,0 +1,129 @@
+"""
+Pembacaan tabel `#datatable_cuti` (tab disiplin SIMPEG) lewat satu `execute_script`.
+
+Cara lama memanggil `find_elements("td")`, `.text`, `find_elements("a")`, dan
+`get_attribute("href")` untuk setiap baris: satu round trip WebDriver per panggilan,
+ratusan panggilan untuk satu halaman 50 baris. Di sini:
+- DataTable diubah ke "tampilkan semua" (`page.len(-1)`) alih-alih klik tombol next,
+- semua baris dibaca dalam satu skrip dan dikembalikan sebagai JSON,
+- bila server membatasi panjang halaman, halaman berikutnya dibuka lewat DataTables API
+  (`page('next').draw('page')`) dan dibaca dengan skrip yang sama.
+
+Rentang tanggal (`dari`/`sampai`) ikut dikirim ke request DataTables: bila rentangnya
+dalam satu tahun, tahun tersebut dipakai sebagai search kolom tanggal dan tabel diurutkan
+dari tanggal terbaru, sehingga server hanya mengirim baris yang relevan. Penyaringan
+tanggal yang pasti tetap dilakukan setelah baris dibaca (server bisa saja mengabaikan
+search kolom).
+"""
+
+from datetime import date, datetime
+
+import tunggu
+
+TABEL_CUTI = "datatable_cuti"
+KOLOM_TANGGAL = 2
+FORMAT_TANGGAL = "%d-%m-%Y"
+
+_JS_SIAPKAN_TABEL = """
+var id = arguments[0], kolom = arguments[1], cari = arguments[2];
+if (!window.jQuery || !jQuery.fn.dataTable || !jQuery.fn.dataTable.isDataTable('#' + id)) return false;
+var dt = jQuery('#' + id).DataTable();
+var berubah = false;
+if (dt.page.len() !== -1) { dt.page.len(-1); berubah = true; }
+if (cari !== null && dt.column(kolom).search() !== cari) {
+    dt.column(kolom).search(cari);
+    var urut = dt.order();
+    if (!(urut.length && urut[0][0] === kolom && urut[0][1] === 'desc')) dt.order([kolom, 'desc']);
+    berubah = true;
+}
+if (berubah) dt.draw();
+return berubah;
+"""
+
+_JS_BACA_CUTI = """
+var id = arguments[0];
+var tabel = document.getElementById(id);
+if (!tabel) return null;
+var baris = [];
+tabel.querySelectorAll('tbody > tr').forEach(function (tr) {
+    var td = tr.cells;
+    if (td.length < 8) return;
+    var edit = td[8] ? td[8].querySelector("a[href*='edit_cuti']") : null;
+    baris.push({
+        tanggal: td[2].innerText.trim(),
+        nomor_surat: td[3].innerText.trim(),
+        ada_file: !!td[7].querySelector('a'),
+        link_edit: edit ? edit.href : null
+    });
+});
+var berikut = false;
+if (window.jQuery && jQuery.fn.dataTable && jQuery.fn.dataTable.isDataTable(tabel)) {
+    var info = jQuery(tabel).DataTable().page.info();
+    berikut = info.length !== -1 && info.page < info.pages - 1;
+}
+return {baris: baris, berikut: berikut};
+"""
+
+_JS_HALAMAN_BERIKUT = "jQuery('#' + arguments[0]).DataTable().page('next').draw('page');"
+
+
+def rentang_tahun(tahun):
+    """(1 Januari, 31 Desember) untuk `tahun`."""
+    return date(tahun, 1, 1), date(tahun, 12, 31)
+
+
+def parse_tanggal_cuti(teks):
+    """Tanggal "dd-mm-YYYY" dari tabel cuti sebagai `date`, atau None bila formatnya lain."""
+    try:
+        return datetime.strptime(teks.strip(), FORMAT_TANGGAL).date()
+    except ValueError:
+        return None
+
+
+def dalam_rentang(teks, dari=None, sampai=None):
+    """
+    True bila tanggal `teks` berada di [dari, sampai]. Tanggal yang tidak bisa di-parse
+    dibandingkan berdasarkan tahunnya saja (segmen terakhir, seperti cara lama).
+    """
+    if dari is None and sampai is None:
+        return True
+    tgl = parse_tanggal_cuti(teks)
+    if tgl is None:
+        tahun = teks.split("-")[-1].strip()
+        if not tahun.isdigit():
+            return False
+        return (dari is None or int(tahun) >= dari.year) and (sampai is None or int(tahun) <= sampai.year)
+    return (dari is None or tgl >= dari) and (sampai is None or tgl <= sampai)
+
+
+def baca_cuti(driver, table_id=TABEL_CUTI, dari=None, sampai=None, batas_halaman=100):
+    """
+    Baca baris tabel cuti yang sudah terbuka di `driver`, disaring rentang tanggal.
+
+    Args:
+        driver: WebDriver yang sedang membuka tab disiplin pegawai.
+        table_id (str): id tabel DataTables.
+        dari, sampai (datetime.date, optional): batas rentang tanggal (inklusif).
+        batas_halaman (int): pengaman jumlah halaman bila "tampilkan semua" tidak didukung.
+
+    Returns:
+        list[dict]: {"tanggal", "nomor_surat", "ada_file", "link_edit"} untuk setiap baris
+        dalam rentang (baris dengan kurang dari 8 kolom, misalnya "No data available",
+        dilewati).
+    """
+    # Search kolom tanggal hanya bisa mewakili satu tahun; rentang lintas tahun disaring lokal
+    cari = str(dari.year) if dari and sampai and dari.year == sampai.year else None
+    if driver.execute_script(_JS_SIAPKAN_TABEL, table_id, KOLOM_TANGGAL, cari):
+        tunggu.tunggu_tabel_selesai(driver, table_id)
+
+    semua = []
+    for _ in range(batas_halaman):
+        hasil = driver.execute_script(_JS_BACA_CUTI, table_id)
+        if not hasil:
+            break
+        semua.extend(b for b in hasil["baris"] if dalam_rentang(b["tanggal"], dari, sampai))
+        if not hasil["berikut"]:
+            break
+        driver.execute_script(_JS_HALAMAN_BERIKUT, table_id)
+        tunggu.tunggu_tabel_selesai(driver, table_id)
+    return semua
@@ -0,0 +1,77 @@
+"""
+Pembacaan masukan bertahap: normalisasi nilai sel (`teks`) dan pembacaan .xlsx/.csv per potongan.
+"""
+
+import math
+import os
+import sys
+from datetime import date, datetime
+
+import pytest
+from openpyxl import Workbook
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from baca_masukan import baca_baris, baca_nip, baca_potongan, teks  # noqa: E402
+
+
+@pytest.mark.parametrize("nilai, hasil", [
+    (None, ""),
+    (math.nan, ""),
+    (12345.0, "12345"),
+    (12345, "12345"),
+    (1.5, "1.5"),
+    (True, "True"),
+    (datetime(2024, 1, 2, 13, 45), "2024-01-02"),
+    (date(2024, 1, 2), "2024-01-02"),
+    ("  199001012020121001 ", "199001012020121001"),
+    ("199001012020121001.0", "199001012020121001"),
+    ("ABC.0", "ABC.0"),
+])
+def test_teks(nilai, hasil):
+    assert teks(nilai) == hasil
+
+
+def _xlsx(path, baris):
+    buku = Workbook()
+    sheet = buku.active
+    for b in baris:
+        sheet.append(b)
+    buku.save(path)
+    return path
+
+
+def test_xlsx_per_potongan_kolom_terpilih_dan_baris_kosong(tmp_path):
+    path = _xlsx(tmp_path / "data.xlsx", [
+        ["NIP Baru", " Nama ", "Tanggal"],
+        [123456789, "A", datetime(2024, 1, 2)],
+        [None, None, None],  # baris kosong berformat dilewati
+        ["199001012020121002", "B", None],
+        [987654321.0, "C", None],
+    ])
+    potongan = list(baca_potongan(path, ["NIP Baru", "Nama", "Tidak Ada"], ukuran=2))
+    assert [len(df) for df in potongan] == [2, 1]
+    assert list(potongan[0].columns) == ["NIP Baru", "Nama"]  # header di-strip, kolom hilang diabaikan
+
+    baris = list(baca_baris(path, ["Nama", "Tanggal", "Tidak Ada"], ukuran=2))
+    assert [b[0] for b in baris] == ["A", "B", "C"]
+    assert baris[0][1] == datetime(2024, 1, 2)
+    assert all(b[2] is None for b in baris)
+
+
+def test_baca_nip_xlsx_dan_csv(tmp_path):
+    xlsx = _xlsx(tmp_path / "nip.xlsx", [
+        ["NIP Baru"], [123456789], [987654321.0], ["199001012020121002.0"], [None], [" 012345 "],
+    ])
+    assert list(baca_nip(xlsx)) == ["123456789", "987654321", "199001012020121002", "012345"]
+
+    csv = tmp_path / "nip.csv"
+    csv.write_text("NIP Baru,Nama\n012345,A\n,B\n199001012020121002,C\n", encoding="utf-8")
+    # CSV dibaca sebagai teks: nol di depan tetap ada
+    assert list(baca_nip(csv, ukuran=1)) == ["012345", "199001012020121002"]
+
+
+def test_baca_nip_kolom_tidak_ada(tmp_path):
+    xlsx = _xlsx(tmp_path / "nip.xlsx", [["NIP"], ["1"]])
+    with pytest.raises(KeyError):
+        list(baca_nip(xlsx))
@@ -0,0 +1,79 @@
+"""
+`CacheUnduhan.bersihkan`: buang entri kedaluwarsa (`MAKS_UMUR`) lalu entri yang paling
+lama tidak diakses sampai total ukuran objek ≤ `MAKS_TOTAL_BYTE`.
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache_unduhan import MAKS_UMUR, CacheUnduhan  # noqa: E402
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = CacheUnduhan(str(tmp_path / "cache.sqlite"), str(tmp_path / ".objek"))
+    yield c
+    c.tutup()
+
+
+def _simpan(cache, tmp_path, kunci, isi, diakses):
+    sementara = tmp_path / f"{kunci}.pdf.part"
+    sementara.write_bytes(isi)
+    sha = hashlib.sha256(isi).hexdigest()
+    path = str(tmp_path / f"{kunci}.pdf")
+    cache.simpan(kunci, f"http://suradi/{kunci}", str(sementara), sha, path)
+    # Waktu akses diatur langsung agar urutan LRU pasti
+    cache._conn.execute("UPDATE unduhan SET diakses = ? WHERE kunci = ?", (diakses, kunci))
+    cache._conn.commit()
+    return sha, path
+
+
+def _kunci_tersisa(cache):
+    return sorted(r[0] for r in cache._conn.execute("SELECT kunci FROM unduhan"))
+
+
+def test_entri_melewati_maks_umur_dibuang(cache, tmp_path):
+    sekarang = time.time()
+    sha_lama, path_lama = _simpan(cache, tmp_path, "lama", b"%PDF lama", sekarang - MAKS_UMUR - 60)
+    _, path_baru = _simpan(cache, tmp_path, "baru", b"%PDF baru", sekarang)
+
+    assert cache.bersihkan() == 1
+    assert _kunci_tersisa(cache) == ["baru"]
+    assert not os.path.exists(path_lama)
+    assert not os.path.exists(cache.path_objek(sha_lama))
+    assert os.path.exists(path_baru)
+
+
+def test_lru_sampai_di_bawah_maks_total(cache, tmp_path):
+    sekarang = time.time()
+    sha1, _ = _simpan(cache, tmp_path, "s1", b"%PDF-1 aaaa", sekarang - 30)
+    _simpan(cache, tmp_path, "s2", b"%PDF-2 bbbb", sekarang - 20)
+    _simpan(cache, tmp_path, "s3", b"%PDF-3 cccc", sekarang - 10)
+
+    # Tiga objek @ 11 byte; batas 22 byte → hanya yang paling lama diakses dibuang
+    assert cache.bersihkan(maks_total=22) == 1
+    assert _kunci_tersisa(cache) == ["s2", "s3"]
+    assert not os.path.exists(cache.path_objek(sha1))
+
+
+def test_objek_bersama_tidak_dihapus_selama_masih_dipakai(cache, tmp_path):
+    sekarang = time.time()
+    sha, _ = _simpan(cache, tmp_path, "a", b"%PDF sama", sekarang - MAKS_UMUR - 60)
+    _simpan(cache, tmp_path, "b", b"%PDF sama", sekarang)
+
+    assert cache.bersihkan() == 1
+    assert _kunci_tersisa(cache) == ["b"]
+    assert os.path.exists(cache.path_objek(sha))
+    assert cache.ambil("b", "http://suradi/b") is not None
+
+
+def test_tidak_ada_yang_dibuang_bila_segar_dan_di_bawah_batas(cache, tmp_path):
+    _simpan(cache, tmp_path, "a", b"%PDF a", time.time())
+    assert cache.bersihkan() == 0
+    assert _kunci_tersisa(cache) == ["a"]
@@ -0,0 +1,73 @@
+"""
+Indeks file SPMT: pola nama `SPMT_PPPK_T1_<nomor>_<kode>_...` sama dengan pencarian per
+baris lama, termasuk kode yang cocok dengan beberapa file dan kode yang tidak punya file.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indeks_spmt import (  # noqa: E402
+    POLA_FILE_SPMT,
+    bangun_indeks_spmt,
+    cari_file_spmt,
+    periksa_kode_spmt,
+)
+
+NAMA_FILE = [
+    "SPMT_PPPK_T1_2_ABC_budi.pdf",
+    "SPMT_PPPK_T1_1_ABC_ani.pdf",   # kode ABC ganda
+    "SPMT_PPPK_T1_3_ABCD_citra.pdf",  # bukan kode ABC maupun AB
+    "SPMT_PPPK_T1_x_DEF_dodi.pdf",  # nomor bukan angka
+    "SPMT_PPPK_T2_4_GHI_eka.pdf",   # bukan T1
+    "catatan.txt",
+]
+
+
+def _folder(tmp_path):
+    folder = tmp_path / "spmt"
+    folder.mkdir()
+    for nama in NAMA_FILE:
+        (folder / nama).write_bytes(b"%PDF")
+    return folder
+
+
+def test_pola_nama_file():
+    assert POLA_FILE_SPMT.match("SPMT_PPPK_T1_12_K01_nama.pdf").group("kode") == "K01"
+    assert POLA_FILE_SPMT.match("SPMT_PPPK_T1_x_K01_nama.pdf") is None
+    assert POLA_FILE_SPMT.match("SPMT_PPPK_T1_12_K01.pdf") is None  # tanpa "_" setelah kode
+    assert POLA_FILE_SPMT.match("xSPMT_PPPK_T1_12_K01_nama.pdf") is None
+
+
+def test_indeks_kode_ganda_dan_hilang(tmp_path):
+    folder = _folder(tmp_path)
+    indeks = bangun_indeks_spmt(folder)
+
+    assert sorted(indeks) == ["ABC", "ABCD"]
+    assert [os.path.basename(p) for p in indeks["ABC"]] == [
+        "SPMT_PPPK_T1_1_ABC_ani.pdf", "SPMT_PPPK_T1_2_ABC_budi.pdf",
+    ]
+    # File pertama (urut nama) dipakai untuk kode ganda; kode awalan tidak ikut cocok
+    assert os.path.basename(cari_file_spmt(indeks, "ABC")) == "SPMT_PPPK_T1_1_ABC_ani.pdf"
+    assert cari_file_spmt(indeks, "AB") is None
+    assert cari_file_spmt(indeks, "DEF") is None
+
+    hilang, ganda = periksa_kode_spmt(indeks, [("1", "ABC"), ("2", "ABCD"), ("3", "XYZ"), ("4", "")])
+    assert hilang == [("3", "XYZ")]
+    assert [(nip, kode, len(files)) for nip, kode, files in ganda] == [("1", "ABC", 2)]
+
+
+def test_cache_dipakai_dan_file_baru_terindeks(tmp_path):
+    folder = _folder(tmp_path)
+    path_cache = str(tmp_path / "indeks.json")
+    pertama = bangun_indeks_spmt(folder, path_cache)
+    assert bangun_indeks_spmt(folder, path_cache) == pertama
+
+    (folder / "SPMT_PPPK_T1_5_JKL_fajar.pdf").write_bytes(b"%PDF")
+    # mtime folder dipaksa berubah agar tidak bergantung pada resolusi jam filesystem
+    st = os.stat(folder)
+    os.utime(folder, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    indeks = bangun_indeks_spmt(folder, path_cache)
+    assert os.path.basename(cari_file_spmt(indeks, "JKL")) == "SPMT_PPPK_T1_5_JKL_fajar.pdf"
+    assert indeks["ABC"] == pertama["ABC"]
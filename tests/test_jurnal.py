@@ -0,0 +1,82 @@
+"""
+`Jurnal`: langkah "ok" dilewati hanya saat --resume, dan laporan urut sesuai sheet.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jurnal import Jurnal  # noqa: E402
+
+
+def test_resume_melewati_langkah_ok_saja(tmp_path):
+    path = str(tmp_path / "jurnal.jsonl")
+    j = Jurnal(path)
+    j.catat("1", "pendidikan", "ok", kunci="2")
+    j.catat("1", "jabatan", "gagal", kunci="2")
+    j.catat("2", "upload", "ok", kunci="S/1")
+    j.catat("2", "upload", "gagal", kunci="S/1")  # catatan terakhir yang berlaku
+    j.tutup()
+
+    j = Jurnal(path, lanjut=True)
+    assert j.sudah_selesai("1", "pendidikan", "2")
+    assert not j.sudah_selesai("1", "jabatan", "2")
+    assert not j.sudah_selesai("1", "pendidikan", "3")  # baris lain dengan NIP sama
+    assert not j.sudah_selesai("2", "upload", "S/1")
+    j.tutup()
+
+
+def test_tanpa_resume_jurnal_lama_diarsipkan(tmp_path):
+    path = str(tmp_path / "jurnal.jsonl")
+    j = Jurnal(path)
+    j.catat("1", "nip", "ok")
+    j.tutup()
+
+    j = Jurnal(path)
+    assert not j.sudah_selesai("1", "nip")
+    j.tutup()
+    arsip = [n for n in os.listdir(tmp_path) if n != "jurnal.jsonl"]
+    assert len(arsip) == 1 and arsip[0].startswith("jurnal.")
+
+
+def test_baris_terpotong_saat_crash_diabaikan(tmp_path):
+    path = tmp_path / "jurnal.jsonl"
+    j = Jurnal(str(path))
+    j.catat("1", "nip", "ok")
+    j.tutup()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"nip": "2", "langkah": "ni')
+
+    j = Jurnal(str(path), lanjut=True)
+    assert j.sudah_selesai("1", "nip")
+    j.catat("3", "nip", "ok")
+    j.tutup()
+
+    j = Jurnal(str(path), lanjut=True)
+    assert j.sudah_selesai("3", "nip")
+    j.tutup()
+
+
+def test_laporan_urut_sheet_dan_catatan_terakhir(tmp_path):
+    j = Jurnal(str(tmp_path / "jurnal.jsonl"))
+    # Worker paralel menulis berselang-seling
+    j.catat("B", "upload", "gagal", kunci="b1", log=[{"NIP": "B", "Status": "b1 gagal"}])
+    j.catat("A", "upload", "ok", kunci="a1", log=[{"NIP": "A", "Status": "a1"}])
+    j.catat("X", "upload", "ok", kunci="x1", log=[{"NIP": "X", "Status": "x1"}])
+    j.catat("A", "upload", "ok", kunci="a2", log=[{"NIP": "A", "Status": "a2"}])
+    j.catat("B", "upload", "ok", kunci="b1", log=[{"NIP": "B", "Status": "b1 ulang"}])
+
+    status = [e["Status"] for e in j.laporan(urutan_nip=["A", "B"])]
+    # Urut sheet, lalu urutan langkah pertama dicatat; NIP di luar sheet di akhir
+    assert status == ["a1", "a2", "b1 ulang", "x1"]
+    j.tutup()
+
+
+def test_pendengar_dipanggil_setiap_catat(tmp_path):
+    j = Jurnal(str(tmp_path / "jurnal.jsonl"))
+    diterima = []
+    j.dengarkan(diterima.append)
+    j.catat("1", "nip", "ok", log=[{"NIP": "1"}])
+    assert [c["nip"] for c in diterima] == ["1"]
+    j.tutup()
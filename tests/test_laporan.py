@@ -0,0 +1,75 @@
+"""
+Penomoran laporan per NIP harus sama dengan loop `iterrows` lama di Tugas2.py.
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from laporan import nomori_per_nip, susun_laporan, tulis_excel  # noqa: E402
+
+
+def _nomori_lama(df, kolom_total):
+    # Salinan loop lama: nomor & total di baris pertama tiap NIP, NIP berulang dikosongkan
+    # (kolom baru dibuat object agar `.at` bisa menulis angka di pandas ≥ 3)
+    hasil = df.copy()
+    hasil["No"] = pd.Series("", index=hasil.index, dtype=object)
+    hasil[kolom_total] = pd.Series("", index=hasil.index, dtype=object)
+    no = 1
+    last_nip = None
+    jumlah_per_nip = hasil.groupby("NIP").size().to_dict()
+    for i, row in hasil.iterrows():
+        nip = row["NIP"]
+        if nip and nip != last_nip:
+            hasil.at[i, "No"] = no
+            hasil.at[i, kolom_total] = jumlah_per_nip[nip]
+            last_nip = nip
+            no += 1
+        else:
+            hasil.at[i, "NIP"] = ""
+    return hasil
+
+
+def test_sama_dengan_loop_lama():
+    # NIP kosong di tengah kelompok, dan NIP yang muncul lagi setelah NIP lain
+    df = pd.DataFrame({
+        "NIP": ["A", "A", "", "B", "A", "B", "B", "C"],
+        "Status": ["s1", "s2", "s3", "s4", "s5", "s6", "s7", "s8"],
+    }, dtype=object)
+    lama = _nomori_lama(df, "Total")
+    baru = nomori_per_nip(df, "Total")
+    for kolom in ["No", "NIP", "Total", "Status"]:
+        assert list(baru[kolom]) == list(lama[kolom]), kolom
+
+
+def test_susun_laporan_urutan_kolom_dan_kolom_hilang():
+    entri = [
+        {"NIP": "1", "Nomor Surat": "a", "Status": "ok"},
+        {"NIP": "1", "Nomor Surat": "b"},
+        {"NIP": "2", "Nomor Surat": "c", "Status": "gagal"},
+    ]
+    df = susun_laporan(entri, ["Nomor Surat", "Status"], "Jumlah")
+    assert list(df.columns) == ["No", "NIP", "Jumlah", "Nomor Surat", "Status"]
+    assert list(df["No"]) == [1, "", 2]
+    assert list(df["NIP"]) == ["1", "", "2"]
+    assert list(df["Jumlah"]) == [2, "", 1]
+    assert list(df["Status"]) == ["ok", "", "gagal"]
+
+
+def test_susun_laporan_kosong():
+    df = susun_laporan([], ["Keterangan"], "Jumlah")
+    assert df.empty
+    assert list(df.columns) == ["No", "NIP", "Jumlah", "Keterangan"]
+
+
+def test_tulis_excel_tanpa_file_part(tmp_path):
+    path = tmp_path / "log" / "laporan.xlsx"
+    df = susun_laporan([{"NIP": "1", "Keterangan": "x"}], ["Keterangan"], "Jumlah")
+    tulis_excel(df, str(path))
+    assert path.exists()
+    assert not (tmp_path / "log" / "laporan.xlsx.part").exists()
+    dibaca = pd.read_excel(path, dtype=str)
+    assert list(dibaca.columns) == ["No", "NIP", "Jumlah", "Keterangan"]
@@ -0,0 +1,44 @@
+"""
+Pipeline dengan tahap yang berbagi satu pengendali host tidak boleh macet.
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pengendali_host import PengendaliHost  # noqa: E402
+from pipeline import Tahap, jalankan_pipeline  # noqa: E402
+
+
+def test_batas_satu_dan_tahap_tengah_lambat_tidak_macet():
+    # pindai → suradi (lambat, tanpa izin) → unggah, pindai & unggah berbagi batas 1
+    simpeg = PengendaliHost("SIMPEG-uji", batas_awal=1, batas_min=1, batas_maks=1)
+    selesai = []
+    kunci = threading.Lock()
+
+    def pindai(konteks, item, kirim):
+        kirim(item)
+
+    def suradi(konteks, item, kirim):
+        time.sleep(0.01)
+        kirim(item)
+
+    def unggah(konteks, item, kirim):
+        with kunci:
+            selesai.append(item)
+
+    hasil = []
+    thread = threading.Thread(target=lambda: hasil.append(jalankan_pipeline(range(40), [
+        Tahap("pindai", pindai, 2, pengendali=simpeg),
+        Tahap("suradi", suradi, 1),
+        Tahap("unggah", unggah, 2, pengendali=simpeg),
+    ], ukuran_antrean=1, interval_laporan=0)), daemon=True)
+    thread.start()
+    thread.join(timeout=30)
+
+    assert not thread.is_alive(), "pipeline macet"
+    assert sorted(selesai) == list(range(40))
+    assert [r["gagal"] for r in hasil[0]] == [0, 0, 0]
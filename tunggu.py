@@ -0,0 +1,282 @@
+"""
+Lapisan penantian berbasis kondisi untuk Tugas1.py dan Tugas2.py.
+
+Menggantikan jeda tetap `time.sleep(...)` dengan penantian terhadap kondisi nyata
+di DOM atau jaringan, misalnya:
+- halaman selesai dimuat dan tidak ada request AJAX (jQuery) yang berjalan,
+- daftar hasil Select2 sudah terisi,
+- `.error-block`, alert, atau perpindahan halaman muncul setelah submit,
+- DataTables selesai memproses pencarian/paginasi.
+
+Setiap jenis kondisi punya batas waktu sendiri di `TIMEOUT`. Jika kondisi tidak
+terpenuhi sampai batas waktu habis, fungsi mengembalikan False (atau None) dan
+hanya tidur sesuai `JEDA_CADANGAN` bila `PAKAI_JEDA_CADANGAN` diaktifkan.
+"""
+
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoAlertPresentException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+
+# Batas waktu (detik) per jenis kondisi
+TIMEOUT = {
+    "login": 15,
+    "halaman": 15,
+    "ajax": 10,
+    "select2": 8,
+    "submit": 10,
+    "alert": 3,
+    "jendela": 10,
+    "tabel": 10,
+}
+
+# Jeda tetap lama (detik) yang dipakai sebagai cadangan bila kondisi gagal terdeteksi
+JEDA_CADANGAN = {
+    "login": 2,
+    "halaman": 3,
+    "ajax": 1,
+    "select2": 2.5,
+    "submit": 3,
+    "alert": 2,
+    "jendela": 2,
+    "tabel": 2,
+}
+
+# Bila True, kondisi yang tidak terpenuhi ditutup dengan time.sleep(JEDA_CADANGAN[jenis])
+PAKAI_JEDA_CADANGAN = False
+
+# Interval polling WebDriverWait (detik)
+INTERVAL_POLLING = 0.1
+
+_JS_AJAX_SELESAI = "return !window.jQuery || window.jQuery.active === 0;"
+
+_JS_HALAMAN_SIAP = """
+var siap = document.readyState === 'complete'
+    || (document.readyState === 'interactive' && window.jQuery && window.jQuery.isReady);
+return siap && (!window.jQuery || window.jQuery.active === 0);
+"""
+
+_JS_HASIL_SELECT2 = """
+var opsi = document.querySelectorAll('.select2-container--open .select2-results__option');
+if (!opsi.length) return false;
+if (document.querySelector('.select2-container--open .select2-results__option.loading-results')) return false;
+return !window.jQuery || window.jQuery.active === 0;
+"""
+
+_JS_SELECT2_TERTUTUP = "return !document.querySelector('.select2-container--open');"
+
+_JS_TABEL_SELESAI = """
+var id = arguments[0];
+var proses = document.getElementById(id + '_processing');
+if (proses && window.getComputedStyle(proses).display !== 'none') return false;
+return !window.jQuery || window.jQuery.active === 0;
+"""
+
+
+def tunggu_kondisi(driver, kondisi, jenis, timeout=None):
+    """
+    Tunggu sampai `kondisi(driver)` bernilai truthy, dengan batas waktu per jenis.
+
+    Args:
+        driver: Selenium WebDriver.
+        kondisi: callable yang menerima driver dan mengembalikan nilai truthy bila terpenuhi.
+        jenis (str): kunci di `TIMEOUT`/`JEDA_CADANGAN`, misalnya "select2" atau "submit".
+        timeout (float, optional): override batas waktu untuk pemanggilan ini.
+
+    Returns:
+        Nilai truthy dari `kondisi`, atau None bila batas waktu habis.
+    """
+    batas = TIMEOUT[jenis] if timeout is None else timeout
+    try:
+        return WebDriverWait(driver, batas, poll_frequency=INTERVAL_POLLING).until(kondisi)
+    except TimeoutException:
+        if PAKAI_JEDA_CADANGAN:
+            time.sleep(JEDA_CADANGAN[jenis])
+        return None
+
+
+def _js(script, *args):
+    def kondisi(driver):
+        try:
+            return driver.execute_script(script, *args)
+        except StaleElementReferenceException:
+            return False
+    return kondisi
+
+
+def tunggu_ajax_selesai(driver, timeout=None):
+    """Tunggu sampai tidak ada request AJAX jQuery yang masih berjalan."""
+    return bool(tunggu_kondisi(driver, _js(_JS_AJAX_SELESAI), "ajax", timeout))
+
+
+def tunggu_halaman_siap(driver, timeout=None):
+    """
+    Tunggu sampai halaman siap dipakai dan AJAX awal selesai.
+
+    Halaman dianggap siap bila `document.readyState` complete, atau sudah interactive
+    dan jQuery sudah menjalankan handler ready (relevan untuk pageLoadStrategy=eager,
+    saat gambar/font yang diblokir tidak perlu ditunggu).
+    """
+    return bool(tunggu_kondisi(driver, _js(_JS_HALAMAN_SIAP), "halaman", timeout))
+
+
+def tunggu_url_berubah(driver, url_lama, timeout=None, jenis="halaman"):
+    """Tunggu sampai URL halaman berbeda dari `url_lama` (misalnya setelah login)."""
+    return bool(tunggu_kondisi(driver, lambda d: d.current_url != url_lama, jenis, timeout))
+
+
+def tunggu_hasil_select2(driver, timeout=None):
+    """
+    Tunggu sampai daftar hasil Select2 yang sedang terbuka sudah terisi.
+
+    Kondisi terpenuhi bila ada minimal satu `.select2-results__option`, tidak ada
+    opsi "Searching…" (`.loading-results`), dan AJAX jQuery sudah selesai.
+    """
+    return bool(tunggu_kondisi(driver, _js(_JS_HASIL_SELECT2), "select2", timeout))
+
+
+def tunggu_select2_tertutup(driver, timeout=None):
+    """Tunggu sampai dropdown Select2 tertutup (pilihan sudah diterapkan)."""
+    return bool(tunggu_kondisi(driver, _js(_JS_SELECT2_TERTUTUP), "select2", timeout))
+
+
+def tunggu_jendela_baru(driver, jumlah_awal, timeout=None):
+    """
+    Tunggu sampai tab/jendela baru terbuka dan URL-nya sudah bukan about:blank.
+
+    Args:
+        driver: Selenium WebDriver.
+        jumlah_awal (int): jumlah `window_handles` sebelum tab baru dibuka.
+
+    Returns:
+        bool: True bila tab baru sudah aktif (driver sudah berpindah ke tab tersebut).
+    """
+    if not tunggu_kondisi(driver, lambda d: len(d.window_handles) > jumlah_awal, "jendela", timeout):
+        return False
+    driver.switch_to.window(driver.window_handles[-1])
+    return bool(tunggu_kondisi(
+        driver, lambda d: d.current_url not in ("", "about:blank"), "jendela", timeout
+    ))
+
+
+def tunggu_baris_berisi(driver, teks, xpath_link, timeout=None):
+    """
+    Tunggu sampai tabel hasil pencarian memuat baris berisi `teks` dengan link `xpath_link`.
+
+    Dipakai setelah klik "Cari" supaya tombol "Detil" yang diklik adalah milik
+    baris hasil pencarian, bukan baris lama sebelum tabel diperbarui.
+
+    Returns:
+        WebElement link pada baris tersebut, atau None bila batas waktu habis.
+    """
+    xpath = f"//tr[contains(., '{teks}')]{xpath_link}"
+
+    def kondisi(d):
+        links = d.find_elements(By.XPATH, xpath)
+        return links[0] if links else False
+
+    return tunggu_kondisi(driver, kondisi, "tabel", timeout)
+
+
+def tunggu_tabel_selesai(driver, table_id, timeout=None):
+    """Tunggu sampai indikator `<table_id>_processing` DataTables hilang dan AJAX selesai."""
+    return bool(tunggu_kondisi(driver, _js(_JS_TABEL_SELESAI, table_id), "tabel", timeout))
+
+
+def tunggu_tabel_terfilter(driver, table_id, teks, timeout=None):
+    """
+    Tunggu sampai DataTables selesai memfilter berdasarkan `teks`.
+
+    Kondisi terpenuhi bila baris pertama mengandung `teks` atau tabel menampilkan
+    baris kosong (`.dataTables_empty`), dan indikator processing sudah hilang.
+    """
+    def kondisi(d):
+        if not d.execute_script(_JS_TABEL_SELESAI, table_id):
+            return False
+        rows = d.find_elements(By.XPATH, f"//table[@id='{table_id}']//tbody/tr")
+        if not rows:
+            return True
+        try:
+            isi = rows[0].text
+            kosong = rows[0].find_elements(By.CSS_SELECTOR, "td.dataTables_empty")
+        except StaleElementReferenceException:
+            return False
+        return teks in isi or bool(kosong)
+
+    return bool(tunggu_kondisi(driver, kondisi, "tabel", timeout))
+
+
+def tunggu_teks_berubah(driver, by, selector, teks_lama, timeout=None):
+    """Tunggu sampai teks elemen (misalnya info paginasi DataTables) berbeda dari `teks_lama`."""
+    def kondisi(d):
+        elemen = d.find_elements(by, selector)
+        try:
+            return bool(elemen) and elemen[0].text != teks_lama
+        except StaleElementReferenceException:
+            return False
+
+    return bool(tunggu_kondisi(driver, kondisi, "tabel", timeout))
+
+
+def tunggu_alert(driver, timeout=None):
+    """
+    Tunggu alert JavaScript muncul.
+
+    Returns:
+        Objek Alert bila muncul, atau None bila batas waktu habis.
+    """
+    def kondisi(d):
+        try:
+            return d.switch_to.alert
+        except NoAlertPresentException:
+            return False
+
+    return tunggu_kondisi(driver, kondisi, "alert", timeout)
+
+
+def tunggu_hasil_submit(driver, tombol_submit, timeout=None):
+    """
+    Tunggu reaksi halaman setelah tombol submit diklik.
+
+    Reaksi yang dikenali (diperiksa berurutan):
+    - "alert": muncul alert/confirm JavaScript,
+    - "navigasi": tombol submit sudah stale (halaman berpindah/dimuat ulang),
+      lalu ditunggu sampai halaman baru siap,
+    - "error": muncul `.error-block` berisi teks di halaman yang sama.
+
+    Args:
+        driver: Selenium WebDriver.
+        tombol_submit: WebElement tombol yang baru saja diklik.
+
+    Returns:
+        str: "alert", "navigasi", "error", atau None bila tidak ada reaksi sampai batas waktu.
+    """
+    def kondisi(d):
+        try:
+            d.switch_to.alert
+            return "alert"
+        except NoAlertPresentException:
+            pass
+        try:
+            tombol_submit.is_enabled()
+        except StaleElementReferenceException:
+            return "navigasi"
+        except WebDriverException:
+            return False
+        for e in d.find_elements(By.CSS_SELECTOR, ".error-block"):
+            try:
+                if e.text.strip():
+                    return "error"
+            except StaleElementReferenceException:
+                return "navigasi"
+        return False
+
+    hasil = tunggu_kondisi(driver, kondisi, "submit", timeout)
+    if hasil == "navigasi":
+        tunggu_halaman_siap(driver)
+    return hasil
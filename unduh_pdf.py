@@ -0,0 +1,149 @@
+"""
+Pengunduh PDF "Surat TTD" SURADI: koneksi keep-alive ber-pool, streaming ke disk, paralel.
+
+Menggantikan `requests.get(url_pdf, timeout=10)` tanpa sesi/cookie yang membaca seluruh
+isi ke memori. `PengunduhPDF`:
+- memakai satu `requests.Session` ber-pool dengan cookie & user-agent driver SURADI,
+- menulis isi respons per potongan ke `<file>.part` lalu `os.replace` ke nama akhir,
+- memeriksa status HTTP, Content-Type (PDF), tanda tangan `%PDF`, dan Content-Length,
+- menjalankan unduhan di thread pool dengan antrean terbatas, sehingga semua PDF milik
+  satu pegawai bisa terunduh bersamaan sementara browser tetap bekerja,
+- bila diberi `CacheUnduhan`, memakai file lokal yang masih berlaku tanpa jaringan
+  atau lewat request kondisional (ETag / Last-Modified),
+- menjalankan setiap request di bawah `pengendali_host` milik host-nya (konkurensi
+  adaptif bersama, circuit breaker), dan mengulang timeout/5xx dengan backoff.
+"""
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from kirim_http import buat_session_dari_driver, salin_cookie
+from pengendali_host import pengendali, nama_host
+
+FOLDER_UNDUHAN = "hasil_download"
+TIMEOUT_UNDUH = (10, 60)  # (connect, read) detik
+UKURAN_POTONGAN = 64 * 1024
+JUMLAH_THREAD = 4
+BATAS_ANTREAN = 16
+
+_TIPE_DITERIMA = ("application/pdf", "application/octet-stream", "binary/octet-stream")
+
+
+def nama_file_dari_url(url):
+    """Nama file terakhir di path URL (tanpa query string)."""
+    return os.path.basename(urlsplit(url).path)
+
+
+class PengunduhPDF:
+    """
+    Unduh PDF memakai cookie sesi Selenium SURADI.
+
+    `segarkan_cookie` memanggil driver, jadi hanya boleh dipanggil dari thread pemilik
+    driver; unduhan sendiri berjalan di thread pool internal.
+    """
+
+    def __init__(self, driver, folder=FOLDER_UNDUHAN, jumlah_thread=JUMLAH_THREAD,
+                 batas_antrean=BATAS_ANTREAN, cache=None):
+        self.driver = driver
+        self.folder = folder
+        self.cache = cache
+        self.session = buat_session_dari_driver(driver, ukuran_pool=jumlah_thread)
+        self._executor = ThreadPoolExecutor(max_workers=jumlah_thread, thread_name_prefix="unduh")
+        self._slot = threading.BoundedSemaphore(batas_antrean)
+        os.makedirs(folder, exist_ok=True)
+
+    def segarkan_cookie(self):
+        """Salin ulang cookie dari driver SURADI (misalnya setelah login ulang)."""
+        salin_cookie(self.driver, self.session)
+
+    def unduh(self, url, nama_file=None, kunci=None):
+        """
+        Unduh satu PDF secara streaming (atau ambil dari cache bila masih berlaku).
+
+        Args:
+            url (str): URL "Surat TTD".
+            nama_file (str, optional): nama file tujuan; default nama file dari URL.
+            kunci (str, optional): kunci cache, biasanya nomor surat; default URL.
+
+        Returns:
+            str: path file yang tersimpan.
+
+        Raises:
+            requests.RequestException: bila koneksi gagal atau status HTTP bukan 2xx.
+            ValueError: bila respons bukan PDF atau ukurannya tidak sesuai Content-Length.
+        """
+        path = os.path.join(self.folder, nama_file or nama_file_dari_url(url))
+        kunci = kunci or url
+        entri = self.cache.ambil(kunci, url) if self.cache is not None else None
+        if entri is not None and entri["segar"]:
+            return self.cache.pakai(entri)
+        return pengendali(nama_host(url)).coba(self._unduh, url, path, kunci, entri, operasi="unduh")
+
+    def _unduh(self, url, path, kunci, entri):
+        header = {}
+        if entri is not None:
+            if entri["etag"]:
+                header["If-None-Match"] = entri["etag"]
+            if entri["last_modified"]:
+                header["If-Modified-Since"] = entri["last_modified"]
+
+        sementara = f"{path}.part"
+        hash_isi = hashlib.sha256()
+        with self.session.get(url, stream=True, timeout=TIMEOUT_UNDUH, headers=header) as r:
+            if r.status_code == 304 and entri is not None:
+                return self.cache.pakai(entri, diperbarui=True)
+            r.raise_for_status()
+            tipe = r.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            if tipe and tipe not in _TIPE_DITERIMA:
+                raise ValueError(f"respons bukan PDF (Content-Type: {tipe})")
+            panjang = r.headers.get("Content-Length")
+
+            ditulis = 0
+            try:
+                with open(sementara, "wb") as f:
+                    for potongan in r.iter_content(chunk_size=UKURAN_POTONGAN):
+                        if ditulis == 0 and not potongan.startswith(b"%PDF"):
+                            raise ValueError("isi respons tidak diawali tanda tangan %PDF")
+                        f.write(potongan)
+                        hash_isi.update(potongan)
+                        ditulis += len(potongan)
+                if ditulis == 0:
+                    raise ValueError("respons kosong")
+                # Content-Length hanya dibandingkan bila isi tidak dikompresi
+                if panjang and not r.headers.get("Content-Encoding") and ditulis != int(panjang):
+                    raise ValueError(f"ukuran tidak sesuai: {ditulis} dari {panjang} byte")
+            except BaseException:
+                if os.path.exists(sementara):
+                    os.remove(sementara)
+                raise
+            etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+        if self.cache is None:
+            os.replace(sementara, path)
+            return path
+        return self.cache.simpan(kunci, url, sementara, hash_isi.hexdigest(), path, etag, last_modified)
+
+    def antrekan(self, url, nama_file=None, kunci=None):
+        """
+        Jadwalkan unduhan di thread pool.
+
+        Bila antrean sudah berisi `batas_antrean` unduhan yang belum selesai, pemanggil
+        menunggu sampai ada slot kosong.
+
+        Returns:
+            concurrent.futures.Future: hasil `unduh` (path) atau exception-nya.
+        """
+        self._slot.acquire()
+        try:
+            future = self._executor.submit(self.unduh, url, nama_file, kunci)
+        except BaseException:
+            self._slot.release()
+            raise
+        future.add_done_callback(lambda _: self._slot.release())
+        return future
+
+    def tutup(self):
+        self._executor.shutdown(wait=True)
+        self.session.close()
@@ -0,0 +1,86 @@
+"""
+Validasi rencana kerja Tugas1.py secara offline, sebelum baris dikirim ke browser.
+
+Banyak baris baru gagal jauh di dalam alur browser (30–60 detik per baris): jurusan
+yang tidak ada di <select>, Unor yang tidak bisa diurai, No.SPMT tanpa bagian kode,
+file SPMT yang tidak ada, atau tanggal yang tidak bisa dibaca. Semua itu bisa
+diketahui tanpa membuka SIMPEG:
+- format data per baris (NIP, tahun lulus, tanggal hasil `parse_tanggal`),
+- No.SPMT dan file SPMT dari indeks `indeks_spmt`,
+- hasil urai Unor dan jenis jabatan,
+- opsi dropdown dari `katalog_opsi.json` (jurusan, lembaga, SKPD berjenjang, jabatan).
+
+Opsi yang belum ada di katalog (belum pernah diambil, atau TTL habis) tidak membuat
+baris ditolak; hanya opsi yang pasti tidak ada (tidak cocok dengan hasil pencarian
+teksnya atau dengan daftar <select> lengkap) yang ditolak. Daftar Select2 AJAX tanpa
+kata kunci bisa terpotong per halaman, jadi ketiadaan di sana belum berarti tidak ada.
+"""
+
+from indeks_spmt import cari_file_spmt
+
+# Field tanggal rencana → label kolom Excel
+TANGGAL = {
+    "tanggal_ijazah": "Tanggal Ijazah",
+    "tanggal_spmt": "Tanggal SPMT",
+    "tanggal_tmt": "TMT SPMT",
+}
+
+
+def _periksa_opsi(masalah, katalog, field, label, teks, induk=None, persis=False):
+    # Kembalikan id opsi yang cocok (untuk field anak), atau None
+    hasil = katalog.periksa(field, teks, induk, persis)
+    if hasil is False:
+        masalah.append(f"{label} '{teks}' tidak ada di daftar opsi SIMPEG")
+        return None
+    return hasil["id"] if hasil else None
+
+
+def periksa_rencana(rec, indeks_spmt, katalog, field_jabatan):
+    """
+    Periksa satu RencanaPegawai tanpa browser.
+
+    Args:
+        rec (RencanaPegawai): baris rencana kerja.
+        indeks_spmt: hasil `bangun_indeks_spmt`.
+        katalog (KatalogOpsi): katalog opsi dropdown (hanya cache yang dibaca).
+        field_jabatan (dict): jenis jabatan → id field Select2 nama jabatan.
+
+    Returns:
+        list[str]: daftar masalah; kosong bila baris siap dikirim ke browser.
+    """
+    masalah = []
+    if not (rec.nip.isdigit() and len(rec.nip) == 18):
+        masalah.append(f"NIP '{rec.nip}' bukan 18 digit angka")
+    if not (rec.tahun_lulus.isdigit() and len(rec.tahun_lulus) == 4):
+        masalah.append(f"Tahun Lulus '{rec.tahun_lulus}' tidak valid")
+    for field, label in TANGGAL.items():
+        if not getattr(rec, field):
+            masalah.append(f"{label} kosong atau tidak bisa dibaca")
+
+    if not rec.kode_spmt:
+        masalah.append(f"No.SPMT '{rec.no_spmt}' tidak punya bagian kode setelah '/'")
+    elif cari_file_spmt(indeks_spmt, rec.kode_spmt) is None:
+        masalah.append(f"file SPMT untuk kode {rec.kode_spmt} tidak ditemukan")
+
+    if not rec.skpd or not rec.unit_kerja:
+        masalah.append(f"Unor '{rec.unor}' tidak bisa diurai menjadi unit kerja dan SKPD")
+    if rec.jenis_jabatan not in field_jabatan:
+        masalah.append(f"jenis jabatan '{rec.jenis_jabatan}' tidak dikenal")
+
+    # Pencocokan sama dengan jalur browser: jurusan persis, field lain fuzzy
+    if rec.jurusan:
+        _periksa_opsi(masalah, katalog, "jurusan", "Jurusan", rec.jurusan.upper(), persis=True)
+    if rec.lembaga:
+        _periksa_opsi(masalah, katalog, "categories", "Lembaga", rec.lembaga.upper())
+    if rec.jenis_jabatan in field_jabatan:
+        _periksa_opsi(masalah, katalog, "jenis_jabatan", "Jenis jabatan", rec.jenis_jabatan.upper())
+        if rec.jabatan_nama:
+            _periksa_opsi(masalah, katalog, field_jabatan[rec.jenis_jabatan], "Nama jabatan",
+                          rec.jabatan_nama.upper())
+    if rec.skpd:
+        id_skpd = _periksa_opsi(masalah, katalog, "skpd", "SKPD", rec.skpd.upper())
+        if id_skpd and rec.unit_kerja:
+            id_unit = _periksa_opsi(masalah, katalog, "unit_kerja", "Unit kerja", rec.unit_kerja.upper(), id_skpd)
+            if id_unit and rec.sub_unit:
+                _periksa_opsi(masalah, katalog, "sub_unit_kerja", "Sub unit kerja", rec.sub_unit.upper(), id_unit)
+    return masalah